@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Request
 from app.features.Auths import Auth_Schema as schema
 from app.features.Auths.Auth_Service import AuthService
 from app.features.Auths.Auth_Dependencies import get_auth_service
+from app.shared.responses import FastJSONResponse
 
 router = APIRouter(prefix="/auth", tags=["Auths"])
 
@@ -17,7 +18,7 @@ router = APIRouter(prefix="/auth", tags=["Auths"])
 # -------------------------------------------------------------------------
 @router.post("/register", response_model=schema.TokenSchema, summary="Register new user")
 async def register(data: schema.RegisterSchema, service: AuthService = Depends(get_auth_service)):
-    return await service.register(data)
+    return FastJSONResponse(await service.register(data))
 
 # -------------------------------------------------------------------------
 # Authenticate a user and return JWT tokens.
@@ -32,7 +33,7 @@ async def register(data: schema.RegisterSchema, service: AuthService = Depends(g
 # -------------------------------------------------------------------------
 @router.post("/login", response_model=schema.TokenSchema, summary="Login user")
 async def login(data: schema.LoginSchema, service: AuthService = Depends(get_auth_service)):
-    return await service.login(data)
+    return FastJSONResponse(await service.login(data))
 
 # -------------------------------------------------------------------------
 # Change the password for the currently authenticated user.
@@ -42,15 +43,17 @@ async def login(data: schema.LoginSchema, service: AuthService = Depends(get_aut
 # - **oldPassword**: The user's current password.
 # - **newPassword**: The new desired password.
 # - **confirmPassword**: Must match the new password.
+#
+# Returns the user's public profile.
 # -------------------------------------------------------------------------
-@router.post("/change-password", summary="Change password")
+@router.post("/change-password", response_model=schema.UserResponseSchema, summary="Change password")
 async def change_password(
     data: schema.ChangePasswordSchema, 
     request: Request,
     service: AuthService = Depends(get_auth_service)
 ):
     user_id = request.state.user.get("sub")
-    return await service.change_password(user_id, data)
+    return FastJSONResponse(await service.change_password(user_id, data))
 
 # -------------------------------------------------------------------------
 # Obtain a new access token using a valid refresh token.
@@ -61,4 +64,4 @@ async def change_password(
 # -------------------------------------------------------------------------
 @router.post("/refresh", response_model=schema.TokenSchema, summary="Refresh access token")
 async def refresh(refresh_token: str, service: AuthService = Depends(get_auth_service)):
-    return await service.refresh_token(refresh_token)
\ No newline at end of file
+    return FastJSONResponse(await service.refresh_token(refresh_token))
\ No newline at end of file
@@ -1,6 +1,6 @@
 from app.features.Auths.Auth_Repository import AuthRepository
 from app.features.Auths import Auth_Schema as schema
-from app.shared.utils.security import hash_password, verify_password
+from app.shared.utils.security import hash_password_async, verify_password_async
 from app.shared.utils.jwt_utils import create_access_token, create_refresh_token, verify_refresh_token
 from app.shared.exceptions import UnauthorizedException, DuplicatedEntityException, ValidationException
 
@@ -26,13 +26,13 @@ class AuthService:
     #     data (schema.RegisterSchema): The registration data provided by the user.
     #
     # Returns:
-    #     dict: Contains 'accessToken', 'refreshToken', and the created 'user' object.
+    #     schema.TokenSchema: Contains 'accessToken', 'refreshToken', and the created 'user' object.
     #
     # Raises:
     #     ValidationException: If passwords do not match.
     #     DuplicatedEntityException: If the email already exists.
     # -------------------------------------------------------------------------
-    async def register(self, data: schema.RegisterSchema):
+    async def register(self, data: schema.RegisterSchema) -> schema.TokenSchema:
         if data.password != data.confirmPassword:
             raise ValidationException("Passwords do not match")
 
@@ -44,7 +44,7 @@ class AuthService:
         user_data = {
             "fullName": data.fullName,
             "email": data.email,
-            "password": hash_password(data.password)
+            "password": await hash_password_async(data.password)
         }
         
         user = await self.repo.create_user(user_data)
@@ -53,11 +53,11 @@ class AuthService:
         access_token = create_access_token(data={"sub": user.id})
         refresh_token = create_refresh_token(data={"sub": user.id})
         
-        return {
+        return schema.TokenSchema.model_validate({
             "accessToken": access_token,
             "refreshToken": refresh_token,
             "user": user
-        }
+        })
 
     # -------------------------------------------------------------------------
     # Authenticate a user and generate tokens.
@@ -70,25 +70,25 @@ class AuthService:
     #     data (schema.LoginSchema): The login credentials (email and password).
     #
     # Returns:
-    #     dict: Contains 'accessToken', 'refreshToken', and the 'user' object.
+    #     schema.TokenSchema: Contains 'accessToken', 'refreshToken', and the 'user' object.
     #
     # Raises:
     #     UnauthorizedException: If email is not found or password is incorrect.
     # -------------------------------------------------------------------------
-    async def login(self, data: schema.LoginSchema):
+    async def login(self, data: schema.LoginSchema) -> schema.TokenSchema:
         user = await self.repo.get_by_email(data.email)
-        if not user or not verify_password(data.password, user.password):
+        if not user or not await verify_password_async(data.password, user.password):
             raise UnauthorizedException("Incorrect email or password")
 
         # Generate tokens
         access_token = create_access_token(data={"sub": user.id})
         refresh_token = create_refresh_token(data={"sub": user.id})
         
-        return {
+        return schema.TokenSchema.model_validate({
             "accessToken": access_token,
             "refreshToken": refresh_token,
             "user": user
-        }
+        })
 
     # -------------------------------------------------------------------------
     # Change the password for an authenticated user.
@@ -102,22 +102,23 @@ class AuthService:
     #     data (schema.ChangePasswordSchema): The password change request data.
     #
     # Returns:
-    #     User: The updated user object.
+    #     schema.UserResponseSchema: The updated user's public profile.
     #
     # Raises:
     #     ValidationException: If new passwords do not match.
     #     UnauthorizedException: If the old password is incorrect.
     # -------------------------------------------------------------------------
-    async def change_password(self, user_id: str, data: schema.ChangePasswordSchema):
+    async def change_password(self, user_id: str, data: schema.ChangePasswordSchema) -> schema.UserResponseSchema:
         if data.newPassword != data.confirmPassword:
             raise ValidationException("New passwords do not match")
 
         user = await self.repo.get_by_id(user_id)
-        if not user or not verify_password(data.oldPassword, user.password):
+        if not user or not await verify_password_async(data.oldPassword, user.password):
             raise UnauthorizedException("Incorrect old password")
 
-        hashed_password = hash_password(data.newPassword)
-        return await self.repo.update_password(user_id, hashed_password)
+        hashed_password = await hash_password_async(data.newPassword)
+        updated_user = await self.repo.update_password(user_id, hashed_password)
+        return schema.UserResponseSchema.model_validate(updated_user)
 
     # -------------------------------------------------------------------------
     # Refresh access token using a valid refresh token.
@@ -131,12 +132,12 @@ class AuthService:
     #     refresh_token (str): The refresh token string.
     #
     # Returns:
-    #     dict: Contains 'accessToken', 'refreshToken', and the 'user' object.
+    #     schema.TokenSchema: Contains 'accessToken', 'refreshToken', and the 'user' object.
     #
     # Raises:
     #     UnauthorizedException: If the token is invalid, expired, or the user is not found.
     # -------------------------------------------------------------------------
-    async def refresh_token(self, refresh_token: str):
+    async def refresh_token(self, refresh_token: str) -> schema.TokenSchema:
         # 1. Verify refresh token
         payload = verify_refresh_token(refresh_token)
         user_id = payload.get("sub")
@@ -150,8 +151,8 @@ class AuthService:
         access_token = create_access_token(data={"sub": user.id})
         new_refresh_token = create_refresh_token(data={"sub": user.id})
         
-        return {
+        return schema.TokenSchema.model_validate({
             "accessToken": access_token,
             "refreshToken": new_refresh_token,
             "user": user
-        }
\ No newline at end of file
+        })
\ No newline at end of file
@@ -0,0 +1,153 @@
+import os
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+import numpy as np
+from app.shared.cache import TTLCache
+
+REPORT_ANALYTICS_CACHE_TTL_SECONDS = float(os.getenv("REPORT_ANALYTICS_CACHE_TTL_SECONDS", "3600"))
+REPORT_ANALYTICS_HISTOGRAM_BINS = int(os.getenv("REPORT_ANALYTICS_HISTOGRAM_BINS", "10"))
+# Distinct (since, until) windows kept per category.
+REPORT_ANALYTICS_WINDOWS_PER_CATEGORY = int(os.getenv("REPORT_ANALYTICS_WINDOWS_PER_CATEGORY", "32"))
+
+SCORE_METRICS = ("overallScore", "technicalScore", "softSkillScore")
+PERCENTILES = (10, 25, 50, 75, 90, 95, 99)
+
+# Scores are on a 0-10 scale; histograms use fixed edges so windows and
+# categories are comparable.
+SCORE_RANGE = (0.0, 10.0)
+
+# Column snapshot and computed distributions per category id. A report write
+# drops its category (in every worker with CACHE_INVALIDATION_REDIS_URL set),
+# so entries only expire on their own as a safety net.
+analytics_cache = TTLCache("report-analytics", ttl=REPORT_ANALYTICS_CACHE_TTL_SECONDS, max_size=512)
+
+# Naive datetimes are taken as UTC, like the timestamps Prisma stores.
+def _epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+class ScoreColumns:
+    # -------------------------------------------------------------------------
+    # Columnar snapshot of the reports of one category.
+    #
+    # Built from one row of Postgres arrays (see `get_score_columns`), so each
+    # column becomes a NumPy array without a per-report Python loop.
+    # `timestamps` (epoch seconds) is sorted ascending, which makes a time
+    # window a slice found with `searchsorted`.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, data: dict):
+        self.timestamps = np.asarray(data.get("ts") or [], dtype=np.float64)
+        self.scores: Dict[str, np.ndarray] = {
+            metric: np.asarray(data.get(metric) or [], dtype=np.float64) for metric in SCORE_METRICS
+        }
+
+    def window(self, since: Optional[datetime], until: Optional[datetime]) -> slice:
+        start = 0 if since is None else int(np.searchsorted(self.timestamps, _epoch(since), side="left"))
+        stop = len(self.timestamps) if until is None else int(np.searchsorted(self.timestamps, _epoch(until), side="right"))
+        return slice(start, max(start, stop))
+
+
+class ScoreDistribution:
+    # -------------------------------------------------------------------------
+    # Sorted score arrays of one (category, window), plus their summary.
+    #
+    # Sorting once lets every percentile-rank lookup run in O(log n) with two
+    # `searchsorted` calls.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, columns: ScoreColumns, window: slice):
+        self.sorted: Dict[str, np.ndarray] = {
+            metric: np.sort(columns.scores[metric][window]) for metric in SCORE_METRICS
+        }
+        self.count = len(columns.timestamps[window])
+        self.summary = {metric: self._summarize(values) for metric, values in self.sorted.items()}
+
+    @staticmethod
+    def _summarize(values: np.ndarray) -> dict:
+        counts, edges = np.histogram(values, bins=REPORT_ANALYTICS_HISTOGRAM_BINS, range=SCORE_RANGE)
+        if not len(values):
+            return {"mean": None, "std": None, "min": None, "max": None, "percentiles": {}, "histogram": {"edges": edges.tolist(), "counts": counts.tolist()}}
+        points = np.percentile(values, PERCENTILES)
+        return {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "min": float(values[0]),
+            "max": float(values[-1]),
+            "percentiles": {f"p{p}": float(v) for p, v in zip(PERCENTILES, points)},
+            "histogram": {"edges": edges.tolist(), "counts": counts.tolist()}
+        }
+
+    # -------------------------------------------------------------------------
+    # Percentile rank of a score: share of reports scoring below it, ties
+    # counting half, in percent.
+    # -------------------------------------------------------------------------
+    def percentile_rank(self, metric: str, score: float) -> Optional[float]:
+        values = self.sorted[metric]
+        if not len(values):
+            return None
+        below = np.searchsorted(values, score, side="left")
+        at_or_below = np.searchsorted(values, score, side="right")
+        return float((below + at_or_below) / 2 / len(values) * 100)
+
+
+class CategoryAnalytics:
+    # -------------------------------------------------------------------------
+    # Cached analytics of one category: its columns and the distributions of
+    # the most recently requested windows.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, columns: ScoreColumns):
+        self.columns = columns
+        self.distributions: "OrderedDict[tuple, ScoreDistribution]" = OrderedDict()
+
+    def distribution(self, since: Optional[datetime], until: Optional[datetime]) -> ScoreDistribution:
+        key = (since, until)
+        distribution = self.distributions.get(key)
+        if distribution is None:
+            distribution = ScoreDistribution(self.columns, self.columns.window(since, until))
+            self.distributions[key] = distribution
+            if len(self.distributions) > REPORT_ANALYTICS_WINDOWS_PER_CATEGORY:
+                self.distributions.popitem(last=False)
+        else:
+            self.distributions.move_to_end(key)
+        return distribution
+
+
+class ReportAnalytics:
+    # -------------------------------------------------------------------------
+    # Score distributions and percentile ranks over EvaluationReport.
+    #
+    # A category's reports are loaded once as columns (one raw query) and all
+    # statistics are computed with vectorized NumPy operations. Both the
+    # columns and the per-window distributions are cached in
+    # `analytics_cache` until the next report of that category is written.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, loader: Callable[[str], Awaitable[dict]]):
+        self.loader = loader
+
+    async def _category(self, category_id: str) -> CategoryAnalytics:
+        category = analytics_cache.get(category_id)
+        if category is None:
+            version = analytics_cache.version(category_id)
+            category = CategoryAnalytics(ScoreColumns(await self.loader(category_id)))
+            analytics_cache.set(category_id, category, version)
+        return category
+
+    # -------------------------------------------------------------------------
+    # Distribution of the reports of a category created within a window.
+    #
+    # Args:
+    #     category_id (str): The UUID of the category.
+    #     since (Optional[datetime]): Window start (inclusive), None for open.
+    #     until (Optional[datetime]): Window end (inclusive), None for open.
+    #
+    # Returns:
+    #     ScoreDistribution: Sorted scores and summary statistics.
+    # -------------------------------------------------------------------------
+    async def distribution(self, category_id: str, since: Optional[datetime] = None, until: Optional[datetime] = None) -> ScoreDistribution:
+        category = await self._category(category_id)
+        return category.distribution(since, until)
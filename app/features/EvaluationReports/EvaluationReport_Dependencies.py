@@ -0,0 +1,11 @@
+from fastapi import Depends
+from app.features.EvaluationReports.EvaluationReport_Reponsitory import EvaluationReportRepository
+from app.features.EvaluationReports.EvaluationReport_Service import EvaluationReportService
+from app.features.EvaluationReports.EvaluationReport_Jobs import report_queue
+from app.features.EvaluationReports.EvaluationReport_Analytics import ReportAnalytics
+
+def get_evaluation_report_repository() -> EvaluationReportRepository:
+    return EvaluationReportRepository()
+
+def get_evaluation_report_service(repo: EvaluationReportRepository = Depends(get_evaluation_report_repository)) -> EvaluationReportService:
+    return EvaluationReportService(repo, report_queue, ReportAnalytics(repo.get_score_columns))
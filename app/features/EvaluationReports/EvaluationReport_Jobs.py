@@ -0,0 +1,72 @@
+import logging
+import os
+from app.features.EvaluationReports.EvaluationReport_Reponsitory import EvaluationReportRepository
+from app.features.EvaluationReports.EvaluationReport_Scorer import load_scorer
+from app.features.Transcripts.Transcript_Buffer import transcript_buffer
+from app.features.QuestionResponses.QuestionResponse_Reponsitory import QuestionResponseRepository
+from app.features.QuestionResponses.QuestionResponse_Grader import response_grader
+from app.features.QuestionResponses.QuestionResponse_Service import grade_session_responses
+from app.shared.job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+EVALUATION_WORKERS = int(os.getenv("EVALUATION_WORKERS", "2"))
+EVALUATION_MAX_ATTEMPTS = int(os.getenv("EVALUATION_MAX_ATTEMPTS", "5"))
+EVALUATION_RETRY_BACKOFF_SECONDS = float(os.getenv("EVALUATION_RETRY_BACKOFF_SECONDS", "2"))
+# Sessions read per query when re-enqueuing reports at startup.
+EVALUATION_RECOVERY_PAGE = int(os.getenv("EVALUATION_RECOVERY_PAGE", "1000"))
+
+_repo = EvaluationReportRepository()
+_response_repo = QuestionResponseRepository()
+_scorer = load_scorer()
+
+# -------------------------------------------------------------------------
+# Generate and store the EvaluationReport of a completed session.
+#
+# Pending transcript lines are flushed and the session's answers are
+# re-graded in one batch first, so the scorer sees the whole conversation
+# and current scores. Sessions that are gone or no longer COMPLETED are
+# skipped. Any exception makes the queue retry the job with backoff.
+#
+# Args:
+#     session_id (str): The UUID of the session (also the job id).
+# -------------------------------------------------------------------------
+async def generate_report(session_id: str):
+    await transcript_buffer.flush()
+    session = await _repo.get_session(session_id)
+    if not session or session.status != "COMPLETED":
+        logger.info("Skipping report for session %s: not completed", session_id)
+        return
+
+    await grade_session_responses(_response_repo, response_grader, session.categoryId, session_id)
+    session = await _repo.get_session_bundle(session_id)
+    scores = await _scorer.score(session)
+    await _repo.upsert(session_id, session.categoryId, scores)
+
+# -------------------------------------------------------------------------
+# Re-enqueue completed sessions that have no report yet (e.g. jobs lost in
+# a restart). Called from the application lifespan.
+# -------------------------------------------------------------------------
+async def recover_pending_reports():
+    count = 0
+    after = None
+    while True:
+        sessions = await _repo.get_completed_without_report(after, EVALUATION_RECOVERY_PAGE)
+        if not sessions:
+            break
+        for session in sessions:
+            report_queue.enqueue(session.id)
+        count += len(sessions)
+        after = sessions[-1].id
+    if count:
+        logger.info("Re-enqueued %d evaluation report jobs", count)
+
+
+# Process-wide queue; started and stopped by the lifespan in app/main.py.
+report_queue = JobQueue(
+    "evaluation-reports",
+    generate_report,
+    concurrency=EVALUATION_WORKERS,
+    max_attempts=EVALUATION_MAX_ATTEMPTS,
+    backoff_base=EVALUATION_RETRY_BACKOFF_SECONDS
+)
@@ -0,0 +1,145 @@
+from typing import List, Optional
+from prisma.models import EvaluationReport, InterviewSession, Transcript, User
+from app.shared.database import db
+from app.shared.cache import cache_invalidation
+from app.features.EvaluationReports.EvaluationReport_Analytics import analytics_cache
+from app.features.Transcripts.Transcript_Archive import archive_rows
+
+# One row whose columns are arrays aligned on report creation time, so the
+# analytics layer can turn each into a NumPy array in one call.
+SCORE_COLUMNS_SQL = """
+SELECT array_agg(EXTRACT(EPOCH FROM r."createdAt")::float8 ORDER BY r."createdAt", r.id) AS ts,
+       array_agg(r."overallScore" ORDER BY r."createdAt", r.id) AS "overallScore",
+       array_agg(r."technicalScore" ORDER BY r."createdAt", r.id) AS "technicalScore",
+       array_agg(r."softSkillScore" ORDER BY r."createdAt", r.id) AS "softSkillScore"
+FROM "EvaluationReport" r
+JOIN "InterviewSession" s ON s.id = r."sessionId"
+WHERE s."categoryId" = $1
+"""
+
+class EvaluationReportRepository:
+    # -------------------------------------------------------------------------
+    # Repository for handling Evaluation Report-related database operations.
+    # -------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------
+    # Retrieve the report of a session.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     Optional[EvaluationReport]: The report, or None if not generated yet.
+    # -------------------------------------------------------------------------
+    async def get_by_session_id(self, session_id: str) -> Optional[EvaluationReport]:
+        return await db.evaluationreport.find_unique(where={"sessionId": session_id})
+
+    # -------------------------------------------------------------------------
+    # Create or replace the report of a session.
+    #
+    # Keyed on the unique `sessionId`, so running the same job twice leaves a
+    # single report. Drops the session's category from the score analytics
+    # cache (in every worker with CACHE_INVALIDATION_REDIS_URL set).
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     category_id (str): The UUID of the session's category.
+    #     data (dict): Score, feedback and recommendation fields.
+    #
+    # Returns:
+    #     EvaluationReport: The stored report.
+    # -------------------------------------------------------------------------
+    async def upsert(self, session_id: str, category_id: str, data: dict) -> EvaluationReport:
+        report = await db.evaluationreport.upsert(
+            where={"sessionId": session_id},
+            data={
+                "create": {"sessionId": session_id, **data},
+                "update": data
+            }
+        )
+        await cache_invalidation.invalidate(analytics_cache.name, category_id)
+        return report
+
+    # -------------------------------------------------------------------------
+    # Load the report scores of a category as columns.
+    #
+    # Args:
+    #     category_id (str): The UUID of the category.
+    #
+    # Returns:
+    #     dict: `ts` (epoch seconds) and one list per score, ordered by
+    #     report creation time; lists are None when there are no reports.
+    # -------------------------------------------------------------------------
+    async def get_score_columns(self, category_id: str) -> dict:
+        rows = await db.query_raw(SCORE_COLUMNS_SQL, category_id)
+        return rows[0] if rows else {}
+
+    # -------------------------------------------------------------------------
+    # Retrieve a session (without relations).
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     Optional[InterviewSession]: The session object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_session(self, session_id: str) -> Optional[InterviewSession]:
+        return await db.interviewsession.find_unique(where={"id": session_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve a user by ID (used for role checks).
+    #
+    # Args:
+    #     user_id (str): The UUID of the user.
+    #
+    # Returns:
+    #     Optional[User]: The user object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_user(self, user_id: str) -> Optional[User]:
+        return await db.user.find_unique(where={"id": user_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve a session with everything the scorer needs: transcripts in
+    # chronological order (archived lines included), question responses and
+    # technical artifacts.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     Optional[InterviewSession]: The session with relations, or None.
+    # -------------------------------------------------------------------------
+    async def get_session_bundle(self, session_id: str) -> Optional[InterviewSession]:
+        session = await db.interviewsession.find_unique(
+            where={"id": session_id},
+            include={
+                "transcripts": {"order_by": [{"createdAt": "asc"}, {"id": "asc"}]},
+                "transcriptArchive": True,
+                "responses": True,
+                "artifacts": {"include": {"blob": True}}
+            }
+        )
+        # Lines of a compacted transcript come first; any hot rows are newer.
+        if session and session.transcriptArchive:
+            archived = [Transcript.model_validate(row) for row in archive_rows(session.transcriptArchive)]
+            session.transcripts = archived + (session.transcripts or [])
+        return session
+
+    # -------------------------------------------------------------------------
+    # Retrieve a page of completed sessions that have no report yet, by
+    # ascending ID.
+    #
+    # Used at startup to re-enqueue jobs lost with a previous process.
+    #
+    # Args:
+    #     after (Optional[str]): ID of the last session of the previous page.
+    #     take (int): Maximum number of sessions to return.
+    #
+    # Returns:
+    #     List[InterviewSession]: Sessions awaiting a report.
+    # -------------------------------------------------------------------------
+    async def get_completed_without_report(self, after: Optional[str] = None, take: int = 1000) -> List[InterviewSession]:
+        where = {"status": "COMPLETED", "report": {"is": None}}
+        if after:
+            where["id"] = {"gt": after}
+        return await db.interviewsession.find_many(where=where, order={"id": "asc"}, take=take)
@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, Request
+from datetime import datetime
+from typing import Optional
+from app.features.EvaluationReports.EvaluationReport_Schema import EvaluationReportResponse, EvaluationJobResponse, EvaluationQueueStats, CategoryScoreAnalytics, CandidatePercentileRanks
+from app.features.EvaluationReports.EvaluationReport_Service import EvaluationReportService
+from app.features.EvaluationReports.EvaluationReport_Dependencies import get_evaluation_report_service
+from app.shared.responses import FastJSONResponse
+
+router = APIRouter(prefix="/evaluation-reports", tags=["Evaluation Reports"])
+
+# -------------------------------------------------------------------------
+# Get the depth and job counts of the report generation queue.
+#
+# Admins only.
+# -------------------------------------------------------------------------
+@router.get("/jobs/stats", response_model=EvaluationQueueStats, summary="Report queue stats")
+async def get_queue_stats(
+    request: Request,
+    service: EvaluationReportService = Depends(get_evaluation_report_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_queue_stats(user_id))
+
+# -------------------------------------------------------------------------
+# Poll the report generation job of a session.
+#
+# A job is queued automatically when the session is marked COMPLETED.
+# -------------------------------------------------------------------------
+@router.get("/jobs/{session_id}", response_model=EvaluationJobResponse, summary="Get report job status")
+async def get_job_status(
+    session_id: str,
+    request: Request,
+    service: EvaluationReportService = Depends(get_evaluation_report_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_job_status(session_id, user_id))
+
+# -------------------------------------------------------------------------
+# Queue report generation for a completed session, e.g. after a FAILED job.
+# -------------------------------------------------------------------------
+@router.post("/jobs/{session_id}", response_model=EvaluationJobResponse, status_code=202, summary="Queue report job")
+async def enqueue_report(
+    session_id: str,
+    request: Request,
+    service: EvaluationReportService = Depends(get_evaluation_report_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.enqueue_report(session_id, user_id), status_code=202)
+
+# -------------------------------------------------------------------------
+# Get the evaluation report of a session.
+#
+# Only returns if the session belongs to the current user.
+# -------------------------------------------------------------------------
+@router.get("/session/{session_id}", response_model=EvaluationReportResponse, summary="Get session report")
+async def get_report(
+    session_id: str,
+    request: Request,
+    service: EvaluationReportService = Depends(get_evaluation_report_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_report(session_id, user_id))
+
+# -------------------------------------------------------------------------
+# Score distributions of a category's reports. Interviewers and admins only.
+#
+# - **since** / **until**: Optional window on report creation time.
+#
+# Returns count, mean, standard deviation, percentiles (p10-p99) and a
+# 0-10 histogram for the overall, technical and soft-skill scores.
+# -------------------------------------------------------------------------
+@router.get("/analytics/categories/{category_id}", response_model=CategoryScoreAnalytics, summary="Category score analytics")
+async def get_category_analytics(
+    category_id: str,
+    request: Request,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    service: EvaluationReportService = Depends(get_evaluation_report_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_category_analytics(category_id, user_id, since, until))
+
+# -------------------------------------------------------------------------
+# How a session's scores compare with the rest of its category.
+#
+# - **since** / **until**: Optional window of reports to compare against.
+#
+# Percentile ranks are in percent; ties count half.
+# -------------------------------------------------------------------------
+@router.get("/analytics/session/{session_id}", response_model=CandidatePercentileRanks, summary="Candidate percentile ranks")
+async def get_candidate_ranks(
+    session_id: str,
+    request: Request,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    service: EvaluationReportService = Depends(get_evaluation_report_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_candidate_ranks(session_id, user_id, since, until))
@@ -0,0 +1,64 @@
+from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+from datetime import datetime
+
+class EvaluationReportResponse(BaseModel):
+    id: str
+    sessionId: str
+    overallScore: float
+    technicalScore: float
+    softSkillScore: float
+    aiFeedback: str
+    recommendation: str
+    createdAt: datetime
+
+    class Config:
+        from_attributes = True
+
+class EvaluationJobResponse(BaseModel):
+    # The job id is the session id.
+    id: str
+    status: Literal["PENDING", "RUNNING", "SUCCEEDED", "FAILED"]
+    attempts: int
+    error: Optional[str] = None
+    enqueuedAt: Optional[datetime] = None
+    startedAt: Optional[datetime] = None
+    finishedAt: Optional[datetime] = None
+
+class EvaluationQueueStats(BaseModel):
+    queueDepth: int
+    concurrency: int
+    pending: int
+    running: int
+    succeeded: int
+    failed: int
+
+class ScoreHistogram(BaseModel):
+    edges: List[float]
+    counts: List[int]
+
+class ScoreSummary(BaseModel):
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: Dict[str, float]
+    histogram: ScoreHistogram
+
+class CategoryScoreAnalytics(BaseModel):
+    categoryId: str
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    count: int
+    # Keyed by overallScore, technicalScore and softSkillScore.
+    metrics: Dict[str, ScoreSummary]
+
+class CandidatePercentileRanks(BaseModel):
+    sessionId: str
+    categoryId: str
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    # Number of reports the candidate is compared against.
+    count: int
+    scores: Dict[str, float]
+    percentileRanks: Dict[str, Optional[float]]
@@ -0,0 +1,81 @@
+import importlib
+import os
+from abc import ABC, abstractmethod
+from prisma.models import InterviewSession
+
+# "package.module:ClassName" of the scorer to use; the heuristic stub when unset.
+EVALUATION_SCORER = os.getenv("EVALUATION_SCORER", "")
+
+# Answers around this many words count as complete.
+TARGET_ANSWER_WORDS = 50
+
+class ReportScorer(ABC):
+    # -------------------------------------------------------------------------
+    # Interface of report scorers.
+    #
+    # `score` receives the session with `transcripts`, `responses` and
+    # `artifacts` loaded and returns the EvaluationReport fields:
+    # overallScore, technicalScore, softSkillScore (0-10), aiFeedback and
+    # recommendation.
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    async def score(self, session: InterviewSession) -> dict:
+        ...
+
+
+class HeuristicScorer(ReportScorer):
+    # -------------------------------------------------------------------------
+    # Local stand-in for the LLM scorer.
+    #
+    # - technical: mean of the graded question responses.
+    # - soft skills: share of bot turns the candidate answered and how close
+    #   answers come to TARGET_ANSWER_WORDS.
+    # -------------------------------------------------------------------------
+
+    async def score(self, session: InterviewSession) -> dict:
+        responses = session.responses or []
+        transcripts = session.transcripts or []
+        artifacts = session.artifacts or []
+
+        technical = sum(r.score for r in responses) / len(responses) if responses else 0.0
+
+        user_lines = [t.content for t in transcripts if t.role == "USER"]
+        bot_turns = sum(1 for t in transcripts if t.role == "BOT")
+        answered = min(len(user_lines) / bot_turns, 1.0) if bot_turns else (1.0 if user_lines else 0.0)
+        avg_words = sum(len(line.split()) for line in user_lines) / len(user_lines) if user_lines else 0.0
+        soft = 10 * (0.5 * answered + 0.5 * min(avg_words / TARGET_ANSWER_WORDS, 1.0))
+
+        overall = 0.7 * technical + 0.3 * soft
+        if overall >= 7:
+            recommendation = "HIRE"
+        elif overall >= 5:
+            recommendation = "CONSIDER"
+        else:
+            recommendation = "REJECT"
+
+        feedback = (
+            f"Answered {len(responses)} graded question(s) with an average score of {technical:.1f}/10. "
+            f"Responded to {answered:.0%} of the interviewer's turns, {avg_words:.0f} words per answer on average. "
+            f"Submitted {len(artifacts)} code artifact(s)."
+        )
+        return {
+            "overallScore": round(overall, 2),
+            "technicalScore": round(technical, 2),
+            "softSkillScore": round(soft, 2),
+            "aiFeedback": feedback,
+            "recommendation": recommendation
+        }
+
+
+# -------------------------------------------------------------------------
+# Instantiate the scorer configured by EVALUATION_SCORER.
+#
+# Returns:
+#     ReportScorer: The configured scorer, or HeuristicScorer by default.
+# -------------------------------------------------------------------------
+def load_scorer() -> ReportScorer:
+    if not EVALUATION_SCORER:
+        return HeuristicScorer()
+    module_name, _, class_name = EVALUATION_SCORER.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
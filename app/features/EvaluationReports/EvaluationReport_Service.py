@@ -0,0 +1,165 @@
+from datetime import datetime
+from typing import Optional
+from app.features.EvaluationReports.EvaluationReport_Reponsitory import EvaluationReportRepository
+from app.features.EvaluationReports.EvaluationReport_Analytics import ReportAnalytics, SCORE_METRICS
+from app.features.EvaluationReports.EvaluationReport_Schema import EvaluationReportResponse, EvaluationJobResponse, EvaluationQueueStats, CategoryScoreAnalytics, CandidatePercentileRanks
+from app.shared.exceptions import ForbiddenException, NotFoundException, ValidationException
+from app.shared.job_queue import JobQueue, SUCCEEDED
+
+# Besides the candidate, these roles may read reports.
+REPORT_VIEWER_ROLES = {"INTERVIEWER", "ADMIN"}
+# Roles allowed to read the report queue counters.
+REPORT_QUEUE_STATS_ROLES = {"ADMIN"}
+
+class EvaluationReportService:
+    # -------------------------------------------------------------------------
+    # Service class responsible for business logic related to Evaluation Reports.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, repo: EvaluationReportRepository, queue: JobQueue, analytics: ReportAnalytics):
+        self.repo = repo
+        self.queue = queue
+        self.analytics = analytics
+
+    # -------------------------------------------------------------------------
+    # Ensure the session exists and belongs to the given user.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
+    # -------------------------------------------------------------------------
+    async def _get_owned_session(self, session_id: str, user_id: str):
+        session = await self.repo.get_session(session_id)
+        if not session or session.userId != user_id:
+            raise NotFoundException("Interview Session not found")
+        return session
+
+    # -------------------------------------------------------------------------
+    # Ensure the session exists and the user may read its report: the
+    # candidate who owns it, interviewers and admins.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or the user may not view it.
+    # -------------------------------------------------------------------------
+    async def _get_viewable_session(self, session_id: str, user_id: str):
+        session = await self.repo.get_session(session_id)
+        if not session:
+            raise NotFoundException("Interview Session not found")
+        if session.userId != user_id:
+            user = await self.repo.get_user(user_id)
+            if not user or user.role not in REPORT_VIEWER_ROLES:
+                raise NotFoundException("Interview Session not found")
+        return session
+
+    # -------------------------------------------------------------------------
+    # Retrieve the report of a session.
+    #
+    # Raises:
+    #     NotFoundException: If the session or its report does not exist.
+    # -------------------------------------------------------------------------
+    async def get_report(self, session_id: str, user_id: str) -> EvaluationReportResponse:
+        await self._get_viewable_session(session_id, user_id)
+        report = await self.repo.get_by_session_id(session_id)
+        if not report:
+            raise NotFoundException("Evaluation Report not found")
+        return EvaluationReportResponse.model_validate(report)
+
+    # -------------------------------------------------------------------------
+    # Poll the report job of a session.
+    #
+    # Jobs are tracked in the process that runs them; when this process has
+    # no record but the report exists, the job is reported as SUCCEEDED.
+    #
+    # Raises:
+    #     NotFoundException: If the session or the job does not exist.
+    # -------------------------------------------------------------------------
+    async def get_job_status(self, session_id: str, user_id: str) -> EvaluationJobResponse:
+        await self._get_owned_session(session_id, user_id)
+        job = self.queue.get(session_id)
+        if job is not None:
+            return EvaluationJobResponse(**job.to_dict())
+
+        report = await self.repo.get_by_session_id(session_id)
+        if not report:
+            raise NotFoundException("Evaluation job not found")
+        return EvaluationJobResponse(id=session_id, status=SUCCEEDED, attempts=1, finishedAt=report.createdAt)
+
+    # -------------------------------------------------------------------------
+    # (Re)queue the report job of a completed session.
+    #
+    # Idempotent: returns the existing job unless it has FAILED.
+    #
+    # Raises:
+    #     NotFoundException: If the session does not exist.
+    #     ValidationException: If the session is not COMPLETED.
+    # -------------------------------------------------------------------------
+    async def enqueue_report(self, session_id: str, user_id: str) -> EvaluationJobResponse:
+        session = await self._get_owned_session(session_id, user_id)
+        if session.status != "COMPLETED":
+            raise ValidationException("Interview Session is not completed")
+        return EvaluationJobResponse(**self.queue.enqueue(session_id).to_dict())
+
+    # -------------------------------------------------------------------------
+    # Depth and job counts of this worker's report queue.
+    #
+    # Raises:
+    #     ForbiddenException: If the user is not an admin.
+    # -------------------------------------------------------------------------
+    async def get_queue_stats(self, user_id: str) -> EvaluationQueueStats:
+        user = await self.repo.get_user(user_id)
+        if not user or user.role not in REPORT_QUEUE_STATS_ROLES:
+            raise ForbiddenException("Queue stats require the ADMIN role")
+        return EvaluationQueueStats(**self.queue.stats())
+
+    # -------------------------------------------------------------------------
+    # Score distributions of a category's reports within a time window.
+    #
+    # Args:
+    #     category_id (str): The UUID of the category.
+    #     user_id (str): The UUID of the requesting user.
+    #     since (Optional[datetime]): Only reports created at or after this.
+    #     until (Optional[datetime]): Only reports created at or before this.
+    #
+    # Returns:
+    #     CategoryScoreAnalytics: Count, mean, spread, percentiles and
+    #     histogram of each score.
+    #
+    # Raises:
+    #     ForbiddenException: If the user is not an interviewer or admin.
+    # -------------------------------------------------------------------------
+    async def get_category_analytics(self, category_id: str, user_id: str, since: Optional[datetime] = None, until: Optional[datetime] = None) -> CategoryScoreAnalytics:
+        user = await self.repo.get_user(user_id)
+        if not user or user.role not in REPORT_VIEWER_ROLES:
+            raise ForbiddenException("Category analytics require the INTERVIEWER or ADMIN role")
+        distribution = await self.analytics.distribution(category_id, since, until)
+        return CategoryScoreAnalytics(
+            categoryId=category_id,
+            since=since,
+            until=until,
+            count=distribution.count,
+            metrics=distribution.summary
+        )
+
+    # -------------------------------------------------------------------------
+    # Percentile rank of a session's scores among its category's reports.
+    #
+    # Raises:
+    #     NotFoundException: If the session or its report does not exist, or
+    #     the user may not view it.
+    # -------------------------------------------------------------------------
+    async def get_candidate_ranks(self, session_id: str, user_id: str, since: Optional[datetime] = None, until: Optional[datetime] = None) -> CandidatePercentileRanks:
+        session = await self._get_viewable_session(session_id, user_id)
+        report = await self.repo.get_by_session_id(session_id)
+        if not report:
+            raise NotFoundException("Evaluation Report not found")
+
+        distribution = await self.analytics.distribution(session.categoryId, since, until)
+        scores = {metric: getattr(report, metric) for metric in SCORE_METRICS}
+        return CandidatePercentileRanks(
+            sessionId=session_id,
+            categoryId=session.categoryId,
+            since=since,
+            until=until,
+            count=distribution.count,
+            scores=scores,
+            percentileRanks={metric: distribution.percentile_rank(metric, score) for metric, score in scores.items()}
+        )
@@ -0,0 +1,31 @@
+from fastapi import APIRouter
+from app.features.Healths.Health_Schema import HealthResponse
+from app.shared.database import ping_db
+from app.shared.responses import FastJSONResponse
+from app.shared.shutdown import shutdown_drain
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+# -------------------------------------------------------------------------
+# Liveness probe: the worker's event loop is responsive.
+#
+# Public. Stays 200 while draining, so the worker is not restarted during
+# a graceful shutdown.
+# -------------------------------------------------------------------------
+@router.get("/live", response_model=HealthResponse, summary="Liveness probe")
+async def live():
+    return FastJSONResponse(HealthResponse(status="ok"))
+
+# -------------------------------------------------------------------------
+# Readiness probe: the worker should receive traffic.
+#
+# Public. 503 once SIGTERM was received (draining) or when the database
+# does not answer `SELECT 1` within DB_PING_TIMEOUT_SECONDS.
+# -------------------------------------------------------------------------
+@router.get("/ready", response_model=HealthResponse, summary="Readiness probe", responses={503: {"model": HealthResponse}})
+async def ready():
+    if shutdown_drain.draining:
+        return FastJSONResponse(HealthResponse(status="draining"), status_code=503)
+    if not await ping_db():
+        return FastJSONResponse(HealthResponse(status="unavailable", database=False), status_code=503)
+    return FastJSONResponse(HealthResponse(status="ok", database=True))
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+class HealthResponse(BaseModel):
+    status: Literal["ok", "draining", "unavailable"]
+    # Only reported by the readiness probe.
+    database: Optional[bool] = None
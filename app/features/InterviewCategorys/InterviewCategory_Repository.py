@@ -1,11 +1,23 @@
+import os
 from typing import List, Optional
 from prisma.models import InterviewCategory
 from app.shared.database import db
+from app.shared.cache import TTLCache, cache_invalidation
 from app.features.InterviewCategorys.InterviewCategory_Schema import InterviewCategoryCreate, InterviewCategoryUpdate
 
+CATEGORY_CACHE_TTL_SECONDS = float(os.getenv("CATEGORY_CACHE_TTL_SECONDS", "300"))
+
+# Categories are read on every session creation and rarely written, so reads
+# go through this cache and every write clears it (in every worker only with
+# CACHE_INVALIDATION_REDIS_URL set).
+category_cache = TTLCache("interview-categories", ttl=CATEGORY_CACHE_TTL_SECONDS)
+
 class InterviewCategoryRepository:
     # -------------------------------------------------------------------------
     # Repository for handling Interview Category-related database operations.
+    #
+    # Reads are served from `category_cache`; writes invalidate it in this
+    # and (when configured) every other worker.
     # -------------------------------------------------------------------------
     
     # -------------------------------------------------------------------------
@@ -18,7 +30,9 @@ class InterviewCategoryRepository:
     #     InterviewCategory: The created category object.
     # -------------------------------------------------------------------------
     async def create(self, data: InterviewCategoryCreate) -> InterviewCategory:
-        return await db.interviewcategory.create(data=data.model_dump())
+        category = await db.interviewcategory.create(data=data.model_dump())
+        await cache_invalidation.invalidate(category_cache.name)
+        return category
 
     # -------------------------------------------------------------------------
     # Retrieve all interview categories with pagination.
@@ -31,7 +45,13 @@ class InterviewCategoryRepository:
     #     List[InterviewCategory]: A list of categories.
     # -------------------------------------------------------------------------
     async def get_all(self, skip: int = 0, take: int = 100) -> List[InterviewCategory]:
-        return await db.interviewcategory.find_many(skip=skip, take=take, order={"createdAt": "desc"})
+        key = ("all", skip, take)
+        categories = category_cache.get(key)
+        if categories is None:
+            version = category_cache.version(key)
+            categories = await db.interviewcategory.find_many(skip=skip, take=take, order={"createdAt": "desc"})
+            category_cache.set(key, categories, version)
+        return categories
 
     # -------------------------------------------------------------------------
     # Retrieve a category by its ID.
@@ -43,7 +63,14 @@ class InterviewCategoryRepository:
     #     Optional[InterviewCategory]: The category object, or None if not found.
     # -------------------------------------------------------------------------
     async def get_by_id(self, category_id: str) -> Optional[InterviewCategory]:
-        return await db.interviewcategory.find_unique(where={"id": category_id})
+        key = ("id", category_id)
+        category = category_cache.get(key)
+        if category is None:
+            version = category_cache.version(key)
+            category = await db.interviewcategory.find_unique(where={"id": category_id})
+            if category:
+                category_cache.set(key, category, version)
+        return category
 
     # -------------------------------------------------------------------------
     # Retrieve a category by its unique slug.
@@ -55,7 +82,14 @@ class InterviewCategoryRepository:
     #     Optional[InterviewCategory]: The category object, or None if not found.
     # -------------------------------------------------------------------------
     async def get_by_slug(self, slug: str) -> Optional[InterviewCategory]:
-        return await db.interviewcategory.find_unique(where={"slug": slug})
+        key = ("slug", slug)
+        category = category_cache.get(key)
+        if category is None:
+            version = category_cache.version(key)
+            category = await db.interviewcategory.find_unique(where={"slug": slug})
+            if category:
+                category_cache.set(key, category, version)
+        return category
 
     # -------------------------------------------------------------------------
     # Update an existing category.
@@ -69,7 +103,9 @@ class InterviewCategoryRepository:
     # -------------------------------------------------------------------------
     async def update(self, category_id: str, data: InterviewCategoryUpdate) -> Optional[InterviewCategory]:
         update_data = data.model_dump(exclude_unset=True)
-        return await db.interviewcategory.update(where={"id": category_id}, data=update_data)
+        category = await db.interviewcategory.update(where={"id": category_id}, data=update_data)
+        await cache_invalidation.invalidate(category_cache.name)
+        return category
 
     # -------------------------------------------------------------------------
     # Delete a category by its ID.
@@ -81,4 +117,12 @@ class InterviewCategoryRepository:
     #     Optional[InterviewCategory]: The deleted category object.
     # -------------------------------------------------------------------------
     async def delete(self, category_id: str) -> Optional[InterviewCategory]:
-        return await db.interviewcategory.delete(where={"id": category_id})
\ No newline at end of file
+        category = await db.interviewcategory.delete(where={"id": category_id})
+        await cache_invalidation.invalidate(category_cache.name)
+        return category
+
+    # -------------------------------------------------------------------------
+    # Hit/miss counters of the category cache.
+    # -------------------------------------------------------------------------
+    def cache_stats(self) -> dict:
+        return category_cache.stats()
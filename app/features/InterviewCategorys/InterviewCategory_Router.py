@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends
-from typing import List
-from app.features.InterviewCategorys.InterviewCategory_Schema import InterviewCategoryCreate, InterviewCategoryUpdate, InterviewCategoryResponse
+from typing import List, Optional
+from app.features.InterviewCategorys.InterviewCategory_Schema import InterviewCategoryCreate, InterviewCategoryUpdate, InterviewCategoryResponse, CacheStatsResponse
 from app.features.InterviewCategorys.InterviewCategory_Service import InterviewCategoryService
 from app.features.InterviewCategorys.InterviewCategory_Dependencies import get_interview_category_service
+from app.shared.responses import FastJSONResponse
+from app.shared.utils.projection import parse_fieldset, project
 
 router = APIRouter(prefix="/interview-categories", tags=["Interview Categories"])
 
@@ -19,26 +21,46 @@ async def create_category(
     data: InterviewCategoryCreate,
     service: InterviewCategoryService = Depends(get_interview_category_service)
 ):
-    return await service.create_category(data)
+    return FastJSONResponse(await service.create_category(data))
 
 # -------------------------------------------------------------------------
 # Retrieve a list of all available interview categories.
+#
+# - **fields**: Only return these fields, e.g. `id,name,slug` to leave out
+#   the system prompt.
 # -------------------------------------------------------------------------
 @router.get("/", response_model=List[InterviewCategoryResponse], summary="List all categories")
 async def list_categories(
+    fields: Optional[str] = None,
     service: InterviewCategoryService = Depends(get_interview_category_service)
 ):
-    return await service.get_all_categories()
+    fieldset = parse_fieldset(fields, InterviewCategoryResponse)
+    categories = await service.get_all_categories()
+    return FastJSONResponse(project(categories, fieldset) if fieldset else categories)
+
+# -------------------------------------------------------------------------
+# Get hit/miss counters of the in-process category cache.
+# -------------------------------------------------------------------------
+@router.get("/cache/stats", response_model=CacheStatsResponse, summary="Category cache stats")
+async def get_cache_stats(
+    service: InterviewCategoryService = Depends(get_interview_category_service)
+):
+    return FastJSONResponse(service.get_cache_stats())
 
 # -------------------------------------------------------------------------
 # Retrieve details of a specific interview category by its ID.
+#
+# - **fields**: Only return these fields, e.g. `id,name,slug`.
 # -------------------------------------------------------------------------
 @router.get("/{category_id}", response_model=InterviewCategoryResponse, summary="Get category by ID")
 async def get_category(
     category_id: str,
+    fields: Optional[str] = None,
     service: InterviewCategoryService = Depends(get_interview_category_service)
 ):
-    return await service.get_category_by_id(category_id)
+    fieldset = parse_fieldset(fields, InterviewCategoryResponse)
+    category = await service.get_category_by_id(category_id)
+    return FastJSONResponse(project(category, fieldset) if fieldset else category)
 
 # -------------------------------------------------------------------------
 # Update an existing interview category.
@@ -51,7 +73,7 @@ async def update_category(
     data: InterviewCategoryUpdate,
     service: InterviewCategoryService = Depends(get_interview_category_service)
 ):
-    return await service.update_category(category_id, data)
+    return FastJSONResponse(await service.update_category(category_id, data))
 
 # -------------------------------------------------------------------------
 # Permanently delete an interview category.
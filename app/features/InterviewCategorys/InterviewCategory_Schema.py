@@ -22,4 +22,11 @@ class InterviewCategoryResponse(InterviewCategoryBase):
     createdAt: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class CacheStatsResponse(BaseModel):
+    name: str
+    size: int
+    hits: int
+    misses: int
+    hitRatio: Optional[float] = None
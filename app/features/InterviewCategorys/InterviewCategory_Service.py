@@ -118,4 +118,13 @@ class InterviewCategoryService:
             raise NotFoundException("Category not found")
         
         await self.repo.delete(category_id)
-        return True
\ No newline at end of file
+        return True
+
+    # -------------------------------------------------------------------------
+    # Retrieve hit/miss counters of the category cache.
+    #
+    # Returns:
+    #     dict: Cache size, hits, misses and hit ratio.
+    # -------------------------------------------------------------------------
+    def get_cache_stats(self) -> dict:
+        return self.repo.cache_stats()
@@ -0,0 +1,214 @@
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from app.features.InterviewSessions.InterviewSession_Repository import InterviewSessionRepository
+from app.features.EvaluationReports.EvaluationReport_Jobs import report_queue
+from app.shared.timer_wheel import TimerWheel
+
+logger = logging.getLogger(__name__)
+
+# Timeouts in seconds; 0 disables one.
+# SCHEDULED this long after creation -> FAILED.
+SESSION_NO_SHOW_SECONDS = float(os.getenv("SESSION_NO_SHOW_SECONDS", "1800"))
+# IN_PROGRESS this long after its start -> COMPLETED (and evaluated).
+SESSION_MAX_DURATION_SECONDS = float(os.getenv("SESSION_MAX_DURATION_SECONDS", "7200"))
+# IN_PROGRESS without a transcript line for this long -> FAILED.
+SESSION_IDLE_SECONDS = float(os.getenv("SESSION_IDLE_SECONDS", "900"))
+SESSION_TIMER_TICK_SECONDS = float(os.getenv("SESSION_TIMER_TICK_SECONDS", "1"))
+SESSION_LIFECYCLE_BATCH = int(os.getenv("SESSION_LIFECYCLE_BATCH", "500"))
+# Delay before timers whose transition failed (database down) fire again.
+SESSION_LIFECYCLE_RETRY_SECONDS = float(os.getenv("SESSION_LIFECYCLE_RETRY_SECONDS", "30"))
+
+NO_SHOW = "NO_SHOW"
+MAX_DURATION = "MAX_DURATION"
+IDLE = "IDLE"
+
+# Timeout -> (status it applies to, status it moves to).
+TRANSITIONS = {
+    NO_SHOW: ("SCHEDULED", "FAILED"),
+    MAX_DURATION: ("IN_PROGRESS", "COMPLETED"),
+    IDLE: ("IN_PROGRESS", "FAILED")
+}
+
+LIVE_STATUSES = ["SCHEDULED", "IN_PROGRESS"]
+
+def _epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+class SessionLifecycleScheduler:
+    # -------------------------------------------------------------------------
+    # Ends sessions that were never started, ran too long or went idle.
+    #
+    # Each live session has its timeouts in a TimerWheel keyed by
+    # (session id, timeout); the wheel is rebuilt from the live sessions at
+    # startup and kept current by the session service, so no periodic scan
+    # of InterviewSession is needed. Expired timers are applied in batches
+    # of one UPDATE per transition, which only matches sessions still in
+    # the expected status and returns those it moved; that makes the
+    # workers' duplicate timers (each one rebuilds all live sessions)
+    # harmless, as only the worker that moved a session acts on it.
+    #
+    # Transcript writes only record a timestamp (`touch`); when an idle
+    # timer fires it is pushed back past the latest activity, taken from
+    # this worker or, for lines written through other workers, from the
+    # database.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        repo: InterviewSessionRepository,
+        no_show: float = SESSION_NO_SHOW_SECONDS,
+        max_duration: float = SESSION_MAX_DURATION_SECONDS,
+        idle: float = SESSION_IDLE_SECONDS,
+        tick: float = SESSION_TIMER_TICK_SECONDS,
+        batch_size: int = SESSION_LIFECYCLE_BATCH,
+        retry_delay: float = SESSION_LIFECYCLE_RETRY_SECONDS
+    ):
+        self.repo = repo
+        self.timeouts = {NO_SHOW: no_show, MAX_DURATION: max_duration, IDLE: idle}
+        self.tick = tick
+        self.batch_size = batch_size
+        self.retry_delay = retry_delay
+        self.wheel = TimerWheel(time.time(), tick)
+        self._activity: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # -------------------------------------------------------------------------
+    # Load the timers of every live session, then fire them in the background.
+    # -------------------------------------------------------------------------
+    async def start(self):
+        if self._task is not None:
+            return
+        after = None
+        while True:
+            sessions = await self.repo.get_by_status(LIVE_STATUSES, after, self.batch_size)
+            if not sessions:
+                break
+            in_progress = [s.id for s in sessions if s.status == "IN_PROGRESS"]
+            activity = await self.repo.get_last_activity(in_progress) if in_progress and self.timeouts[IDLE] else {}
+            for session in sessions:
+                last = activity.get(session.id)
+                self.track(session, _epoch(last) if last else None)
+            after = sessions[-1].id
+        logger.info("Session lifecycle timers loaded: %d", len(self.wheel))
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _schedule(self, session_id: str, timeout: str, since: float):
+        if self.timeouts[timeout] > 0:
+            self.wheel.schedule((session_id, timeout), since + self.timeouts[timeout])
+
+    # -------------------------------------------------------------------------
+    # Set the timers of a session from its current status.
+    #
+    # Args:
+    #     session: The session (id, status, createdAt, startTime).
+    #     last_activity (Optional[float]): Unix time of its latest transcript
+    #         line, if known.
+    # -------------------------------------------------------------------------
+    def track(self, session, last_activity: Optional[float] = None):
+        local = self._activity.get(session.id)
+        if local is not None:
+            last_activity = max(last_activity or 0, local)
+        self.forget(session.id)
+        if session.status == "SCHEDULED":
+            self._schedule(session.id, NO_SHOW, _epoch(session.createdAt))
+        elif session.status == "IN_PROGRESS":
+            started = _epoch(session.startTime or session.createdAt)
+            self._schedule(session.id, MAX_DURATION, started)
+            self._schedule(session.id, IDLE, max(started, last_activity or 0))
+
+    def forget(self, session_id: str):
+        for timeout in TRANSITIONS:
+            self.wheel.cancel((session_id, timeout))
+        self._activity.pop(session_id, None)
+
+    # -------------------------------------------------------------------------
+    # Record activity of a session (a transcript line). O(1): the idle timer
+    # itself is only moved when it fires.
+    # -------------------------------------------------------------------------
+    def touch(self, session_id: str):
+        if (session_id, IDLE) in self.wheel:
+            self._activity[session_id] = time.time()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.tick)
+            fired = self.wheel.advance(time.time())
+            if fired:
+                try:
+                    await self._expire(fired)
+                except Exception:
+                    logger.exception("Session lifecycle batch failed")
+
+    # -------------------------------------------------------------------------
+    # Drop idle sessions that saw activity since their timer was set, moving
+    # their timer past that activity instead.
+    # -------------------------------------------------------------------------
+    async def _still_idle(self, session_ids: List[str], now: float) -> List[str]:
+        idle = self.timeouts[IDLE]
+        remote: List[str] = []
+        for session_id in session_ids:
+            last = self._activity.get(session_id)
+            if last is not None and last + idle > now:
+                self._schedule(session_id, IDLE, last)
+            else:
+                remote.append(session_id)
+
+        result = []
+        for chunk in _chunks(remote, self.batch_size):
+            activity = await self.repo.get_last_activity(chunk)
+            for session_id in chunk:
+                last = activity.get(session_id)
+                if last is not None and _epoch(last) + idle > now:
+                    self._schedule(session_id, IDLE, _epoch(last))
+                else:
+                    result.append(session_id)
+        return result
+
+    async def _expire(self, fired: list):
+        now = time.time()
+        by_timeout: Dict[str, List[str]] = defaultdict(list)
+        for session_id, timeout in fired:
+            by_timeout[timeout].append(session_id)
+
+        end_time = datetime.now(timezone.utc)
+        for timeout, remaining in by_timeout.items():
+            from_status, to_status = TRANSITIONS[timeout]
+            try:
+                if timeout == IDLE:
+                    remaining = await self._still_idle(remaining, now)
+                while remaining:
+                    chunk = remaining[:self.batch_size]
+                    changed = await self.repo.transition_many(chunk, from_status, to_status, end_time)
+                    del remaining[:self.batch_size]
+                    logger.info("%s: %d of %d sessions moved to %s", timeout, len(changed), len(chunk), to_status)
+                    for session_id in chunk:
+                        self.forget(session_id)
+                    if to_status == "COMPLETED":
+                        for session_id in changed:
+                            report_queue.enqueue(session_id)
+            except Exception:
+                logger.exception("Could not apply %s timeouts; retrying in %ss", timeout, self.retry_delay)
+                for session_id in remaining:
+                    if (session_id, timeout) not in self.wheel:
+                        self.wheel.schedule((session_id, timeout), now + self.retry_delay)
+
+
+# Process-wide scheduler; started and stopped by the lifespan in app/main.py.
+session_lifecycle = SessionLifecycleScheduler(InterviewSessionRepository())
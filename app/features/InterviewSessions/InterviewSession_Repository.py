@@ -1,6 +1,17 @@
-from typing import List, Optional
-from prisma.models import InterviewSession
+from datetime import datetime
+from typing import Dict, List, Optional
+from prisma.models import InterviewSession, User
 from app.shared.database import db
+from app.shared.utils.pagination import KEYSET_ORDER, keyset_where
+
+# Returns the ids actually moved, so that of several workers applying the
+# same timeout only one acts on each session. Prisma stores DateTime as UTC.
+TRANSITION_SQL = """
+UPDATE "InterviewSession"
+SET status = $3::"SessionStatus", "endTime" = $4::timestamptz AT TIME ZONE 'UTC'
+WHERE id = ANY($1::text[]) AND status = $2::"SessionStatus"
+RETURNING id
+"""
 
 class InterviewSessionRepository:
     # -------------------------------------------------------------------------
@@ -22,65 +33,153 @@ class InterviewSessionRepository:
     # -------------------------------------------------------------------------
     # Retrieve a session by its unique ID.
     #
-    # Includes related User and Category data.
+    # Includes related User and Category data unless `include` says otherwise.
     #
     # Args:
     #     session_id (str): The unique UUID of the session.
+    #     include (Optional[dict]): Prisma include of the relations to load.
     #
     # Returns:
     #     Optional[InterviewSession]: The session object, or None if not found.
     # -------------------------------------------------------------------------
-    async def get_by_id(self, session_id: str) -> Optional[InterviewSession]:
+    async def get_by_id(self, session_id: str, include: Optional[dict] = None) -> Optional[InterviewSession]:
+        if include is None:
+            include = {"user": True, "category": True}
         return await db.interviewsession.find_unique(
             where={"id": session_id},
-            include={"user": True, "category": True}
+            include=include or None
         )
 
     # -------------------------------------------------------------------------
-    # Retrieve all sessions for a specific user.
+    # Retrieve all sessions for a specific user, newest first.
+    #
+    # With a cursor, rows after it are returned and `skip` is ignored
+    # (keyset pagination); otherwise `skip` is used as an offset.
     #
     # Args:
     #     user_id (str): The UUID of the user.
     #     skip (int): Number of records to skip.
     #     take (int): Number of records to return.
+    #     cursor (Optional[str]): Cursor of the last row of the previous page.
+    #     include (Optional[dict]): Prisma include of the relations to load
+    #         (default: category).
     #
     # Returns:
     #     List[InterviewSession]: A list of session objects.
     # -------------------------------------------------------------------------
-    async def get_all_by_user(self, user_id: str, skip: int = 0, take: int = 20) -> List[InterviewSession]:
+    async def get_all_by_user(self, user_id: str, skip: int = 0, take: int = 20, cursor: Optional[str] = None, include: Optional[dict] = None) -> List[InterviewSession]:
+        if include is None:
+            include = {"category": True}
+        where = {"userId": user_id}
+        if cursor:
+            where.update(keyset_where(cursor))
+            skip = 0
         return await db.interviewsession.find_many(
-            where={"userId": user_id},
+            where=where,
             skip=skip,
             take=take,
-            order={"createdAt": "desc"},
-            include={"category": True}
+            order=KEYSET_ORDER,
+            include=include or None
         )
 
     # -------------------------------------------------------------------------
-    # Update an existing session.
+    # Update a session owned by the given user.
+    #
+    # Ownership is part of the write's filter, so the check and the update
+    # are a single query and no relations are joined.
     #
     # Args:
     #     session_id (str): The UUID of the session to update.
+    #     user_id (str): The UUID of the owner.
     #     data (dict): Dictionary containing fields to update.
     #
     # Returns:
-    #     Optional[InterviewSession]: The updated session object.
+    #     Optional[InterviewSession]: The updated session, or None if no
+    #     session with this ID belongs to the user.
     # -------------------------------------------------------------------------
-    async def update(self, session_id: str, data: dict) -> Optional[InterviewSession]:
+    async def update_owned(self, session_id: str, user_id: str, data: dict) -> Optional[InterviewSession]:
         return await db.interviewsession.update(
-            where={"id": session_id},
-            data=data,
-            include={"category": True}
+            where={"id": session_id, "userId": user_id},
+            data=data
         )
 
     # -------------------------------------------------------------------------
-    # Delete a session by its ID.
+    # Delete a session owned by the given user.
     #
     # Args:
     #     session_id (str): The UUID of the session to delete.
+    #     user_id (str): The UUID of the owner.
+    #
+    # Returns:
+    #     bool: True if a session was deleted, False if none matched.
+    # -------------------------------------------------------------------------
+    async def delete_owned(self, session_id: str, user_id: str) -> bool:
+        count = await db.interviewsession.delete_many(where={"id": session_id, "userId": user_id})
+        return count > 0
+
+    # -------------------------------------------------------------------------
+    # Retrieve a user by ID (used to check who may watch a session live).
+    #
+    # Args:
+    #     user_id (str): The UUID of the user.
+    #
+    # Returns:
+    #     Optional[User]: The user object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_user(self, user_id: str) -> Optional[User]:
+        return await db.user.find_unique(where={"id": user_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve a page of sessions in the given statuses, by ascending ID.
+    #
+    # Args:
+    #     statuses (List[str]): Statuses to match.
+    #     after (Optional[str]): ID of the last session of the previous page.
+    #     take (int): Maximum number of sessions to return.
+    #
+    # Returns:
+    #     List[InterviewSession]: The sessions, without relations.
+    # -------------------------------------------------------------------------
+    async def get_by_status(self, statuses: List[str], after: Optional[str] = None, take: int = 1000) -> List[InterviewSession]:
+        where = {"status": {"in": statuses}}
+        if after:
+            where["id"] = {"gt": after}
+        return await db.interviewsession.find_many(where=where, order={"id": "asc"}, take=take)
+
+    # -------------------------------------------------------------------------
+    # Time of the latest transcript line of each session.
+    #
+    # Args:
+    #     session_ids (List[str]): The UUIDs of the sessions.
+    #
+    # Returns:
+    #     Dict[str, datetime]: Session id -> latest line time; sessions without
+    #     lines are absent.
+    # -------------------------------------------------------------------------
+    async def get_last_activity(self, session_ids: List[str]) -> Dict[str, datetime]:
+        rows = await db.transcript.group_by(
+            by=["sessionId"],
+            where={"sessionId": {"in": session_ids}},
+            max={"createdAt": True}
+        )
+        return {row["sessionId"]: row["_max"]["createdAt"] for row in rows}
+
+    # -------------------------------------------------------------------------
+    # Move sessions from one status to another in a single statement.
+    #
+    # Only sessions still in `from_status` are changed, so a session updated
+    # in the meantime (by its owner or another worker) is left alone, and
+    # is not in the result.
+    #
+    # Args:
+    #     session_ids (List[str]): The UUIDs of the sessions.
+    #     from_status (str): Status the sessions must still have.
+    #     to_status (str): New status.
+    #     end_time (datetime): Value for `endTime`.
     #
     # Returns:
-    #     Optional[InterviewSession]: The deleted session object.
+    #     List[str]: The UUIDs of the sessions changed.
     # -------------------------------------------------------------------------
-    async def delete(self, session_id: str) -> Optional[InterviewSession]:
-        return await db.interviewsession.delete(where={"id": session_id})
+    async def transition_many(self, session_ids: List[str], from_status: str, to_status: str, end_time: datetime) -> List[str]:
+        rows = await db.query_raw(TRANSITION_SQL, session_ids, from_status, to_status, end_time)
+        return [row["id"] for row in rows]
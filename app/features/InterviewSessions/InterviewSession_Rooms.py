@@ -0,0 +1,282 @@
+import asyncio
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Optional
+from uuid import uuid4
+from app.shared.exceptions import ServiceUnavailableException
+from app.shared.workers import worker_share
+
+logger = logging.getLogger(__name__)
+
+# "daily" needs DAILY_API_KEY; "fake" hands out local URLs and must be chosen
+# explicitly (development, tests).
+ROOM_PROVIDER = os.getenv("ROOM_PROVIDER", "daily")
+DAILY_API_KEY = os.getenv("DAILY_API_KEY", "")
+DAILY_API_URL = os.getenv("DAILY_API_URL", "https://api.daily.co/v1")
+DAILY_HTTP_TIMEOUT_SECONDS = float(os.getenv("DAILY_HTTP_TIMEOUT_SECONDS", "10"))
+DAILY_HTTP_MAX_CONNECTIONS = int(os.getenv("DAILY_HTTP_MAX_CONNECTIONS", "10"))
+FAKE_ROOM_DOMAIN = os.getenv("FAKE_ROOM_DOMAIN", "https://your-domain.daily.co")
+
+# Rooms kept ready by the whole deployment; each worker holds its share.
+ROOM_POOL_SIZE = int(os.getenv("ROOM_POOL_SIZE", "20"))
+ROOM_POOL_CONCURRENCY = int(os.getenv("ROOM_POOL_CONCURRENCY", "4"))
+# Rooms expire this long after creation...
+ROOM_TTL_SECONDS = int(os.getenv("ROOM_TTL_SECONDS", str(6 * 3600)))
+# ...and are only handed out while at least this much of it remains.
+ROOM_MIN_REMAINING_SECONDS = int(os.getenv("ROOM_MIN_REMAINING_SECONDS", str(3 * 3600)))
+
+class Room:
+    __slots__ = ("name", "url", "expiresAt")
+
+    def __init__(self, name: str, url: str, expires_at: Optional[float] = None):
+        self.name = name
+        self.url = url
+        # Unix time, or None if the room never expires.
+        self.expiresAt = expires_at
+
+
+class RoomProvider(ABC):
+    # -------------------------------------------------------------------------
+    # Interface of video room providers.
+    # -------------------------------------------------------------------------
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    @abstractmethod
+    async def create_room(self, ttl_seconds: int) -> Room:
+        ...
+
+
+class DailyRoomProvider(RoomProvider):
+    # -------------------------------------------------------------------------
+    # Rooms from the Daily.co REST API.
+    #
+    # One keep-alive `httpx.AsyncClient` is shared by every call, so creating
+    # a room reuses an open TLS connection instead of handshaking each time.
+    # Rooms are created with an `exp` so unused ones clean themselves up.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        api_key: str = DAILY_API_KEY,
+        api_url: str = DAILY_API_URL,
+        timeout: float = DAILY_HTTP_TIMEOUT_SECONDS,
+        max_connections: int = DAILY_HTTP_MAX_CONNECTIONS
+    ):
+        self.api_key = api_key
+        self.api_url = api_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client = None
+
+    async def start(self):
+        if self._client is not None:
+            return
+        if not self.api_key:
+            raise RuntimeError("DAILY_API_KEY is not set; set it, or ROOM_PROVIDER=fake for local development")
+        import httpx
+        self._client = httpx.AsyncClient(
+            base_url=self.api_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        )
+
+    async def stop(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def create_room(self, ttl_seconds: int) -> Room:
+        expires_at = int(time.time()) + ttl_seconds
+        response = await self._client.post("/rooms", json={
+            "name": f"interview-{uuid4().hex[:12]}",
+            "privacy": "public",
+            "properties": {"exp": expires_at, "eject_at_room_exp": True}
+        })
+        response.raise_for_status()
+        body = response.json()
+        return Room(body["name"], body["url"], expires_at)
+
+
+class FakeRoomProvider(RoomProvider):
+    # -------------------------------------------------------------------------
+    # Local stand-in: URLs on FAKE_ROOM_DOMAIN, no network. `latency`
+    # simulates the provider's response time.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, domain: str = FAKE_ROOM_DOMAIN, latency: float = 0.0):
+        self.domain = domain.rstrip("/")
+        self.latency = latency
+
+    async def start(self):
+        logger.warning("ROOM_PROVIDER=fake: sessions get placeholder room URLs on %s", self.domain)
+
+    async def create_room(self, ttl_seconds: int) -> Room:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        name = f"interview-{uuid4().hex[:8]}"
+        return Room(name, f"{self.domain}/{name}", time.time() + ttl_seconds)
+
+
+# -------------------------------------------------------------------------
+# Instantiate the provider configured by ROOM_PROVIDER.
+#
+# Raises:
+#     ValueError: If ROOM_PROVIDER is unknown.
+# -------------------------------------------------------------------------
+def load_room_provider() -> RoomProvider:
+    if ROOM_PROVIDER == "daily":
+        return DailyRoomProvider()
+    if ROOM_PROVIDER == "fake":
+        return FakeRoomProvider()
+    raise ValueError(f"Unknown ROOM_PROVIDER: {ROOM_PROVIDER}")
+
+
+class RoomPool:
+    # -------------------------------------------------------------------------
+    # Pre-created rooms, kept topped up in the background.
+    #
+    # `acquire` pops a ready room without any I/O. A replenisher task keeps
+    # `size` rooms ready, creating up to `concurrency` at a time and backing
+    # off while the provider fails. Rooms too close to expiry are dropped.
+    # When the pool is empty (a burst larger than `size`, or the provider is
+    # down) `acquire` falls back to creating a room inline.
+    #
+    # The pool belongs to this worker process, which by default keeps its
+    # share of ROOM_POOL_SIZE; unused rooms simply expire.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        provider: RoomProvider,
+        size: int = worker_share(ROOM_POOL_SIZE),
+        concurrency: int = ROOM_POOL_CONCURRENCY,
+        ttl_seconds: int = ROOM_TTL_SECONDS,
+        min_remaining_seconds: int = ROOM_MIN_REMAINING_SECONDS
+    ):
+        self.provider = provider
+        self.size = size
+        self.concurrency = max(1, concurrency)
+        self.ttl_seconds = ttl_seconds
+        # A fresh room must be usable, or the replenisher would spin
+        # creating rooms that are dropped straight away.
+        self.min_remaining_seconds = min(min_remaining_seconds, ttl_seconds // 2)
+
+        self._ready: Deque[Room] = deque()
+        self._creating = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self._hits = 0
+        self._misses = 0
+        self._created = 0
+        self._failed = 0
+        self._expired = 0
+
+    async def start(self):
+        if self._task is None:
+            await self.provider.start()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.provider.stop()
+
+    def _usable(self, room: Room) -> bool:
+        return room.expiresAt is None or room.expiresAt - time.time() >= self.min_remaining_seconds
+
+    # -------------------------------------------------------------------------
+    # Take a room for a new session.
+    #
+    # Returns:
+    #     Room: A ready room, or one created inline if none is ready.
+    #
+    # Raises:
+    #     ServiceUnavailableException: If the pool is empty and the provider
+    #         fails to create a room.
+    # -------------------------------------------------------------------------
+    async def acquire(self) -> Room:
+        while self._ready:
+            room = self._ready.popleft()
+            if self._usable(room):
+                self._hits += 1
+                self._wakeup.set()
+                return room
+            self._expired += 1
+
+        self._misses += 1
+        self._wakeup.set()
+        try:
+            return await self.provider.create_room(self.ttl_seconds)
+        except Exception:
+            self._failed += 1
+            logger.exception("Inline room creation failed")
+            raise ServiceUnavailableException("Video rooms are unavailable", retry_after=5)
+
+    async def _create_one(self) -> bool:
+        try:
+            room = await self.provider.create_room(self.ttl_seconds)
+        except Exception:
+            self._failed += 1
+            logger.exception("Could not pre-create a video room")
+            return False
+        finally:
+            self._creating -= 1
+        self._created += 1
+        self._ready.append(room)
+        return True
+
+    async def _run(self):
+        backoff = 1.0
+        while True:
+            while self._ready and not self._usable(self._ready[0]):
+                self._ready.popleft()
+                self._expired += 1
+
+            missing = self.size - len(self._ready) - self._creating
+            if missing <= 0:
+                self._wakeup.clear()
+                # Wake up for acquisitions, and now and then to drop rooms
+                # nearing expiry.
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=60)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            batch = min(missing, self.concurrency)
+            self._creating += batch
+            results = await asyncio.gather(*(self._create_one() for _ in range(batch)))
+            if all(results):
+                backoff = 1.0
+            else:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60.0)
+
+    def stats(self) -> dict:
+        return {
+            "provider": type(self.provider).__name__,
+            "size": self.size,
+            "ready": len(self._ready),
+            "creating": self._creating,
+            "hits": self._hits,
+            "misses": self._misses,
+            "created": self._created,
+            "failed": self._failed,
+            "expired": self._expired
+        }
+
+
+# Process-wide pool; started and stopped by the lifespan in app/main.py.
+room_pool = RoomPool(load_room_provider())
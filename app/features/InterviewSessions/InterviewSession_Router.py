@@ -1,8 +1,20 @@
-from fastapi import APIRouter, Depends, Request
-from typing import List
-from app.features.InterviewSessions.InterviewSession_Schema import InterviewSessionCreate, InterviewSessionUpdate, InterviewSessionResponse
+import asyncio
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket
+from starlette.websockets import WebSocketDisconnect, WebSocketState
+from typing import List, Optional
+from app.features.InterviewSessions.InterviewSession_Schema import InterviewSessionCreate, InterviewSessionUpdate, InterviewSessionResponse, RoomPoolStats
 from app.features.InterviewSessions.InterviewSession_Service import InterviewSessionService
 from app.features.InterviewSessions.InterviewSession_Dependencies import get_interview_session_service
+from app.features.Transcripts.Transcript_Hub import transcript_hub
+from app.shared.responses import FastJSONResponse
+from app.shared.utils.jwt_utils import verify_access_token
+from app.shared.utils.pagination import NEXT_CURSOR_HEADER
+from app.shared.utils.projection import parse_fieldset, resolve_include, project
+
+logger = logging.getLogger(__name__)
+
+SESSION_RELATIONS = ("user", "category")
 
 router = APIRouter(prefix="/interview-sessions", tags=["Interview Sessions"])
 
@@ -13,7 +25,7 @@ router = APIRouter(prefix="/interview-sessions", tags=["Interview Sessions"])
 #
 # - **categoryId**: The ID of the interview category to practice.
 #
-# Returns the new session with a generated Daily.co room URL.
+# Returns the new session with a Daily.co room URL from the room pool.
 # -------------------------------------------------------------------------
 @router.post("/", response_model=InterviewSessionResponse, summary="Start new session")
 async def create_session(
@@ -22,34 +34,73 @@ async def create_session(
     service: InterviewSessionService = Depends(get_interview_session_service)
 ):
     user_id = request.state.user.get("sub")
-    return await service.create_session(user_id, data)
+    return FastJSONResponse(await service.create_session(user_id, data))
+
+# -------------------------------------------------------------------------
+# Get ready rooms and hit/miss counters of this worker's video room pool.
+#
+# Admins only.
+# -------------------------------------------------------------------------
+@router.get("/rooms/stats", response_model=RoomPoolStats, summary="Room pool stats")
+async def get_room_pool_stats(
+    request: Request,
+    service: InterviewSessionService = Depends(get_interview_session_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_room_pool_stats(user_id))
 
 # -------------------------------------------------------------------------
 # List all interview sessions for the current user.
+#
+# - **skip** / **take**: Offset pagination (default: 0 / 20).
+# - **cursor**: Value of the `X-Next-Cursor` header of the previous page.
+#   When given, `skip` is ignored and paging stays stable as sessions are added.
+# - **fields**: Only return these fields, e.g. `id,status,category.name`.
+# - **include**: Relations to load (`user`, `category`; default: `category`).
+#   When omitted but `fields` is given, only relations named in it are loaded.
+#
+# The `X-Next-Cursor` response header is omitted on the last page.
 # -------------------------------------------------------------------------
 @router.get("/", response_model=List[InterviewSessionResponse], summary="List my sessions")
 async def list_sessions(
     request: Request,
     skip: int = 0,
     take: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     service: InterviewSessionService = Depends(get_interview_session_service)
 ):
     user_id = request.state.user.get("sub")
-    return await service.list_user_sessions(user_id, skip, take)
+    fieldset = parse_fieldset(fields, InterviewSessionResponse)
+    relations = resolve_include(include, fieldset, SESSION_RELATIONS, default=("category",))
+
+    sessions, next_cursor = await service.list_user_sessions(user_id, skip, take, cursor, relations)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return FastJSONResponse(project(sessions, fieldset) if fieldset else sessions, headers=headers)
 
 # -------------------------------------------------------------------------
 # Get details of a specific session.
 #
 # Only returns if the session belongs to the current user.
+#
+# - **fields**: Only return these fields, e.g. `id,status,category.name`.
+# - **include**: Relations to load (`user`, `category`; default: both).
 # -------------------------------------------------------------------------
 @router.get("/{session_id}", response_model=InterviewSessionResponse, summary="Get session details")
 async def get_session(
     session_id: str,
     request: Request,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     service: InterviewSessionService = Depends(get_interview_session_service)
 ):
     user_id = request.state.user.get("sub")
-    return await service.get_session_by_id(session_id, user_id)
+    fieldset = parse_fieldset(fields, InterviewSessionResponse)
+    relations = resolve_include(include, fieldset, SESSION_RELATIONS, default=SESSION_RELATIONS)
+
+    session = await service.get_session_by_id(session_id, user_id, relations)
+    return FastJSONResponse(project(session, fieldset) if fieldset else session)
 
 # -------------------------------------------------------------------------
 # Update a session (e.g., mark as COMPLETED).
@@ -62,7 +113,7 @@ async def update_session(
     service: InterviewSessionService = Depends(get_interview_session_service)
 ):
     user_id = request.state.user.get("sub")
-    return await service.update_session(session_id, user_id, data)
+    return FastJSONResponse(await service.update_session(session_id, user_id, data))
 
 # -------------------------------------------------------------------------
 # Delete a session.
@@ -76,3 +127,67 @@ async def delete_session(
     user_id = request.state.user.get("sub")
     await service.delete_session(session_id, user_id)
     return {"message": "Session deleted successfully"}
+
+# -------------------------------------------------------------------------
+# Stream a session's transcript live over a WebSocket.
+#
+# Browsers cannot set headers on WebSocket requests, so the access token is
+# passed as the `token` query parameter (an `Authorization: Bearer` header is
+# also accepted). The session owner, interviewers and admins may connect.
+#
+# Every new line arrives as `{"type": "transcript", "data": {...}}`. A viewer
+# that falls too far behind loses the oldest lines and receives
+# `{"type": "gap", "dropped": n}` so it can refetch the transcript.
+#
+# Close codes: 4401 (invalid token), 4404 (session not found).
+# -------------------------------------------------------------------------
+@router.websocket("/{session_id}/live")
+async def live_transcript(
+    websocket: WebSocket,
+    session_id: str,
+    token: Optional[str] = None,
+    service: InterviewSessionService = Depends(get_interview_session_service)
+):
+    await websocket.accept()
+
+    auth_header = websocket.headers.get("Authorization")
+    if not token and auth_header and auth_header.startswith("Bearer "):
+        token = auth_header.split(" ")[1]
+    try:
+        user_id = verify_access_token(token or "").get("sub")
+        await service.authorize_live_viewer(session_id, user_id)
+    except HTTPException as e:
+        await websocket.close(code=4000 + e.status_code, reason=e.detail)
+        return
+
+    async with transcript_hub.subscribe(session_id) as subscription:
+        async def forward():
+            while True:
+                await websocket.send_text(await subscription.get())
+
+        async def watch():
+            # Viewers only listen; reading is how a disconnect is noticed.
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+
+        # Whichever side ends first (a disconnect, or a failed send) ends
+        # the stream; the other task is cancelled and both are awaited so
+        # no exception goes unretrieved.
+        tasks = [asyncio.create_task(forward()), asyncio.create_task(watch())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception) and not isinstance(result, WebSocketDisconnect):
+                logger.warning("Live transcript of session %s ended: %r", session_id, result)
+
+    if websocket.client_state != WebSocketState.DISCONNECTED:
+        try:
+            await websocket.close()
+        except RuntimeError:
+            pass
@@ -1,14 +1,15 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app.features.InterviewCategorys.InterviewCategory_Schema import InterviewCategoryResponse
-from app.features.Users.User_Schemas import UserResponse
+from app.features.users.user_schemas import UserResponse
 
 class InterviewSessionBase(BaseModel):
     categoryId: str
 
 class InterviewSessionCreate(InterviewSessionBase):
-    pass
+    # Restrict the question plan to one difficulty; None draws from any.
+    difficulty: Optional[str] = None
 
 class InterviewSessionUpdate(BaseModel):
     status: Optional[str] = None
@@ -23,6 +24,9 @@ class InterviewSessionResponse(BaseModel):
     startTime: Optional[datetime] = None
     endTime: Optional[datetime] = None
     createdAt: datetime
+
+    # Question ids drawn for this session when it was created.
+    questionPlan: List[str] = []
     
     # Optional relations if we want to embed them
     user: Optional[UserResponse] = None
@@ -30,3 +34,15 @@ class InterviewSessionResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+class RoomPoolStats(BaseModel):
+    provider: str
+    size: int
+    ready: int
+    creating: int
+    # Sessions served from the pool vs. rooms created inline.
+    hits: int
+    misses: int
+    created: int
+    failed: int
+    expired: int
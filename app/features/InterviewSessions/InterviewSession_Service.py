@@ -1,26 +1,56 @@
-from typing import List
-from uuid import uuid4
+import os
+from typing import List, Optional, Tuple
 from datetime import datetime
 from app.features.InterviewSessions.InterviewSession_Repository import InterviewSessionRepository
 from app.features.InterviewSessions.InterviewSession_Schema import InterviewSessionCreate, InterviewSessionUpdate, InterviewSessionResponse
 from app.features.InterviewCategorys.InterviewCategory_Repository import InterviewCategoryRepository
-from app.shared.exceptions import NotFoundException
+from app.features.InterviewCategorys.InterviewCategory_Schema import InterviewCategoryResponse
+from app.features.InterviewSessions.InterviewSession_Rooms import RoomPool
+from app.features.InterviewSessions.InterviewSession_Lifecycle import SessionLifecycleScheduler
+from app.features.QuestionBanks.QuestionBank_DrawIndex import question_draw_index
+from app.features.EvaluationReports.EvaluationReport_Jobs import report_queue
+from app.features.Transcripts.Transcript_Buffer import transcript_buffer
+from app.features.Transcripts.Transcript_Service import forget_session as forget_transcript_session
+from app.shared.exceptions import ForbiddenException, NotFoundException
+from app.shared.utils.pagination import paginate
+
+LIVE_VIEWER_ROLES = {"INTERVIEWER", "ADMIN"}
+# Roles allowed to read the room pool counters.
+ROOM_STATS_ROLES = {"ADMIN"}
+
+QUESTION_PLAN_SIZE = int(os.getenv("QUESTION_PLAN_SIZE", "10"))
 
 class InterviewSessionService:
     # -------------------------------------------------------------------------
     # Service class responsible for business logic related to Interview Sessions.
+    #
+    # Video rooms come from `room_pool`, pre-created in the background.
+    # Every status change is reported to `lifecycle`, which times out
+    # sessions that are never started, run too long or go idle.
     # -------------------------------------------------------------------------
 
-    def __init__(self, repo: InterviewSessionRepository, category_repo: InterviewCategoryRepository):
+    def __init__(
+        self,
+        repo: InterviewSessionRepository,
+        category_repo: InterviewCategoryRepository,
+        room_pool: RoomPool,
+        lifecycle: SessionLifecycleScheduler
+    ):
         self.repo = repo
         self.category_repo = category_repo
+        self.room_pool = room_pool
+        self.lifecycle = lifecycle
 
     # -------------------------------------------------------------------------
     # Create a new interview session.
     #
     # 1. Verifies if the category exists.
-    # 2. Generates a mock Daily.co room URL (integration to be added).
-    # 3. Creates the session in the database.
+    # 2. Takes a pre-created video room from the pool (created inline only
+    #    when the pool has run dry).
+    # 3. Draws the session's question plan (distinct question ids of the
+    #    category, optionally of one difficulty) from the in-memory index.
+    # 4. Creates the session, with its plan, in the database and starts its
+    #    no-show timer.
     #
     # Args:
     #     user_id (str): The ID of the authenticated user.
@@ -38,28 +68,44 @@ class InterviewSessionService:
         if not category:
             raise NotFoundException("Interview Category not found")
 
-        # 2. Generate Mock Daily Room URL (TODO: Integrate real Daily.co API)
-        # Using a placeholder for now to allow development to proceed without API keys.
-        room_name = f"interview-{uuid4().hex[:8]}"
-        mock_daily_url = f"https://your-domain.daily.co/{room_name}"
+        # 2. Take Video Room
+        room = await self.room_pool.acquire()
+
+        # 3. Draw Question Plan
+        question_plan = question_draw_index.sample(data.categoryId, data.difficulty, QUESTION_PLAN_SIZE)
 
         session_data = {
             "userId": user_id,
             "categoryId": data.categoryId,
-            "dailyRoomUrl": mock_daily_url,
-            "status": "SCHEDULED"
+            "dailyRoomUrl": room.url,
+            "status": "SCHEDULED",
+            "questionPlan": question_plan
         }
 
-        # 3. Create Session
+        # 4. Create Session
         session = await self.repo.create(session_data)
+        self.lifecycle.track(session)
         return InterviewSessionResponse.model_validate(session)
 
+    # -------------------------------------------------------------------------
+    # Ready rooms and hit/miss counters of this worker's room pool.
+    #
+    # Raises:
+    #     ForbiddenException: If the user is not an admin.
+    # -------------------------------------------------------------------------
+    async def get_room_pool_stats(self, user_id: str) -> dict:
+        user = await self.repo.get_user(user_id)
+        if not user or user.role not in ROOM_STATS_ROLES:
+            raise ForbiddenException("Room pool stats require the ADMIN role")
+        return self.room_pool.stats()
+
     # -------------------------------------------------------------------------
     # Retrieve a specific session by ID.
     #
     # Args:
     #     session_id (str): The UUID of the session.
     #     user_id (str): The ID of the current user (for authorization check).
+    #     include (Optional[dict]): Relations to load (default: user, category).
     #
     # Returns:
     #     InterviewSessionResponse: The session details.
@@ -67,31 +113,63 @@ class InterviewSessionService:
     # Raises:
     #     NotFoundException: If session not found or belongs to another user.
     # -------------------------------------------------------------------------
-    async def get_session_by_id(self, session_id: str, user_id: str) -> InterviewSessionResponse:
-        session = await self.repo.get_by_id(session_id)
+    async def get_session_by_id(self, session_id: str, user_id: str, include: Optional[dict] = None) -> InterviewSessionResponse:
+        session = await self.repo.get_by_id(session_id, include)
         if not session or session.userId != user_id:
             raise NotFoundException("Interview Session not found")
         
         return InterviewSessionResponse.model_validate(session)
 
+    # -------------------------------------------------------------------------
+    # Check that a user may watch a session's live transcript.
+    #
+    # The candidate who owns the session, interviewers and admins are allowed.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     user_id (str): The ID of the current user.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or the user may not view it.
+    # -------------------------------------------------------------------------
+    async def authorize_live_viewer(self, session_id: str, user_id: str):
+        session = await self.repo.get_by_id(session_id, include={})
+        if not session:
+            raise NotFoundException("Interview Session not found")
+        if session.userId == user_id:
+            return
+
+        user = await self.repo.get_user(user_id)
+        if not user or user.role not in LIVE_VIEWER_ROLES:
+            raise NotFoundException("Interview Session not found")
+
     # -------------------------------------------------------------------------
     # List all sessions for the current user.
     #
     # Args:
     #     user_id (str): The ID of the current user.
-    #     skip (int): Pagination skip.
+    #     skip (int): Pagination skip (ignored when a cursor is given).
     #     take (int): Pagination take.
+    #     cursor (Optional[str]): Cursor returned with the previous page.
+    #     include (Optional[dict]): Relations to load (default: category).
     #
     # Returns:
-    #     List[InterviewSessionResponse]: List of user's sessions.
+    #     Tuple[List[InterviewSessionResponse], Optional[str]]: The user's
+    #     sessions and the cursor of the next page (None on the last page).
     # -------------------------------------------------------------------------
-    async def list_user_sessions(self, user_id: str, skip: int = 0, take: int = 20) -> List[InterviewSessionResponse]:
-        sessions = await self.repo.get_all_by_user(user_id, skip, take)
-        return [InterviewSessionResponse.model_validate(s) for s in sessions]
+    async def list_user_sessions(self, user_id: str, skip: int = 0, take: int = 20, cursor: Optional[str] = None, include: Optional[dict] = None) -> Tuple[List[InterviewSessionResponse], Optional[str]]:
+        sessions = await self.repo.get_all_by_user(user_id, skip, take + 1, cursor, include)
+        page, next_cursor = paginate(sessions, take)
+        return [InterviewSessionResponse.model_validate(s) for s in page], next_cursor
 
     # -------------------------------------------------------------------------
     # Update session details (e.g., status, end time).
     #
+    # The ownership check is done by the update itself; the category is
+    # attached from the category cache instead of being joined. Moving the
+    # session to IN_PROGRESS sets its start time and starts its duration and
+    # idle timers; moving it to COMPLETED queues its evaluation report job.
+    #
     # Args:
     #     session_id (str): The UUID of the session.
     #     user_id (str): The ID of the current user.
@@ -99,32 +177,51 @@ class InterviewSessionService:
     #
     # Returns:
     #     InterviewSessionResponse: The updated session details.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
     # -------------------------------------------------------------------------
     async def update_session(self, session_id: str, user_id: str, data: InterviewSessionUpdate) -> InterviewSessionResponse:
-        # Check existence and ownership
-        session = await self.repo.get_by_id(session_id)
-        if not session or session.userId != user_id:
-            raise NotFoundException("Interview Session not found")
-
         update_data = data.model_dump(exclude_unset=True)
         
+        # If status is changing to IN_PROGRESS, auto-set startTime
+        if update_data.get("status") == "IN_PROGRESS":
+            update_data.setdefault("startTime", datetime.utcnow())
+
         # If status is changing to COMPLETED, auto-set endTime if not provided
         if update_data.get("status") == "COMPLETED" and not update_data.get("endTime"):
             update_data["endTime"] = datetime.utcnow()
 
-        updated_session = await self.repo.update(session_id, update_data)
-        return InterviewSessionResponse.model_validate(updated_session)
+        updated_session = await self.repo.update_owned(session_id, user_id, update_data)
+        if not updated_session:
+            raise NotFoundException("Interview Session not found")
+        if "status" in update_data:
+            self.lifecycle.track(updated_session)
+
+        if update_data.get("status") == "COMPLETED":
+            report_queue.enqueue(session_id)
+
+        response = InterviewSessionResponse.model_validate(updated_session)
+        category = await self.category_repo.get_by_id(updated_session.categoryId)
+        if category:
+            response.category = InterviewCategoryResponse.model_validate(category)
+        return response
 
     # -------------------------------------------------------------------------
     # Delete a session.
     #
+    # Its timers, cached owner and unwritten transcript lines go with it.
+    #
     # Args:
     #     session_id (str): The UUID of the session.
     #     user_id (str): The ID of the current user.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
     # -------------------------------------------------------------------------
     async def delete_session(self, session_id: str, user_id: str):
-        session = await self.repo.get_by_id(session_id)
-        if not session or session.userId != user_id:
+        deleted = await self.repo.delete_owned(session_id, user_id)
+        if not deleted:
             raise NotFoundException("Interview Session not found")
-            
-        await self.repo.delete(session_id)
+        self.lifecycle.forget(session_id)
+        forget_transcript_session(session_id, transcript_buffer)
@@ -0,0 +1,99 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from app.features.InterviewSessions import InterviewSession_Lifecycle as lifecycle
+from app.features.InterviewSessions.InterviewSession_Lifecycle import IDLE, MAX_DURATION, NO_SHOW, SessionLifecycleScheduler
+
+class FakeRepo:
+    def __init__(self, fail_calls=(), activity=None):
+        self.calls = 0
+        self.fail_calls = set(fail_calls)
+        self.activity = activity or {}
+        self.transitions = []
+
+    async def transition_many(self, session_ids, from_status, to_status, end_time):
+        self.calls += 1
+        if self.calls in self.fail_calls:
+            raise ConnectionError("database unavailable")
+        self.transitions.append((list(session_ids), from_status, to_status))
+        return list(session_ids)
+
+    async def get_last_activity(self, session_ids):
+        return {sid: self.activity[sid] for sid in session_ids if sid in self.activity}
+
+class FakeQueue:
+    def __init__(self):
+        self.enqueued = []
+
+    def enqueue(self, session_id):
+        self.enqueued.append(session_id)
+
+def _at(epoch: float) -> datetime:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc)
+
+def test_failed_transition_is_retried_after_the_delay(monkeypatch):
+    queue = FakeQueue()
+    monkeypatch.setattr(lifecycle, "report_queue", queue)
+    repo = FakeRepo(fail_calls={1})
+    scheduler = SessionLifecycleScheduler(repo, retry_delay=30)
+
+    before = time.time()
+    asyncio.run(scheduler._expire([("s1", MAX_DURATION), ("s2", MAX_DURATION)]))
+    assert repo.transitions == []
+    for sid in ("s1", "s2"):
+        assert scheduler.wheel.deadline((sid, MAX_DURATION)) >= before + 30
+
+    asyncio.run(scheduler._expire([("s1", MAX_DURATION), ("s2", MAX_DURATION)]))
+    assert repo.transitions == [(["s1", "s2"], "IN_PROGRESS", "COMPLETED")]
+    assert queue.enqueued == ["s1", "s2"]
+    assert len(scheduler.wheel) == 0
+
+def test_only_unapplied_chunks_are_retried(monkeypatch):
+    monkeypatch.setattr(lifecycle, "report_queue", FakeQueue())
+    repo = FakeRepo(fail_calls={2})
+    scheduler = SessionLifecycleScheduler(repo, batch_size=2)
+
+    asyncio.run(scheduler._expire([("s1", NO_SHOW), ("s2", NO_SHOW), ("s3", NO_SHOW), ("s4", NO_SHOW)]))
+    assert repo.transitions == [(["s1", "s2"], "SCHEDULED", "FAILED")]
+    assert ("s1", NO_SHOW) not in scheduler.wheel and ("s2", NO_SHOW) not in scheduler.wheel
+    assert ("s3", NO_SHOW) in scheduler.wheel and ("s4", NO_SHOW) in scheduler.wheel
+
+def test_retry_keeps_a_timer_set_while_the_batch_ran(monkeypatch):
+    monkeypatch.setattr(lifecycle, "report_queue", FakeQueue())
+    scheduler = SessionLifecycleScheduler(FakeRepo(), retry_delay=30)
+
+    async def fail_after_retrack(session_ids, from_status, to_status, end_time):
+        scheduler.wheel.schedule(("s1", NO_SHOW), 12345)
+        raise ConnectionError("database unavailable")
+    scheduler.repo.transition_many = fail_after_retrack
+
+    asyncio.run(scheduler._expire([("s1", NO_SHOW)]))
+    assert scheduler.wheel.deadline(("s1", NO_SHOW)) == 12345
+
+def test_still_idle_pushes_back_sessions_with_recent_activity():
+    now = time.time()
+    repo = FakeRepo(activity={"remote-active": _at(now - 10), "remote-stale": _at(now - 5000)})
+    scheduler = SessionLifecycleScheduler(repo, idle=900, batch_size=1)
+    scheduler._activity["local-active"] = now - 20
+    scheduler._activity["local-stale"] = now - 5000
+
+    ids = ["local-active", "local-stale", "remote-active", "remote-stale", "silent"]
+    idle = asyncio.run(scheduler._still_idle(ids, now))
+
+    assert idle == ["local-stale", "remote-stale", "silent"]
+    assert abs(scheduler.wheel.deadline(("local-active", IDLE)) - (now - 20 + 900)) <= 1
+    assert abs(scheduler.wheel.deadline(("remote-active", IDLE)) - (now - 10 + 900)) <= 1
+    assert ("silent", IDLE) not in scheduler.wheel
+
+def test_idle_timeouts_are_retried_when_activity_cannot_be_read(monkeypatch):
+    monkeypatch.setattr(lifecycle, "report_queue", FakeQueue())
+    repo = FakeRepo()
+
+    async def unavailable(session_ids):
+        raise ConnectionError("database unavailable")
+    repo.get_last_activity = unavailable
+    scheduler = SessionLifecycleScheduler(repo, retry_delay=30)
+
+    asyncio.run(scheduler._expire([("s1", IDLE)]))
+    assert repo.transitions == []
+    assert ("s1", IDLE) in scheduler.wheel
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import os
+import re
+import zlib
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from app.features.QuestionBanks.QuestionBank_Reponsitory import QuestionBankRepository
+
+logger = logging.getLogger(__name__)
+
+QUESTION_DEDUP_THRESHOLD = float(os.getenv("QUESTION_DEDUP_THRESHOLD", "0.8"))
+QUESTION_DEDUP_REFRESH_SECONDS = float(os.getenv("QUESTION_DEDUP_REFRESH_SECONDS", "600"))
+
+# 128 hash functions split into 16 bands of 8 rows: pairs with Jaccard
+# similarity 0.8 share a band with probability ~0.9, pairs at 0.5 ~0.06.
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Character shingle length, over lowercased text with collapsed whitespace
+# and punctuation, so reworded spacing or casing does not matter.
+SHINGLE_SIZE = 5
+
+# Texts per vectorized signature batch during rebuilds; bounds memory to a
+# few tens of MB.
+_SIGNATURE_BATCH = 256
+
+# Coefficients span the whole field: with 32-bit ones the permutations are
+# far from independent and similarity estimates can be off by over 0.5. The
+# product wraps modulo 2**64 before the reduction, as in datasketch.
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_rng = np.random.RandomState(20240601)
+_A = _rng.randint(1, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)[:, None]
+_B = _rng.randint(0, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)[:, None]
+
+_NORMALIZE_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+
+def shingle_hashes(text: str) -> np.ndarray:
+    normalized = _NORMALIZE_PATTERN.sub(" ", text.lower()).strip()
+    if len(normalized) <= SHINGLE_SIZE:
+        shingles = {normalized}
+    else:
+        shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+    return np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+# -------------------------------------------------------------------------
+# MinHash signatures of many texts at once.
+#
+# All shingle hashes of a batch are permuted in one (NUM_PERM x shingles)
+# operation and reduced per text with `np.minimum.reduceat`.
+# -------------------------------------------------------------------------
+def signatures(texts: Sequence[str]) -> np.ndarray:
+    result = np.empty((len(texts), NUM_PERM), dtype=np.uint64)
+    for start in range(0, len(texts), _SIGNATURE_BATCH):
+        hashes = [shingle_hashes(t) for t in texts[start:start + _SIGNATURE_BATCH]]
+        offsets = np.cumsum([0] + [len(h) for h in hashes[:-1]])
+        permuted = (_A * np.concatenate(hashes)[None, :] + _B) % _MERSENNE_PRIME
+        result[start:start + len(hashes)] = np.minimum.reduceat(permuted, offsets, axis=1).T
+    return result
+
+class QuestionDedupIndex:
+    # -------------------------------------------------------------------------
+    # MinHash/LSH index of question texts for near-duplicate detection.
+    #
+    # Each question's signature is cut into BANDS bands; questions sharing a
+    # band (within the same category) are candidates, and candidates whose
+    # estimated Jaccard similarity reaches `threshold` are duplicates. A
+    # lookup only touches the question's BANDS buckets instead of the whole
+    # bank.
+    #
+    # Rebuilt from the database at startup (off the event loop) and every
+    # QUESTION_DEDUP_REFRESH_SECONDS; writes in this worker update it
+    # immediately. Writes made while a refresh is loading are journaled and
+    # replayed onto the rebuilt index, so the swap does not lose them.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[List[dict]]],
+        threshold: float = QUESTION_DEDUP_THRESHOLD,
+        refresh_interval: float = QUESTION_DEDUP_REFRESH_SECONDS
+    ):
+        self.loader = loader
+        self.threshold = threshold
+        self.refresh_interval = refresh_interval
+        # Signatures per category, then per question id, in insertion order.
+        self._signatures: Dict[str, Dict[str, np.ndarray]] = {}
+        self._categories: Dict[str, str] = {}
+        self._buckets: Dict[Tuple[str, int, bytes], Set[str]] = defaultdict(set)
+        # (question_id, category_id, signature) adds and (question_id,)
+        # removes made during a refresh; None when no refresh is running.
+        self._journal: Optional[List[tuple]] = None
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        await self.refresh()
+        if self._task is None and self.refresh_interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    # -------------------------------------------------------------------------
+    # Reload every question from the database and swap the index in.
+    # Signatures are computed in a worker thread.
+    # -------------------------------------------------------------------------
+    async def refresh(self):
+        async with self._refresh_lock:
+            self._journal = []
+            try:
+                rows = await self.loader()
+                fresh = QuestionDedupIndex(self.loader, self.threshold, self.refresh_interval)
+                matrix = await asyncio.to_thread(signatures, [row["questionText"] for row in rows])
+                for row, signature in zip(rows, matrix):
+                    fresh._insert(row["id"], row["categoryId"], signature)
+                for entry in self._journal:
+                    fresh._discard(entry[0])
+                    if len(entry) == 3:
+                        fresh._insert(*entry)
+                self._signatures, self._categories, self._buckets = fresh._signatures, fresh._categories, fresh._buckets
+            finally:
+                self._journal = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Question dedup index refresh failed")
+
+    @staticmethod
+    def _band_keys(category_id: str, signature: np.ndarray):
+        return [(category_id, band, signature[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+    def _insert(self, question_id: str, category_id: str, signature: np.ndarray):
+        self._signatures.setdefault(category_id, {})[question_id] = signature
+        self._categories[question_id] = category_id
+        for key in self._band_keys(category_id, signature):
+            self._buckets[key].add(question_id)
+
+    def add(self, question_id: str, category_id: str, question_text: str):
+        signature = signatures([question_text])[0]
+        if self._journal is not None:
+            self._journal.append((question_id, category_id, signature))
+        self._discard(question_id)
+        self._insert(question_id, category_id, signature)
+
+    def remove(self, question_id: str):
+        if self._journal is not None:
+            self._journal.append((question_id,))
+        self._discard(question_id)
+
+    def _discard(self, question_id: str):
+        category_id = self._categories.pop(question_id, None)
+        if category_id is None:
+            return
+        in_category = self._signatures[category_id]
+        signature = in_category.pop(question_id)
+        if not in_category:
+            del self._signatures[category_id]
+        for key in self._band_keys(category_id, signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(question_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _matches(self, category_id: str, signature: np.ndarray, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        candidates: Set[str] = set()
+        for key in self._band_keys(category_id, signature):
+            candidates |= self._buckets.get(key, set())
+        candidates.discard(exclude)
+
+        in_category = self._signatures.get(category_id, {})
+        matches = []
+        for candidate in candidates:
+            similarity = float(np.mean(in_category[candidate] == signature))
+            if similarity >= self.threshold:
+                matches.append((candidate, similarity))
+        matches.sort(key=lambda m: (-m[1], m[0]))
+        return matches
+
+    # -------------------------------------------------------------------------
+    # Near-duplicates of a text within a category.
+    #
+    # Args:
+    #     category_id (str): The category to look in.
+    #     question_text (str): The text to check.
+    #     exclude (Optional[str]): A question id to ignore (the question itself).
+    #
+    # Returns:
+    #     List[Tuple[str, float]]: (questionId, estimated similarity), most
+    #     similar first.
+    # -------------------------------------------------------------------------
+    def find_duplicates(self, category_id: str, question_text: str, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        return self._matches(category_id, signatures([question_text])[0], exclude)
+
+    # -------------------------------------------------------------------------
+    # Group the near-duplicate questions of a category.
+    #
+    # Greedy, in index order: the first ungrouped question becomes a keeper
+    # and claims every ungrouped question that is a duplicate of it. Every
+    # member therefore matches its keeper directly; chains of loosely
+    # similar questions are not merged together.
+    #
+    # Returns:
+    #     List[List[str]]: Groups of two or more question ids, keeper first.
+    # -------------------------------------------------------------------------
+    def duplicate_groups(self, category_id: str) -> List[List[str]]:
+        grouped: Set[str] = set()
+        groups = []
+        for qid, signature in list(self._signatures.get(category_id, {}).items()):
+            if qid in grouped:
+                continue
+            members = [other for other, _ in self._matches(category_id, signature, exclude=qid) if other not in grouped]
+            if members:
+                grouped.add(qid)
+                grouped.update(members)
+                groups.append([qid] + sorted(members))
+        return groups
+
+
+# Process-wide index; started by the lifespan in app/main.py.
+question_dedup_index = QuestionDedupIndex(QuestionBankRepository().get_dedup_texts)
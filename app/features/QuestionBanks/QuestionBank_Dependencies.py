@@ -0,0 +1,14 @@
+from fastapi import Depends
+from app.features.QuestionBanks.QuestionBank_Reponsitory import QuestionBankRepository
+from app.features.QuestionBanks.QuestionBank_Service import QuestionBankService
+from app.features.InterviewCategorys.InterviewCategory_Dependencies import get_interview_category_repository
+from app.features.InterviewCategorys.InterviewCategory_Repository import InterviewCategoryRepository
+
+def get_question_bank_repository() -> QuestionBankRepository:
+    return QuestionBankRepository()
+
+def get_question_bank_service(
+    repo: QuestionBankRepository = Depends(get_question_bank_repository),
+    category_repo: InterviewCategoryRepository = Depends(get_interview_category_repository)
+) -> QuestionBankService:
+    return QuestionBankService(repo, category_repo)
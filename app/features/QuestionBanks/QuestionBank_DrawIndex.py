@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import os
+import random
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from app.features.QuestionBanks.QuestionBank_Reponsitory import QuestionBankRepository
+
+logger = logging.getLogger(__name__)
+
+QUESTION_INDEX_REFRESH_SECONDS = float(os.getenv("QUESTION_INDEX_REFRESH_SECONDS", "300"))
+
+# Pool key used for "any difficulty" within a category.
+ANY_DIFFICULTY = "*"
+
+PoolKey = Tuple[str, Optional[str]]
+
+class QuestionDrawIndex:
+    # -------------------------------------------------------------------------
+    # In-memory index of question ids per (categoryId, difficulty).
+    #
+    # Each question sits in its own difficulty pool and in the category's
+    # "any difficulty" pool. Pools are plain arrays with a position map, so
+    # adds and removes are O(1) (swap-remove), and `sample` draws k distinct
+    # ids in O(k) without copying or shuffling the pool.
+    #
+    # Built from the database at startup and refreshed every
+    # QUESTION_INDEX_REFRESH_SECONDS to pick up writes made by other workers;
+    # writes in this worker update it immediately. Writes made while a
+    # refresh is loading are journaled and replayed onto the new pools, so
+    # the swap does not lose them.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[List[dict]]],
+        refresh_interval: float = QUESTION_INDEX_REFRESH_SECONDS
+    ):
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self._pools: Dict[PoolKey, List[str]] = {}
+        self._positions: Dict[str, Dict[PoolKey, int]] = {}
+        # (question_id, category_id, difficulty) adds and (question_id,) removes
+        # made during a refresh; None when no refresh is running.
+        self._journal: Optional[List[tuple]] = None
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        await self.refresh()
+        if self._task is None and self.refresh_interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    # -------------------------------------------------------------------------
+    # Reload every pool from the database and swap it in atomically.
+    # -------------------------------------------------------------------------
+    async def refresh(self):
+        async with self._refresh_lock:
+            self._journal = []
+            try:
+                rows = await self.loader()
+                fresh = QuestionDrawIndex(self.loader, self.refresh_interval)
+                for row in rows:
+                    fresh.add(row["id"], row["categoryId"], row["difficulty"])
+                for entry in self._journal:
+                    if len(entry) == 1:
+                        fresh.remove(*entry)
+                    else:
+                        fresh.add(*entry)
+                self._pools, self._positions = fresh._pools, fresh._positions
+            finally:
+                self._journal = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Question draw index refresh failed")
+
+    @staticmethod
+    def _keys(category_id: str, difficulty: Optional[str]) -> Iterable[PoolKey]:
+        return ((category_id, difficulty), (category_id, ANY_DIFFICULTY))
+
+    def add(self, question_id: str, category_id: str, difficulty: Optional[str]):
+        if self._journal is not None:
+            self._journal.append((question_id, category_id, difficulty))
+        self._discard(question_id)
+        positions = self._positions[question_id] = {}
+        for key in self._keys(category_id, difficulty):
+            pool = self._pools.setdefault(key, [])
+            positions[key] = len(pool)
+            pool.append(question_id)
+
+    def remove(self, question_id: str):
+        if self._journal is not None:
+            self._journal.append((question_id,))
+        self._discard(question_id)
+
+    def _discard(self, question_id: str):
+        positions = self._positions.pop(question_id, None)
+        if not positions:
+            return
+        for key, index in positions.items():
+            pool = self._pools[key]
+            last = pool.pop()
+            if last != question_id:
+                pool[index] = last
+                self._positions[last][key] = index
+            if not pool:
+                del self._pools[key]
+
+    def size(self, category_id: str, difficulty: Optional[str] = None) -> int:
+        return len(self._pools.get((category_id, difficulty or ANY_DIFFICULTY), ()))
+
+    # -------------------------------------------------------------------------
+    # Draw up to k distinct question ids from a pool.
+    #
+    # Partial Fisher-Yates where the swaps are recorded in a dict instead of
+    # applied to the shared pool: O(k) time and memory, pool untouched.
+    #
+    # Args:
+    #     category_id (str): The category to draw from.
+    #     difficulty (Optional[str]): The difficulty, or None for any.
+    #     k (int): How many questions to draw.
+    #
+    # Returns:
+    #     List[str]: Up to k question ids in random order.
+    # -------------------------------------------------------------------------
+    def sample(self, category_id: str, difficulty: Optional[str], k: int, rng: random.Random = random) -> List[str]:
+        pool = self._pools.get((category_id, difficulty or ANY_DIFFICULTY), [])
+        n = len(pool)
+        swapped: Dict[int, str] = {}
+        drawn = []
+        for i in range(min(k, n)):
+            j = rng.randrange(i, n)
+            drawn.append(swapped.get(j, pool[j]))
+            swapped[j] = swapped.get(i, pool[i])
+        return drawn
+
+
+# Process-wide index; started by the lifespan in app/main.py.
+question_draw_index = QuestionDrawIndex(QuestionBankRepository().get_draw_keys)
@@ -0,0 +1,283 @@
+import csv
+import json
+import os
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Union
+from uuid import uuid4
+from prisma.errors import DataError
+from pydantic import ValidationError
+from app.features.QuestionBanks.QuestionBank_Reponsitory import QuestionBankRepository
+from app.features.QuestionBanks.QuestionBank_Schema import QuestionBankCreate, DuplicatePolicy, ImportResult, ImportRowError
+from app.features.QuestionBanks.QuestionBank_DrawIndex import question_draw_index
+from app.features.QuestionBanks.QuestionBank_Dedup import question_dedup_index
+from app.features.InterviewCategorys.InterviewCategory_Repository import InterviewCategoryRepository
+
+QUESTION_IMPORT_CHUNK_SIZE = int(os.getenv("QUESTION_IMPORT_CHUNK_SIZE", "500"))
+QUESTION_IMPORT_MAX_ERRORS = int(os.getenv("QUESTION_IMPORT_MAX_ERRORS", "1000"))
+QUESTION_IMPORT_MAX_LINE_BYTES = int(os.getenv("QUESTION_IMPORT_MAX_LINE_BYTES", str(1024 * 1024)))
+
+# A parsed record (with the line it starts on) or the error that replaced it.
+Record = Tuple[int, Union[dict, str]]
+
+class InvalidLine:
+    # -------------------------------------------------------------------------
+    # Stands in for a line that could not be read (too long or not UTF-8);
+    # the record parsers report it as an error on that line.
+    # -------------------------------------------------------------------------
+    __slots__ = ("error",)
+
+    def __init__(self, error: str):
+        self.error = error
+
+def _decode_line(line: bytes, first: bool) -> Union[str, InvalidLine]:
+    try:
+        text = line.decode("utf-8-sig" if first else "utf-8")
+    except UnicodeDecodeError:
+        return InvalidLine("Line is not valid UTF-8")
+    return text.rstrip("\r")
+
+# -------------------------------------------------------------------------
+# Split a byte stream into text lines without buffering the whole body.
+#
+# Lines are split on raw bytes (a newline byte never occurs inside a UTF-8
+# sequence) and decoded one by one, so a line that is not UTF-8, or longer
+# than QUESTION_IMPORT_MAX_LINE_BYTES, becomes an InvalidLine and reading
+# resumes at the next newline. A line is measured before each piece of it
+# is buffered, so at most QUESTION_IMPORT_MAX_LINE_BYTES are held whatever
+# the chunk size, and one bad row cannot exhaust memory.
+# -------------------------------------------------------------------------
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[Union[str, InvalidLine]]:
+    pending = b""
+    first = True
+    # Inside an over-long line that was already reported.
+    skipping = False
+    async for chunk in stream:
+        start = 0
+        while True:
+            newline = chunk.find(b"\n", start)
+            end = len(chunk) if newline < 0 else newline
+            if not skipping:
+                if len(pending) + end - start > QUESTION_IMPORT_MAX_LINE_BYTES:
+                    yield InvalidLine("Line exceeds the maximum length")
+                    skipping = True
+                    first = False
+                    pending = b""
+                else:
+                    pending += chunk[start:end]
+            if newline < 0:
+                break
+            if skipping:
+                skipping = False
+            else:
+                yield _decode_line(pending, first)
+                first = False
+            pending = b""
+            start = newline + 1
+    if pending and not skipping:
+        yield _decode_line(pending, first)
+
+async def iter_ndjson_records(lines: AsyncIterator[Union[str, InvalidLine]]) -> AsyncIterator[Record]:
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if isinstance(line, InvalidLine):
+            yield line_no, line.error
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, f"Invalid JSON: {e.msg}"
+            continue
+        yield line_no, record if isinstance(record, dict) else "Expected a JSON object"
+
+# -------------------------------------------------------------------------
+# Parse CSV records with a header row.
+#
+# Quoted fields may span lines: lines are joined until the record holds an
+# even number of quote characters, then the record is parsed on its own.
+# A record longer than QUESTION_IMPORT_MAX_LINE_BYTES is reported and its
+# remaining lines skipped up to the closing quote; a record containing an
+# unreadable line is reported and parsing restarts on the next line.
+# -------------------------------------------------------------------------
+async def iter_csv_records(lines: AsyncIterator[Union[str, InvalidLine]]) -> AsyncIterator[Record]:
+    header: Optional[List[str]] = None
+    buffer: List[str] = []
+    size = 0
+    quotes = 0
+    line_no = 0
+    start = 0
+    # Inside an over-long record that was already reported.
+    skipping = False
+    async for line in lines:
+        line_no += 1
+        if isinstance(line, InvalidLine):
+            yield (start if buffer or skipping else line_no), line.error
+            buffer, size, quotes, skipping = [], 0, 0, False
+            continue
+        if skipping:
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                quotes, skipping = 0, False
+            continue
+        if not buffer:
+            start = line_no
+            if not line.strip():
+                continue
+        buffer.append(line)
+        size += len(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            if size > QUESTION_IMPORT_MAX_LINE_BYTES:
+                yield start, "Record exceeds the maximum length"
+                buffer, size, skipping = [], 0, True
+            continue
+
+        fields = next(csv.reader(["\n".join(buffer)]))
+        buffer, size, quotes = [], 0, 0
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        if len(fields) != len(header):
+            yield start, f"Expected {len(header)} columns, got {len(fields)}"
+            continue
+        # Empty cells count as missing, so optional columns fall back to
+        # their defaults and required ones fail validation.
+        yield start, {name: value for name, value in zip(header, fields) if value != ""}
+
+    if buffer:
+        yield start, "Unterminated quoted field"
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors())
+
+class QuestionBankImporter:
+    # -------------------------------------------------------------------------
+    # Streams parsed records into the QuestionBank table.
+    #
+    # Valid rows are collected into chunks of QUESTION_IMPORT_CHUNK_SIZE and
+    # written with one `create_many` per chunk, each in its own transaction.
+    # A chunk rejected for its data is split in halves and retried, so only
+    # the offending rows fail. Ids are generated here so the draw and dedup
+    # indexes can be updated without reading the rows back; rows that are
+    # not written, including a pending chunk when the import is aborted,
+    # are taken out of the dedup index again. Invalid rows and failed
+    # chunks are reported per line (up to QUESTION_IMPORT_MAX_ERRORS) and
+    # the import carries on, so memory is bounded by one chunk whatever the
+    # file size.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        repo: QuestionBankRepository,
+        category_repo: InterviewCategoryRepository,
+        chunk_size: int = QUESTION_IMPORT_CHUNK_SIZE,
+        max_errors: int = QUESTION_IMPORT_MAX_ERRORS
+    ):
+        self.repo = repo
+        self.category_repo = category_repo
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self._known_categories: Dict[str, bool] = {}
+        # Categories that received rows, for cache invalidation.
+        self.inserted_categories: Set[str] = set()
+        self._result = ImportResult(received=0, inserted=0, failed=0, duplicates=0, errors=[])
+
+    def _error(self, line: int, message: str):
+        self._result.failed += 1
+        if len(self._result.errors) < self.max_errors:
+            self._result.errors.append(ImportRowError(line=line, error=message))
+        else:
+            self._result.errorsTruncated = True
+
+    async def _category_exists(self, category_id: str) -> bool:
+        if category_id not in self._known_categories:
+            self._known_categories[category_id] = await self.category_repo.get_by_id(category_id) is not None
+        return self._known_categories[category_id]
+
+    def _discard(self, chunk: List[Tuple[int, dict]]):
+        for _, row in chunk:
+            question_dedup_index.remove(row["id"])
+
+    async def _flush(self, chunk: List[Tuple[int, dict]]):
+        try:
+            await self.repo.create_many_in_tx([row for _, row in chunk])
+        except DataError as e:
+            if len(chunk) > 1:
+                middle = len(chunk) // 2
+                await self._flush(chunk[:middle])
+                await self._flush(chunk[middle:])
+                return
+            self._discard(chunk)
+            self._error(chunk[0][0], f"Insert failed: {type(e).__name__}")
+            return
+        except Exception as e:
+            self._discard(chunk)
+            for line, _ in chunk:
+                self._error(line, f"Insert failed: {type(e).__name__}")
+            return
+        for _, row in chunk:
+            question_draw_index.add(row["id"], row["categoryId"], row.get("difficulty"))
+            self.inserted_categories.add(row["categoryId"])
+        self._result.inserted += len(chunk)
+
+    # -------------------------------------------------------------------------
+    # Import every record of a stream.
+    #
+    # Args:
+    #     records (AsyncIterator[Record]): Parsed records with line numbers.
+    #     category_id (Optional[str]): Default categoryId for rows without one.
+    #     on_duplicate (DuplicatePolicy): flag (insert and count), reject
+    #         (skip and report) or merge (skip, keeping the existing question).
+    #
+    # Returns:
+    #     ImportResult: Counts and per-row errors.
+    # -------------------------------------------------------------------------
+    async def run(self, records: AsyncIterator[Record], category_id: Optional[str] = None, on_duplicate: DuplicatePolicy = "flag") -> ImportResult:
+        chunk: List[Tuple[int, dict]] = []
+        try:
+            await self._import(records, category_id, on_duplicate, chunk)
+        except BaseException:
+            # Client gone or a lookup failed: rows never written must not
+            # linger in the dedup index.
+            self._discard(chunk)
+            raise
+        return self._result
+
+    async def _import(self, records: AsyncIterator[Record], category_id: Optional[str], on_duplicate: DuplicatePolicy, chunk: List[Tuple[int, dict]]):
+        async for line, record in records:
+            self._result.received += 1
+            if isinstance(record, str):
+                self._error(line, record)
+                continue
+            if category_id and not record.get("categoryId"):
+                record["categoryId"] = category_id
+            try:
+                data = QuestionBankCreate.model_validate(record)
+            except ValidationError as e:
+                self._error(line, _format_validation_error(e))
+                continue
+            if not await self._category_exists(data.categoryId):
+                self._error(line, "categoryId: Interview Category not found")
+                continue
+
+            duplicates = question_dedup_index.find_duplicates(data.categoryId, data.questionText)
+            if duplicates:
+                self._result.duplicates += 1
+                if on_duplicate == "reject":
+                    self._error(line, f"Near-duplicate of {duplicates[0][0]}")
+                    continue
+                if on_duplicate == "merge":
+                    continue
+
+            row = {"id": str(uuid4()), **data.model_dump()}
+            # Indexed now so later rows of the same file are checked against it.
+            question_dedup_index.add(row["id"], row["categoryId"], row["questionText"])
+            chunk.append((line, row))
+            if len(chunk) >= self.chunk_size:
+                await self._flush(chunk)
+                chunk.clear()
+
+        if chunk:
+            await self._flush(chunk)
+            chunk.clear()
@@ -0,0 +1,172 @@
+from datetime import timedelta
+from typing import Dict, List, Optional
+from prisma.models import QuestionBank
+from app.shared.database import db
+
+# Weighted document used for full-text search: question text ranks above the
+# expected answer. The 'simple' configuration does no stemming, which suits
+# the mixed Vietnamese/English content of the banks. Queries must use this
+# exact expression for Postgres to pick the GIN index created by
+# prisma/sql/20261018_question_bank_search_index.sql.
+SEARCH_VECTOR_SQL = (
+    "(setweight(to_tsvector('simple', \"questionText\"), 'A') || "
+    "setweight(to_tsvector('simple', \"expectedAnswer\"), 'B'))"
+)
+
+SEARCH_SQL = f"""
+SELECT q.id, q."categoryId", q."questionText", q."expectedAnswer", q.difficulty,
+       ts_rank_cd({SEARCH_VECTOR_SQL}, query) AS rank
+FROM "QuestionBank" q, websearch_to_tsquery('simple', $1) query
+WHERE {SEARCH_VECTOR_SQL} @@ query
+  AND ($2::text IS NULL OR q."categoryId" = $2)
+  AND ($3::text IS NULL OR q.difficulty = $3)
+ORDER BY rank DESC, q.id
+LIMIT $4 OFFSET $5
+"""
+
+class QuestionBankRepository:
+    # -------------------------------------------------------------------------
+    # Repository for handling Question Bank-related database operations.
+    # -------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------
+    # Create a new question.
+    #
+    # Args:
+    #     data (dict): Dictionary containing question data.
+    #
+    # Returns:
+    #     QuestionBank: The created question object.
+    # -------------------------------------------------------------------------
+    async def create(self, data: dict) -> QuestionBank:
+        return await db.questionbank.create(data=data)
+
+    # -------------------------------------------------------------------------
+    # Insert a chunk of questions in its own short transaction.
+    #
+    # Args:
+    #     rows (List[dict]): Fully-formed rows, including their `id`.
+    #
+    # Returns:
+    #     int: The number of rows inserted.
+    # -------------------------------------------------------------------------
+    async def create_many_in_tx(self, rows: List[dict]) -> int:
+        async with db.tx(timeout=timedelta(seconds=30)) as tx:
+            return await tx.questionbank.create_many(data=rows)
+
+    # -------------------------------------------------------------------------
+    # Retrieve a question by its unique ID.
+    #
+    # Args:
+    #     question_id (str): The UUID of the question.
+    #
+    # Returns:
+    #     Optional[QuestionBank]: The question object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_by_id(self, question_id: str) -> Optional[QuestionBank]:
+        return await db.questionbank.find_unique(where={"id": question_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve the questions of a category, optionally of one difficulty.
+    #
+    # Args:
+    #     category_id (str): The UUID of the category.
+    #     difficulty (Optional[str]): Only return questions of this difficulty.
+    #     skip (int): Number of records to skip.
+    #     take (int): Number of records to return.
+    #
+    # Returns:
+    #     List[QuestionBank]: A list of questions.
+    # -------------------------------------------------------------------------
+    async def get_all_by_category(self, category_id: str, difficulty: Optional[str] = None, skip: int = 0, take: int = 50) -> List[QuestionBank]:
+        where = {"categoryId": category_id}
+        if difficulty is not None:
+            where["difficulty"] = difficulty
+        return await db.questionbank.find_many(where=where, skip=skip, take=take, order={"id": "asc"})
+
+    # -------------------------------------------------------------------------
+    # Update an existing question.
+    #
+    # Args:
+    #     question_id (str): The UUID of the question to update.
+    #     data (dict): Dictionary containing fields to update.
+    #
+    # Returns:
+    #     Optional[QuestionBank]: The updated question, or None if not found.
+    # -------------------------------------------------------------------------
+    async def update(self, question_id: str, data: dict) -> Optional[QuestionBank]:
+        return await db.questionbank.update(where={"id": question_id}, data=data)
+
+    # -------------------------------------------------------------------------
+    # Delete a question by its ID.
+    #
+    # Args:
+    #     question_id (str): The UUID of the question to delete.
+    #
+    # Returns:
+    #     Optional[QuestionBank]: The deleted question, or None if not found.
+    # -------------------------------------------------------------------------
+    async def delete(self, question_id: str) -> Optional[QuestionBank]:
+        return await db.questionbank.delete(where={"id": question_id})
+
+    # -------------------------------------------------------------------------
+    # Full-text search over question text and expected answer.
+    #
+    # Backed by the QuestionBank_search_idx GIN index; results are
+    # ranked by `ts_rank_cd`, question-text matches weighing more.
+    #
+    # Args:
+    #     query (str): Search terms (websearch syntax: "phrase", -exclude, or).
+    #     category_id (Optional[str]): Restrict to one category.
+    #     difficulty (Optional[str]): Restrict to one difficulty.
+    #     skip (int): Number of results to skip.
+    #     take (int): Number of results to return.
+    #
+    # Returns:
+    #     List[dict]: Matching rows with a `rank` column, best first.
+    # -------------------------------------------------------------------------
+    async def search(self, query: str, category_id: Optional[str] = None, difficulty: Optional[str] = None, skip: int = 0, take: int = 20) -> List[dict]:
+        return await db.query_raw(SEARCH_SQL, query, category_id, difficulty, take, skip)
+
+    # -------------------------------------------------------------------------
+    # Load the (id, categoryId, difficulty) triple of every question.
+    #
+    # Used to build the in-memory draw index; skips the text columns.
+    #
+    # Returns:
+    #     List[dict]: One row per question.
+    # -------------------------------------------------------------------------
+    async def get_draw_keys(self) -> List[dict]:
+        return await db.query_raw('SELECT id, "categoryId", difficulty FROM "QuestionBank"')
+
+    # -------------------------------------------------------------------------
+    # Load the text of every question, for building the dedup index.
+    #
+    # Returns:
+    #     List[dict]: id, categoryId and questionText per question.
+    # -------------------------------------------------------------------------
+    async def get_dedup_texts(self) -> List[dict]:
+        return await db.query_raw('SELECT id, "categoryId", "questionText" FROM "QuestionBank" ORDER BY id')
+
+    # -------------------------------------------------------------------------
+    # Fold duplicate questions into the question kept for each group.
+    #
+    # In one transaction, responses to a duplicate are repointed to the kept
+    # question and the duplicates are deleted.
+    #
+    # Args:
+    #     groups (Dict[str, List[str]]): Kept question id -> duplicate ids.
+    #
+    # Returns:
+    #     int: The number of questions deleted.
+    # -------------------------------------------------------------------------
+    async def merge_duplicates(self, groups: Dict[str, List[str]]) -> int:
+        async with db.tx() as tx:
+            for keep_id, duplicate_ids in groups.items():
+                await tx.questionresponse.update_many(
+                    where={"questionId": {"in": duplicate_ids}},
+                    data={"questionId": keep_id}
+                )
+            return await tx.questionbank.delete_many(
+                where={"id": {"in": [qid for ids in groups.values() for qid in ids]}}
+            )
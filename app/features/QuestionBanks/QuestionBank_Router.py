@@ -0,0 +1,133 @@
+from fastapi import APIRouter, Depends, Request
+from typing import List, Literal, Optional
+from app.features.QuestionBanks.QuestionBank_Schema import QuestionBankCreate, QuestionBankUpdate, QuestionBankResponse, QuestionSearchResult, DuplicatePolicy, DedupeResult, ImportResult
+from app.features.QuestionBanks.QuestionBank_Service import QuestionBankService
+from app.features.QuestionBanks.QuestionBank_Dependencies import get_question_bank_service
+from app.shared.responses import FastJSONResponse
+
+router = APIRouter(prefix="/question-banks", tags=["Question Banks"])
+
+# -------------------------------------------------------------------------
+# Add a question to a category's bank.
+#
+# - **categoryId**: The category the question belongs to.
+# - **questionText**: The question asked by the bot.
+# - **expectedAnswer**: Reference answer used for grading.
+# - **difficulty**: Optional difficulty label (e.g. EASY, MEDIUM, HARD).
+# - **onDuplicate**: When the text nearly matches a question of the same
+#   category: `flag` (create, list matches in `duplicateOf`), `reject` (409)
+#   or `merge` (return the existing question).
+# -------------------------------------------------------------------------
+@router.post("/", response_model=QuestionBankResponse, summary="Create question")
+async def create_question(
+    data: QuestionBankCreate,
+    onDuplicate: DuplicatePolicy = "flag",
+    service: QuestionBankService = Depends(get_question_bank_service)
+):
+    return FastJSONResponse(await service.create_question(data, onDuplicate))
+
+# -------------------------------------------------------------------------
+# Bulk-import questions from the raw request body.
+#
+# - **format**: `ndjson` (one JSON object per line) or `csv` (header row
+#   with categoryId, questionText, expectedAnswer, difficulty). Defaults to
+#   csv for a `text/csv` body, ndjson otherwise.
+# - **categoryId**: Used for rows that do not name a category.
+# - **onDuplicate**: `flag` (insert), `reject` (report as error) or `merge`
+#   (skip) for near-duplicates of existing or earlier rows.
+#
+# The body is parsed and inserted in chunks as it streams in; invalid rows
+# are reported by line number and do not stop the import.
+# -------------------------------------------------------------------------
+@router.post("/import", response_model=ImportResult, summary="Bulk import questions")
+async def import_questions(
+    request: Request,
+    format: Optional[Literal["ndjson", "csv"]] = None,
+    categoryId: Optional[str] = None,
+    onDuplicate: DuplicatePolicy = "flag",
+    service: QuestionBankService = Depends(get_question_bank_service)
+):
+    if format is None:
+        format = "csv" if request.headers.get("content-type", "").startswith("text/csv") else "ndjson"
+    return FastJSONResponse(await service.import_questions(request.stream(), format, categoryId, onDuplicate))
+
+# -------------------------------------------------------------------------
+# Find and merge the near-duplicate questions of a category.
+#
+# - **dryRun**: Only list the groups (default). With `false`, responses are
+#   moved to the first question of each group and the others are deleted.
+# -------------------------------------------------------------------------
+@router.post("/dedupe", response_model=DedupeResult, summary="Dedupe a category")
+async def dedupe_category(
+    categoryId: str,
+    dryRun: bool = True,
+    service: QuestionBankService = Depends(get_question_bank_service)
+):
+    return FastJSONResponse(await service.dedupe_category(categoryId, dryRun))
+
+# -------------------------------------------------------------------------
+# Search questions by relevance.
+#
+# - **q**: Search terms. Supports "quoted phrases", `or` and `-excluded` words.
+# - **categoryId** / **difficulty**: Optional filters.
+#
+# Uses the Postgres full-text index over question text and expected answer;
+# matches in the question text rank higher.
+# -------------------------------------------------------------------------
+@router.get("/search", response_model=List[QuestionSearchResult], summary="Search questions")
+async def search_questions(
+    q: str,
+    categoryId: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    skip: int = 0,
+    take: int = 20,
+    service: QuestionBankService = Depends(get_question_bank_service)
+):
+    return FastJSONResponse(await service.search_questions(q, categoryId, difficulty, skip, take))
+
+# -------------------------------------------------------------------------
+# List the questions of a category.
+# -------------------------------------------------------------------------
+@router.get("/", response_model=List[QuestionBankResponse], summary="List questions of a category")
+async def list_questions(
+    categoryId: str,
+    difficulty: Optional[str] = None,
+    skip: int = 0,
+    take: int = 50,
+    service: QuestionBankService = Depends(get_question_bank_service)
+):
+    return FastJSONResponse(await service.list_questions(categoryId, difficulty, skip, take))
+
+# -------------------------------------------------------------------------
+# Retrieve a question by its ID.
+# -------------------------------------------------------------------------
+@router.get("/{question_id}", response_model=QuestionBankResponse, summary="Get question by ID")
+async def get_question(
+    question_id: str,
+    service: QuestionBankService = Depends(get_question_bank_service)
+):
+    return FastJSONResponse(await service.get_question_by_id(question_id))
+
+# -------------------------------------------------------------------------
+# Update an existing question.
+#
+# Only provided fields will be updated.
+# -------------------------------------------------------------------------
+@router.put("/{question_id}", response_model=QuestionBankResponse, summary="Update question")
+async def update_question(
+    question_id: str,
+    data: QuestionBankUpdate,
+    service: QuestionBankService = Depends(get_question_bank_service)
+):
+    return FastJSONResponse(await service.update_question(question_id, data))
+
+# -------------------------------------------------------------------------
+# Permanently delete a question.
+# -------------------------------------------------------------------------
+@router.delete("/{question_id}", summary="Delete question")
+async def delete_question(
+    question_id: str,
+    service: QuestionBankService = Depends(get_question_bank_service)
+):
+    await service.delete_question(question_id)
+    return {"message": "Question deleted successfully"}
@@ -0,0 +1,56 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+
+class QuestionBankBase(BaseModel):
+    categoryId: str
+    questionText: str
+    expectedAnswer: str
+    difficulty: Optional[str] = None
+
+class QuestionBankCreate(QuestionBankBase):
+    pass
+
+class QuestionBankUpdate(BaseModel):
+    categoryId: Optional[str] = None
+    questionText: Optional[str] = None
+    expectedAnswer: Optional[str] = None
+    difficulty: Optional[str] = None
+
+class QuestionBankResponse(QuestionBankBase):
+    id: str
+    # Near-duplicate question ids found on create/update, most similar first.
+    duplicateOf: Optional[List[str]] = None
+
+    class Config:
+        from_attributes = True
+
+class QuestionSearchResult(QuestionBankResponse):
+    rank: float
+
+# What to do when a new question is a near-duplicate of an existing one:
+# flag: create it and list the duplicates; reject: 409; merge: return the
+# most similar existing question instead of creating one.
+DuplicatePolicy = Literal["flag", "reject", "merge"]
+
+class DuplicateGroup(BaseModel):
+    keepId: str
+    duplicateIds: List[str]
+
+class DedupeResult(BaseModel):
+    categoryId: str
+    dryRun: bool
+    groups: List[DuplicateGroup]
+    removed: int
+
+class ImportRowError(BaseModel):
+    # 1-based line the record starts on.
+    line: int
+    error: str
+
+class ImportResult(BaseModel):
+    received: int
+    inserted: int
+    failed: int
+    duplicates: int
+    errors: List[ImportRowError]
+    errorsTruncated: bool = False
@@ -0,0 +1,215 @@
+from typing import AsyncIterator, List, Literal, Optional
+from app.features.QuestionBanks.QuestionBank_Reponsitory import QuestionBankRepository
+from app.features.QuestionBanks.QuestionBank_Schema import QuestionBankCreate, QuestionBankUpdate, QuestionBankResponse, QuestionSearchResult, DuplicatePolicy, DuplicateGroup, DedupeResult, ImportResult
+from app.features.QuestionBanks.QuestionBank_DrawIndex import question_draw_index
+from app.features.QuestionBanks.QuestionBank_Dedup import question_dedup_index
+from app.features.QuestionBanks.QuestionBank_Import import QuestionBankImporter, iter_lines, iter_ndjson_records, iter_csv_records
+from app.features.QuestionResponses.QuestionResponse_Grader import grading_cache
+from app.features.InterviewCategorys.InterviewCategory_Repository import InterviewCategoryRepository
+from app.shared.cache import cache_invalidation
+from app.shared.exceptions import DuplicatedEntityException, NotFoundException, ValidationException
+
+class QuestionBankService:
+    # -------------------------------------------------------------------------
+    # Service class responsible for business logic related to Question Banks.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, repo: QuestionBankRepository, category_repo: InterviewCategoryRepository):
+        self.repo = repo
+        self.category_repo = category_repo
+
+    async def _check_category(self, category_id: str):
+        category = await self.category_repo.get_by_id(category_id)
+        if not category:
+            raise NotFoundException("Interview Category not found")
+
+    # -------------------------------------------------------------------------
+    # Create a new question in a category's bank.
+    #
+    # The text is checked against the category's near-duplicates first (see
+    # QuestionDedupIndex); `on_duplicate` decides what happens on a match.
+    #
+    # Args:
+    #     data (QuestionBankCreate): The question data.
+    #     on_duplicate (DuplicatePolicy): flag, reject or merge.
+    #
+    # Returns:
+    #     QuestionBankResponse: The created question, or with "merge" the
+    #     existing duplicate. `duplicateOf` lists the matches.
+    #
+    # Raises:
+    #     NotFoundException: If the category does not exist.
+    #     DuplicatedEntityException: On a match with "reject".
+    # -------------------------------------------------------------------------
+    async def create_question(self, data: QuestionBankCreate, on_duplicate: DuplicatePolicy = "flag") -> QuestionBankResponse:
+        await self._check_category(data.categoryId)
+
+        duplicate_ids = [qid for qid, _ in question_dedup_index.find_duplicates(data.categoryId, data.questionText)]
+        if duplicate_ids and on_duplicate == "reject":
+            raise DuplicatedEntityException(f"Question is a near-duplicate of {duplicate_ids[0]}")
+        if duplicate_ids and on_duplicate == "merge":
+            existing = await self.repo.get_by_id(duplicate_ids[0])
+            if existing:
+                response = QuestionBankResponse.model_validate(existing)
+                response.duplicateOf = duplicate_ids
+                return response
+
+        question = await self.repo.create(data.model_dump())
+        question_draw_index.add(question.id, question.categoryId, question.difficulty)
+        question_dedup_index.add(question.id, question.categoryId, question.questionText)
+        await cache_invalidation.invalidate(grading_cache.name, question.categoryId)
+        response = QuestionBankResponse.model_validate(question)
+        response.duplicateOf = duplicate_ids or None
+        return response
+
+    # -------------------------------------------------------------------------
+    # Retrieve a question by ID.
+    #
+    # Raises:
+    #     NotFoundException: If the question does not exist.
+    # -------------------------------------------------------------------------
+    async def get_question_by_id(self, question_id: str) -> QuestionBankResponse:
+        question = await self.repo.get_by_id(question_id)
+        if not question:
+            raise NotFoundException("Question not found")
+        return QuestionBankResponse.model_validate(question)
+
+    # -------------------------------------------------------------------------
+    # List the questions of a category.
+    #
+    # Args:
+    #     category_id (str): The UUID of the category.
+    #     difficulty (Optional[str]): Only list questions of this difficulty.
+    #     skip (int): Pagination skip.
+    #     take (int): Pagination take.
+    #
+    # Returns:
+    #     List[QuestionBankResponse]: The category's questions.
+    # -------------------------------------------------------------------------
+    async def list_questions(self, category_id: str, difficulty: Optional[str] = None, skip: int = 0, take: int = 50) -> List[QuestionBankResponse]:
+        questions = await self.repo.get_all_by_category(category_id, difficulty, skip, take)
+        return [QuestionBankResponse.model_validate(q) for q in questions]
+
+    # -------------------------------------------------------------------------
+    # Update a question.
+    #
+    # Near-duplicates of the new text are listed in `duplicateOf`.
+    #
+    # Raises:
+    #     NotFoundException: If the question or the new category does not exist.
+    # -------------------------------------------------------------------------
+    async def update_question(self, question_id: str, data: QuestionBankUpdate) -> QuestionBankResponse:
+        update_data = data.model_dump(exclude_unset=True)
+        if "categoryId" in update_data:
+            await self._check_category(update_data["categoryId"])
+
+        question = await self.repo.update(question_id, update_data)
+        if not question:
+            raise NotFoundException("Question not found")
+        question_draw_index.add(question.id, question.categoryId, question.difficulty)
+        question_dedup_index.add(question.id, question.categoryId, question.questionText)
+        # A question moved between categories changes two models.
+        await cache_invalidation.invalidate(grading_cache.name, None if "categoryId" in update_data else question.categoryId)
+        response = QuestionBankResponse.model_validate(question)
+        duplicates = question_dedup_index.find_duplicates(question.categoryId, question.questionText, exclude=question.id)
+        response.duplicateOf = [qid for qid, _ in duplicates] or None
+        return response
+
+    # -------------------------------------------------------------------------
+    # Delete a question.
+    #
+    # Raises:
+    #     NotFoundException: If the question does not exist.
+    # -------------------------------------------------------------------------
+    async def delete_question(self, question_id: str) -> bool:
+        question = await self.repo.delete(question_id)
+        if not question:
+            raise NotFoundException("Question not found")
+        question_draw_index.remove(question_id)
+        question_dedup_index.remove(question_id)
+        await cache_invalidation.invalidate(grading_cache.name, question.categoryId)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Find, and unless `dry_run` remove, the near-duplicates of a category.
+    #
+    # In each group the first question is kept; responses to the others are
+    # repointed to it before they are deleted.
+    #
+    # Args:
+    #     category_id (str): The UUID of the category.
+    #     dry_run (bool): Only report the groups.
+    #
+    # Returns:
+    #     DedupeResult: The duplicate groups and how many questions were removed.
+    #
+    # Raises:
+    #     NotFoundException: If the category does not exist.
+    # -------------------------------------------------------------------------
+    async def dedupe_category(self, category_id: str, dry_run: bool = True) -> DedupeResult:
+        await self._check_category(category_id)
+        groups = {group[0]: group[1:] for group in question_dedup_index.duplicate_groups(category_id)}
+
+        removed = 0
+        if groups and not dry_run:
+            removed = await self.repo.merge_duplicates(groups)
+            for duplicate_ids in groups.values():
+                for question_id in duplicate_ids:
+                    question_draw_index.remove(question_id)
+                    question_dedup_index.remove(question_id)
+            await cache_invalidation.invalidate(grading_cache.name, category_id)
+
+        return DedupeResult(
+            categoryId=category_id,
+            dryRun=dry_run,
+            groups=[DuplicateGroup(keepId=keep_id, duplicateIds=ids) for keep_id, ids in groups.items()],
+            removed=removed
+        )
+
+    # -------------------------------------------------------------------------
+    # Search questions by relevance.
+    #
+    # Args:
+    #     query (str): The search terms.
+    #     category_id (Optional[str]): Restrict to one category.
+    #     difficulty (Optional[str]): Restrict to one difficulty.
+    #     skip (int): Pagination skip.
+    #     take (int): Pagination take.
+    #
+    # Returns:
+    #     List[QuestionSearchResult]: Matching questions, most relevant first.
+    #
+    # Raises:
+    #     ValidationException: If the query is empty.
+    # -------------------------------------------------------------------------
+    async def search_questions(self, query: str, category_id: Optional[str] = None, difficulty: Optional[str] = None, skip: int = 0, take: int = 20) -> List[QuestionSearchResult]:
+        if not query.strip():
+            raise ValidationException("Search query must not be empty")
+        rows = await self.repo.search(query, category_id, difficulty, skip, take)
+        return [QuestionSearchResult.model_validate(row) for row in rows]
+
+    # -------------------------------------------------------------------------
+    # Bulk-import questions from an NDJSON or CSV byte stream.
+    #
+    # Records are parsed and inserted as they arrive; see
+    # QuestionBankImporter. CSV files need a header row naming the columns.
+    #
+    # Args:
+    #     stream (AsyncIterator[bytes]): The request body.
+    #     file_format (Literal["ndjson", "csv"]): The body format.
+    #     category_id (Optional[str]): Default categoryId for rows without one.
+    #     on_duplicate (DuplicatePolicy): flag, reject or merge.
+    #
+    # Returns:
+    #     ImportResult: Counts and per-row errors; unreadable or over-long
+    #     lines are reported as row errors too.
+    # -------------------------------------------------------------------------
+    async def import_questions(self, stream: AsyncIterator[bytes], file_format: Literal["ndjson", "csv"], category_id: Optional[str] = None, on_duplicate: DuplicatePolicy = "flag") -> ImportResult:
+        parse = iter_csv_records if file_format == "csv" else iter_ndjson_records
+        importer = QuestionBankImporter(self.repo, self.category_repo)
+        try:
+            return await importer.run(parse(iter_lines(stream)), category_id, on_duplicate)
+        finally:
+            # Also after an aborted import, for the chunks already written.
+            for inserted_category in importer.inserted_categories:
+                await cache_invalidation.invalidate(grading_cache.name, inserted_category)
@@ -0,0 +1,86 @@
+import asyncio
+import random
+import string
+from app.features.QuestionBanks.QuestionBank_Dedup import QuestionDedupIndex, shingle_hashes, signatures
+
+def _words(rng: random.Random, n: int) -> list:
+    return ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9))) for _ in range(n)]
+
+def _jaccard(a: str, b: str) -> float:
+    x, y = set(shingle_hashes(a).tolist()), set(shingle_hashes(b).tolist())
+    return len(x & y) / len(x | y)
+
+def _index(rows) -> QuestionDedupIndex:
+    async def loader():
+        return rows
+    index = QuestionDedupIndex(loader, refresh_interval=0)
+    asyncio.run(index.refresh())
+    return index
+
+def test_signature_agreement_estimates_jaccard():
+    rng = random.Random(1)
+    for _ in range(20):
+        words = _words(rng, 40)
+        edited = list(words)
+        for i in rng.sample(range(len(edited)), rng.randint(1, 20)):
+            edited[i] = _words(rng, 1)[0]
+        a, b = " ".join(words), " ".join(edited)
+        estimate = float((signatures([a])[0] == signatures([b])[0]).mean())
+        assert abs(estimate - _jaccard(a, b)) < 0.15
+
+def test_recall_of_near_duplicates():
+    rng = random.Random(2)
+    rows, pairs = [], []
+    for i in range(200):
+        words = _words(rng, 60)
+        duplicate = list(words)
+        duplicate[rng.randrange(len(duplicate))] = _words(rng, 1)[0]
+        a, b = " ".join(words), " ".join(duplicate)
+        if _jaccard(a, b) >= 0.85:
+            pairs.append((f"a{i}", f"b{i}"))
+        rows += [{"id": f"a{i}", "categoryId": "c", "questionText": a}, {"id": f"b{i}", "categoryId": "c", "questionText": b}]
+    index = _index(rows)
+
+    found = sum(1 for a, b in pairs if b in {qid for qid, _ in index._matches("c", index._signatures["c"][a], exclude=a)})
+    assert len(pairs) > 150
+    assert found / len(pairs) >= 0.95
+
+def test_unrelated_questions_are_not_duplicates():
+    rng = random.Random(3)
+    rows = [{"id": str(i), "categoryId": "c", "questionText": " ".join(_words(rng, 30))} for i in range(300)]
+    assert _index(rows).duplicate_groups("c") == []
+
+def test_duplicates_stay_within_their_category():
+    text = "Explain the difference between a process and a thread"
+    index = _index([
+        {"id": "1", "categoryId": "c1", "questionText": text},
+        {"id": "2", "categoryId": "c1", "questionText": text + "."},
+        {"id": "3", "categoryId": "c2", "questionText": text}
+    ])
+    assert index.duplicate_groups("c1") == [["1", "2"]]
+    assert index.duplicate_groups("c2") == []
+    assert index.find_duplicates("c2", text) == [("3", 1.0)]
+
+def test_writes_during_refresh_survive_the_swap():
+    text = "Explain the difference between a process and a thread"
+    loading = asyncio.Event()
+    resume = asyncio.Event()
+
+    async def loader():
+        loading.set()
+        await resume.wait()
+        return [{"id": "1", "categoryId": "c", "questionText": text}, {"id": "2", "categoryId": "c", "questionText": "What is a mutex"}]
+
+    async def scenario():
+        index = QuestionDedupIndex(loader, refresh_interval=0)
+        refresh = asyncio.create_task(index.refresh())
+        await loading.wait()
+        index.add("3", "c", text)
+        index.remove("2")
+        resume.set()
+        await refresh
+        return index
+
+    index = asyncio.run(scenario())
+    assert index.find_duplicates("c", text) == [("1", 1.0), ("3", 1.0)]
+    assert "2" not in index._categories
@@ -0,0 +1,10 @@
+from fastapi import Depends
+from app.features.QuestionResponses.QuestionResponse_Reponsitory import QuestionResponseRepository
+from app.features.QuestionResponses.QuestionResponse_Service import QuestionResponseService
+from app.features.QuestionResponses.QuestionResponse_Grader import response_grader
+
+def get_question_response_repository() -> QuestionResponseRepository:
+    return QuestionResponseRepository()
+
+def get_question_response_service(repo: QuestionResponseRepository = Depends(get_question_response_repository)) -> QuestionResponseService:
+    return QuestionResponseService(repo, response_grader)
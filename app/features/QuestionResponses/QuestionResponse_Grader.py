@@ -0,0 +1,157 @@
+import asyncio
+import math
+import os
+import re
+from collections import Counter
+from typing import Awaitable, Callable, Dict, List, Sequence, Set, Tuple
+import numpy as np
+from scipy import sparse
+from app.shared.cache import TTLCache
+from app.features.QuestionResponses.QuestionResponse_Reponsitory import QuestionResponseRepository
+
+GRADING_MODEL_CACHE_TTL_SECONDS = float(os.getenv("GRADING_MODEL_CACHE_TTL_SECONDS", "3600"))
+
+# Scores use the same 0-10 scale as EvaluationReport.
+MAX_SCORE = 10.0
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Fitted models per category. QuestionBank writes drop the written category
+# (in every worker with CACHE_INVALIDATION_REDIS_URL set).
+grading_cache = TTLCache("question-grading-models", ttl=GRADING_MODEL_CACHE_TTL_SECONDS, max_size=256)
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+class TfidfModel:
+    # -------------------------------------------------------------------------
+    # TF-IDF model fitted on the question bank of one category.
+    #
+    # The vocabulary and IDF weights come from the category's questions and
+    # expected answers; the expected answers are vectorized once into
+    # `expected` (one L2-normalized row per question), so grading only has to
+    # vectorize the candidate answers.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, questions: List[dict]):
+        documents = [tokenize(q["questionText"]) + tokenize(q["expectedAnswer"]) for q in questions]
+
+        document_frequency: Counter = Counter()
+        for tokens in documents:
+            document_frequency.update(set(tokens))
+        self.vocabulary: Dict[str, int] = {term: i for i, term in enumerate(sorted(document_frequency))}
+
+        # Smoothed IDF, as in scikit-learn: terms in every document keep weight 1.
+        n = len(documents)
+        self.idf = np.ones(len(self.vocabulary), dtype=np.float64)
+        for term, df in document_frequency.items():
+            self.idf[self.vocabulary[term]] = math.log((1 + n) / (1 + df)) + 1
+
+        self.rows: Dict[str, int] = {q["id"]: i for i, q in enumerate(questions)}
+        self.expected = self.transform([q["expectedAnswer"] for q in questions])
+        # Ids requested but not in the bank when this model was fitted.
+        self.missing: Set[str] = set()
+
+    # -------------------------------------------------------------------------
+    # Vectorize texts into an L2-normalized sparse TF-IDF matrix.
+    #
+    # Terms outside the category's vocabulary are ignored.
+    # -------------------------------------------------------------------------
+    def transform(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for text in texts:
+            counts = Counter(self.vocabulary[t] for t in tokenize(text) if t in self.vocabulary)
+            indices.extend(counts.keys())
+            data.extend(counts.values())
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int32)),
+            shape=(len(texts), len(self.vocabulary))
+        )
+        matrix = matrix @ sparse.diags(self.idf)
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1 / norms) @ matrix)
+
+
+class ResponseGrader:
+    # -------------------------------------------------------------------------
+    # Scores answers by cosine similarity to the question's expected answer.
+    #
+    # One TF-IDF model per category is fitted on first use and cached in
+    # `grading_cache`. An unknown question id refits the model once; if the
+    # id is still unknown it is remembered as missing by that model, so it
+    # does not trigger another refit until a QuestionBank write drops the
+    # category. Fits run in a worker thread, and concurrent requests that
+    # need the same category refitted share one fit. A batch is graded with one sparse transform of all its
+    # answers and a row-wise product with the matching expected-answer
+    # rows, instead of re-processing expected answers for every response.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, loader: Callable[[str], Awaitable[List[dict]]]):
+        self.loader = loader
+        # In-flight fits per category, with the cache version they started at.
+        self._fits: Dict[str, Tuple[Tuple[int, int], "asyncio.Future[TfidfModel]"]] = {}
+
+    async def _model(self, category_id: str, required: Sequence[str]) -> TfidfModel:
+        model = grading_cache.get(category_id)
+        if model is not None and all(qid in model.rows or qid in model.missing for qid in required):
+            return model
+
+        # Questions added since the model was fitted force a refit. A fit
+        # started before the category was last invalidated is not joined.
+        version = grading_cache.version(category_id)
+        inflight = self._fits.get(category_id)
+        if inflight is None or inflight[0] != version:
+            fit = asyncio.ensure_future(self._fit(category_id, version))
+            self._fits[category_id] = (version, fit)
+            fit.add_done_callback(lambda done: self._forget_fit(category_id, done))
+        else:
+            fit = inflight[1]
+
+        # A cancelled caller must not cancel the fit other callers wait on.
+        model = await asyncio.shield(fit)
+        model.missing.update(qid for qid in required if qid not in model.rows)
+        return model
+
+    async def _fit(self, category_id: str, version: Tuple[int, int]) -> TfidfModel:
+        questions = await self.loader(category_id)
+        model = await asyncio.to_thread(TfidfModel, questions)
+        grading_cache.set(category_id, model, version)
+        return model
+
+    def _forget_fit(self, category_id: str, fit: "asyncio.Future[TfidfModel]"):
+        if self._fits.get(category_id, (None, None))[1] is fit:
+            del self._fits[category_id]
+
+    # -------------------------------------------------------------------------
+    # Grade a batch of answers to questions of one category.
+    #
+    # Args:
+    #     category_id (str): The category the questions belong to.
+    #     items (Sequence[Tuple[str, str]]): (questionId, answer) pairs.
+    #
+    # Returns:
+    #     List[float]: A 0-10 score per item, in order. Questions missing from
+    #     the category's bank score 0.
+    # -------------------------------------------------------------------------
+    async def grade(self, category_id: str, items: Sequence[Tuple[str, str]]) -> List[float]:
+        if not items:
+            return []
+        model = await self._model(category_id, [qid for qid, _ in items])
+        if not model.rows:
+            return [0.0] * len(items)
+
+        known = [qid in model.rows for qid, _ in items]
+        answers = model.transform([answer for _, answer in items])
+        expected = model.expected[[model.rows.get(qid, 0) for qid, _ in items]]
+        similarity = np.asarray(answers.multiply(expected).sum(axis=1)).ravel()
+        scores = np.round(np.clip(similarity, 0.0, 1.0) * MAX_SCORE, 2)
+        return [float(score) if ok else 0.0 for score, ok in zip(scores, known)]
+
+
+# Process-wide grader shared by requests and the evaluation report jobs.
+response_grader = ResponseGrader(QuestionResponseRepository().get_category_questions)
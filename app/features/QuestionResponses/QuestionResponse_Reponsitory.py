@@ -0,0 +1,120 @@
+from typing import List, Optional, Sequence, Tuple
+from prisma.models import InterviewSession, QuestionBank, QuestionResponse
+from app.shared.database import db
+
+class QuestionResponseRepository:
+    # -------------------------------------------------------------------------
+    # Repository for handling Question Response-related database operations.
+    # -------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------
+    # Create a new question response.
+    #
+    # Args:
+    #     data (dict): Dictionary containing response data, including `score`.
+    #
+    # Returns:
+    #     QuestionResponse: The created response object.
+    # -------------------------------------------------------------------------
+    async def create(self, data: dict) -> QuestionResponse:
+        return await db.questionresponse.create(data=data)
+
+    # -------------------------------------------------------------------------
+    # Retrieve a response by its unique ID.
+    #
+    # Args:
+    #     response_id (str): The UUID of the response.
+    #
+    # Returns:
+    #     Optional[QuestionResponse]: The response object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_by_id(self, response_id: str) -> Optional[QuestionResponse]:
+        return await db.questionresponse.find_unique(where={"id": response_id}, include={"session": True})
+
+    # -------------------------------------------------------------------------
+    # Retrieve all responses of a session.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     List[QuestionResponse]: The session's responses.
+    # -------------------------------------------------------------------------
+    async def get_by_session(self, session_id: str) -> List[QuestionResponse]:
+        return await db.questionresponse.find_many(where={"sessionId": session_id}, order={"id": "asc"})
+
+    # -------------------------------------------------------------------------
+    # Update an existing response.
+    #
+    # Args:
+    #     response_id (str): The UUID of the response to update.
+    #     data (dict): Dictionary containing fields to update.
+    #
+    # Returns:
+    #     Optional[QuestionResponse]: The updated response, or None if not found.
+    # -------------------------------------------------------------------------
+    async def update(self, response_id: str, data: dict) -> Optional[QuestionResponse]:
+        return await db.questionresponse.update(where={"id": response_id}, data=data)
+
+    # -------------------------------------------------------------------------
+    # Write many scores in a single batched request.
+    #
+    # Args:
+    #     scores (Sequence[Tuple[str, float]]): (responseId, score) pairs.
+    # -------------------------------------------------------------------------
+    async def update_scores(self, scores: Sequence[Tuple[str, float]]):
+        async with db.batch_() as batcher:
+            for response_id, score in scores:
+                batcher.questionresponse.update(where={"id": response_id}, data={"score": score})
+
+    # -------------------------------------------------------------------------
+    # Delete a response by its ID.
+    #
+    # Args:
+    #     response_id (str): The UUID of the response to delete.
+    #
+    # Returns:
+    #     Optional[QuestionResponse]: The deleted response, or None if not found.
+    # -------------------------------------------------------------------------
+    async def delete(self, response_id: str) -> Optional[QuestionResponse]:
+        return await db.questionresponse.delete(where={"id": response_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve a session (without relations).
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     Optional[InterviewSession]: The session object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_session(self, session_id: str) -> Optional[InterviewSession]:
+        return await db.interviewsession.find_unique(where={"id": session_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve a question by its ID.
+    #
+    # Args:
+    #     question_id (str): The UUID of the question.
+    #
+    # Returns:
+    #     Optional[QuestionBank]: The question object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_question(self, question_id: str) -> Optional[QuestionBank]:
+        return await db.questionbank.find_unique(where={"id": question_id})
+
+    # -------------------------------------------------------------------------
+    # Load the texts of every question of a category, for fitting the
+    # grading model.
+    #
+    # Args:
+    #     category_id (str): The UUID of the category.
+    #
+    # Returns:
+    #     List[dict]: id, questionText and expectedAnswer per question.
+    # -------------------------------------------------------------------------
+    async def get_category_questions(self, category_id: str) -> List[dict]:
+        return await db.query_raw(
+            'SELECT id, "questionText", "expectedAnswer" FROM "QuestionBank" WHERE "categoryId" = $1 ORDER BY id',
+            category_id
+        )
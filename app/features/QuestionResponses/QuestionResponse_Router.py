@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Depends, Request
+from typing import List
+from app.features.QuestionResponses.QuestionResponse_Schema import QuestionResponseCreate, QuestionResponseUpdate, QuestionResponseResponse, SessionGradingResult
+from app.features.QuestionResponses.QuestionResponse_Service import QuestionResponseService
+from app.features.QuestionResponses.QuestionResponse_Dependencies import get_question_response_service
+from app.shared.responses import FastJSONResponse
+
+router = APIRouter(prefix="/question-responses", tags=["Question Responses"])
+
+# -------------------------------------------------------------------------
+# Record a candidate's answer to a question.
+#
+# - **sessionId**: One of the current user's sessions.
+# - **questionId**: A question of the session's category.
+# - **answer**: The candidate's answer.
+# - **comment**: Optional note.
+#
+# The answer is scored (0-10) against the question's expected answer.
+# -------------------------------------------------------------------------
+@router.post("/", response_model=QuestionResponseResponse, summary="Add question response")
+async def create_response(
+    data: QuestionResponseCreate,
+    request: Request,
+    service: QuestionResponseService = Depends(get_question_response_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.create_response(user_id, data))
+
+# -------------------------------------------------------------------------
+# List the responses of a session.
+# -------------------------------------------------------------------------
+@router.get("/session/{session_id}", response_model=List[QuestionResponseResponse], summary="List session responses")
+async def list_session_responses(
+    session_id: str,
+    request: Request,
+    service: QuestionResponseService = Depends(get_question_response_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.list_session_responses(session_id, user_id))
+
+# -------------------------------------------------------------------------
+# Re-grade every response of a session in one batch.
+# -------------------------------------------------------------------------
+@router.post("/session/{session_id}/grade", response_model=SessionGradingResult, summary="Grade session responses")
+async def grade_session(
+    session_id: str,
+    request: Request,
+    service: QuestionResponseService = Depends(get_question_response_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.grade_session(session_id, user_id))
+
+# -------------------------------------------------------------------------
+# Update a response. A changed answer is re-graded.
+# -------------------------------------------------------------------------
+@router.put("/{response_id}", response_model=QuestionResponseResponse, summary="Update question response")
+async def update_response(
+    response_id: str,
+    data: QuestionResponseUpdate,
+    request: Request,
+    service: QuestionResponseService = Depends(get_question_response_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.update_response(response_id, user_id, data))
+
+# -------------------------------------------------------------------------
+# Permanently delete a response.
+# -------------------------------------------------------------------------
+@router.delete("/{response_id}", summary="Delete question response")
+async def delete_response(
+    response_id: str,
+    request: Request,
+    service: QuestionResponseService = Depends(get_question_response_service)
+):
+    user_id = request.state.user.get("sub")
+    await service.delete_response(response_id, user_id)
+    return {"message": "Question Response deleted successfully"}
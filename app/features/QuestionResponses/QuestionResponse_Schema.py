@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class QuestionResponseBase(BaseModel):
+    questionId: str
+    answer: str
+    comment: Optional[str] = None
+
+class QuestionResponseCreate(QuestionResponseBase):
+    sessionId: str
+
+class QuestionResponseUpdate(BaseModel):
+    answer: Optional[str] = None
+    comment: Optional[str] = None
+
+class QuestionResponseResponse(QuestionResponseBase):
+    id: str
+    sessionId: str
+    score: float
+
+    class Config:
+        from_attributes = True
+
+class SessionGradingResult(BaseModel):
+    sessionId: str
+    graded: int
+    averageScore: Optional[float] = None
+    responses: List[QuestionResponseResponse]
@@ -0,0 +1,145 @@
+from typing import List
+from app.features.QuestionResponses.QuestionResponse_Reponsitory import QuestionResponseRepository
+from app.features.QuestionResponses.QuestionResponse_Grader import ResponseGrader
+from app.features.QuestionResponses.QuestionResponse_Schema import QuestionResponseCreate, QuestionResponseUpdate, QuestionResponseResponse, SessionGradingResult
+from app.shared.exceptions import NotFoundException, ValidationException
+
+class QuestionResponseService:
+    # -------------------------------------------------------------------------
+    # Service class responsible for business logic related to Question Responses.
+    #
+    # Scores are always computed by the grader from the answer; clients never
+    # set them directly.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, repo: QuestionResponseRepository, grader: ResponseGrader):
+        self.repo = repo
+        self.grader = grader
+
+    # -------------------------------------------------------------------------
+    # Ensure the session exists and belongs to the given user.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
+    # -------------------------------------------------------------------------
+    async def _get_owned_session(self, session_id: str, user_id: str):
+        session = await self.repo.get_session(session_id)
+        if not session or session.userId != user_id:
+            raise NotFoundException("Interview Session not found")
+        return session
+
+    async def _get_owned_response(self, response_id: str, user_id: str):
+        response = await self.repo.get_by_id(response_id)
+        if not response or response.session.userId != user_id:
+            raise NotFoundException("Question Response not found")
+        return response
+
+    # -------------------------------------------------------------------------
+    # Record and grade a candidate's answer.
+    #
+    # Args:
+    #     user_id (str): The ID of the current user.
+    #     data (QuestionResponseCreate): The answer.
+    #
+    # Returns:
+    #     QuestionResponseResponse: The stored response with its score.
+    #
+    # Raises:
+    #     NotFoundException: If the session or question does not exist.
+    #     ValidationException: If the question is from another category.
+    # -------------------------------------------------------------------------
+    async def create_response(self, user_id: str, data: QuestionResponseCreate) -> QuestionResponseResponse:
+        session = await self._get_owned_session(data.sessionId, user_id)
+        question = await self.repo.get_question(data.questionId)
+        if not question:
+            raise NotFoundException("Question not found")
+        if question.categoryId != session.categoryId:
+            raise ValidationException("Question does not belong to the session's category")
+
+        [score] = await self.grader.grade(session.categoryId, [(data.questionId, data.answer)])
+        response = await self.repo.create({**data.model_dump(), "score": score})
+        return QuestionResponseResponse.model_validate(response)
+
+    # -------------------------------------------------------------------------
+    # List the responses of one of the user's sessions.
+    # -------------------------------------------------------------------------
+    async def list_session_responses(self, session_id: str, user_id: str) -> List[QuestionResponseResponse]:
+        await self._get_owned_session(session_id, user_id)
+        responses = await self.repo.get_by_session(session_id)
+        return [QuestionResponseResponse.model_validate(r) for r in responses]
+
+    # -------------------------------------------------------------------------
+    # (Re)grade every response of a session in one batch.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     user_id (str): The ID of the current user.
+    #
+    # Returns:
+    #     SessionGradingResult: The graded responses and their average score.
+    # -------------------------------------------------------------------------
+    async def grade_session(self, session_id: str, user_id: str) -> SessionGradingResult:
+        session = await self._get_owned_session(session_id, user_id)
+        responses = await grade_session_responses(self.repo, self.grader, session.categoryId, session_id)
+        scores = [r.score for r in responses]
+        return SessionGradingResult(
+            sessionId=session_id,
+            graded=len(responses),
+            averageScore=sum(scores) / len(scores) if scores else None,
+            responses=[QuestionResponseResponse.model_validate(r) for r in responses]
+        )
+
+    # -------------------------------------------------------------------------
+    # Update a response; a new answer is re-graded.
+    #
+    # Raises:
+    #     NotFoundException: If the response does not exist or belongs to
+    #     another user's session.
+    # -------------------------------------------------------------------------
+    async def update_response(self, response_id: str, user_id: str, data: QuestionResponseUpdate) -> QuestionResponseResponse:
+        existing = await self._get_owned_response(response_id, user_id)
+        update_data = data.model_dump(exclude_unset=True)
+        if "answer" in update_data:
+            [update_data["score"]] = await self.grader.grade(existing.session.categoryId, [(existing.questionId, update_data["answer"])])
+
+        response = await self.repo.update(response_id, update_data)
+        if not response:
+            raise NotFoundException("Question Response not found")
+        return QuestionResponseResponse.model_validate(response)
+
+    # -------------------------------------------------------------------------
+    # Delete a response.
+    #
+    # Raises:
+    #     NotFoundException: If the response does not exist or belongs to
+    #     another user's session.
+    # -------------------------------------------------------------------------
+    async def delete_response(self, response_id: str, user_id: str) -> bool:
+        await self._get_owned_response(response_id, user_id)
+        deleted = await self.repo.delete(response_id)
+        if not deleted:
+            raise NotFoundException("Question Response not found")
+        return True
+
+
+# -------------------------------------------------------------------------
+# Grade all responses of a session in one batch and store the scores.
+#
+# Shared by the grade endpoint and the evaluation report job.
+#
+# Args:
+#     repo (QuestionResponseRepository): Repository used for reads and writes.
+#     grader (ResponseGrader): The grading engine.
+#     category_id (str): The session's category.
+#     session_id (str): The UUID of the session.
+#
+# Returns:
+#     List[QuestionResponse]: The responses with their new scores.
+# -------------------------------------------------------------------------
+async def grade_session_responses(repo: QuestionResponseRepository, grader: ResponseGrader, category_id: str, session_id: str):
+    responses = await repo.get_by_session(session_id)
+    scores = await grader.grade(category_id, [(r.questionId, r.answer) for r in responses])
+    await repo.update_scores([(r.id, score) for r, score in zip(responses, scores)])
+    for response, score in zip(responses, scores):
+        response.score = score
+    return responses
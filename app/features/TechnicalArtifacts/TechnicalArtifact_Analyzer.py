@@ -0,0 +1,54 @@
+import importlib
+import os
+from abc import ABC, abstractmethod
+
+# "package.module:ClassName" of the analyzer to use; the heuristic stub when unset.
+ARTIFACT_ANALYZER = os.getenv("ARTIFACT_ANALYZER", "")
+
+# Line prefixes treated as comments by the heuristic analyzer.
+COMMENT_PREFIXES = ("#", "//", "/*", "*", "--")
+
+class ArtifactAnalyzer(ABC):
+    # -------------------------------------------------------------------------
+    # Interface of code analyzers.
+    #
+    # `analyze` receives the language and code of an ArtifactBlob
+    # and returns the text stored as its `aiAnalysis`. It runs at most once
+    # per distinct content, so it may be slow and expensive (an LLM call).
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    async def analyze(self, language: str, code: str) -> str:
+        ...
+
+
+class HeuristicAnalyzer(ArtifactAnalyzer):
+    # -------------------------------------------------------------------------
+    # Local stand-in for the LLM analyzer: size, comment density and
+    # indentation depth of the code.
+    # -------------------------------------------------------------------------
+
+    async def analyze(self, language: str, code: str) -> str:
+        lines = [line for line in code.split("\n") if line.strip()]
+        comments = sum(1 for line in lines if line.lstrip().startswith(COMMENT_PREFIXES))
+        indents = sorted({len(line) - len(line.lstrip()) for line in lines})
+        step = min((b - a for a, b in zip(indents, indents[1:])), default=0)
+        depth = (indents[-1] // step) if step else 0
+        return (
+            f"{language} submission with {len(lines)} non-blank line(s), "
+            f"{comments} comment line(s) ({comments / len(lines) if lines else 0:.0%}). "
+            f"Deepest nesting level: {depth}."
+        )
+
+
+# -------------------------------------------------------------------------
+# Instantiate the analyzer configured by ARTIFACT_ANALYZER.
+#
+# Returns:
+#     ArtifactAnalyzer: The configured analyzer, or HeuristicAnalyzer by default.
+# -------------------------------------------------------------------------
+def load_analyzer() -> ArtifactAnalyzer:
+    if not ARTIFACT_ANALYZER:
+        return HeuristicAnalyzer()
+    module_name, _, class_name = ARTIFACT_ANALYZER.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
@@ -0,0 +1,13 @@
+from fastapi import Depends
+from app.features.TechnicalArtifacts.TechnicalArtifact_Reponsitory import TechnicalArtifactRepository
+from app.features.TechnicalArtifacts.TechnicalArtifact_Service import TechnicalArtifactService
+from app.features.TechnicalArtifacts.TechnicalArtifact_Store import artifact_store
+from app.features.TechnicalArtifacts.TechnicalArtifact_Jobs import analysis_queue
+from app.features.TechnicalArtifacts.TechnicalArtifact_StaticAnalysis import static_analysis_pool
+from app.features.TechnicalArtifacts.TechnicalArtifact_Snapshots import code_snapshot_log
+
+def get_technical_artifact_repository() -> TechnicalArtifactRepository:
+    return TechnicalArtifactRepository()
+
+def get_technical_artifact_service(repo: TechnicalArtifactRepository = Depends(get_technical_artifact_repository)) -> TechnicalArtifactService:
+    return TechnicalArtifactService(repo, artifact_store, analysis_queue, static_analysis_pool, code_snapshot_log)
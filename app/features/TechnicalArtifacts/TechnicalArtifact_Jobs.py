@@ -0,0 +1,73 @@
+import logging
+import os
+from app.features.TechnicalArtifacts.TechnicalArtifact_Reponsitory import TechnicalArtifactRepository
+from app.features.TechnicalArtifacts.TechnicalArtifact_Analyzer import load_analyzer
+from app.features.TechnicalArtifacts.TechnicalArtifact_Store import artifact_store
+from app.shared.job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_ANALYSIS_WORKERS = int(os.getenv("ARTIFACT_ANALYSIS_WORKERS", "2"))
+ARTIFACT_ANALYSIS_MAX_ATTEMPTS = int(os.getenv("ARTIFACT_ANALYSIS_MAX_ATTEMPTS", "3"))
+ARTIFACT_ANALYSIS_RETRY_BACKOFF_SECONDS = float(os.getenv("ARTIFACT_ANALYSIS_RETRY_BACKOFF_SECONDS", "5"))
+# Blobs read per query when re-enqueuing analyses at startup.
+ARTIFACT_ANALYSIS_RECOVERY_PAGE = int(os.getenv("ARTIFACT_ANALYSIS_RECOVERY_PAGE", "1000"))
+
+_repo = TechnicalArtifactRepository()
+_analyzer = load_analyzer()
+
+# -------------------------------------------------------------------------
+# Analyze a blob and store the result on it.
+#
+# The job id is the content hash, so identical code submitted many times
+# (even concurrently) is analyzed once per process; a blob that already has
+# an analysis (e.g. from another worker) is skipped. Code that the static
+# analyzer could not parse is not sent to the (expensive) analyzer: the
+# syntax error is stored as its analysis instead.
+#
+# Args:
+#     content_hash (str): Hash of the blob (also the job id).
+# -------------------------------------------------------------------------
+async def analyze_blob(content_hash: str):
+    blob = await _repo.get_blob(content_hash)
+    if not blob or blob.aiAnalysis is not None:
+        return
+
+    static = blob.staticAnalysis or {}
+    if static.get("parseOk") is False:
+        artifact_store.record_analysis_skipped()
+        errors = "; ".join(f"line {f['line']}: {f['message']}" for f in static.get("findings", []))
+        await _repo.set_blob_analysis(content_hash, f"Not analyzed: the {blob.language} code does not parse ({errors}).")
+        return
+
+    artifact_store.record_analysis_run()
+    analysis = await _analyzer.analyze(blob.language, blob.codeContent)
+    await _repo.set_blob_analysis(content_hash, analysis)
+
+# -------------------------------------------------------------------------
+# Re-enqueue blobs that were never analyzed (e.g. jobs lost in a restart).
+# Called from the application lifespan.
+# -------------------------------------------------------------------------
+async def recover_pending_analyses():
+    count = 0
+    after = None
+    while True:
+        hashes = await _repo.get_unanalyzed_blob_hashes(after, ARTIFACT_ANALYSIS_RECOVERY_PAGE)
+        if not hashes:
+            break
+        for content_hash in hashes:
+            analysis_queue.enqueue(content_hash)
+        count += len(hashes)
+        after = hashes[-1]
+    if count:
+        logger.info("Re-enqueued %d artifact analysis jobs", count)
+
+
+# Process-wide queue; started and stopped by the lifespan in app/main.py.
+analysis_queue = JobQueue(
+    "artifact-analysis",
+    analyze_blob,
+    concurrency=ARTIFACT_ANALYSIS_WORKERS,
+    max_attempts=ARTIFACT_ANALYSIS_MAX_ATTEMPTS,
+    backoff_base=ARTIFACT_ANALYSIS_RETRY_BACKOFF_SECONDS
+)
@@ -0,0 +1,239 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from prisma import Json
+from prisma.models import ArtifactBlob, CodeSnapshot, InterviewSession, TechnicalArtifact, User
+from app.shared.database import db
+
+class TechnicalArtifactRepository:
+    # -------------------------------------------------------------------------
+    # Repository for handling Technical Artifact-related database operations.
+    # -------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------
+    # Create a new artifact.
+    #
+    # Args:
+    #     data (dict): sessionId, language and blobHash.
+    #
+    # Returns:
+    #     TechnicalArtifact: The created artifact, with its blob.
+    # -------------------------------------------------------------------------
+    async def create(self, data: dict) -> TechnicalArtifact:
+        return await db.technicalartifact.create(data=data, include={"blob": True})
+
+    # -------------------------------------------------------------------------
+    # Retrieve an artifact by its unique ID.
+    #
+    # Args:
+    #     artifact_id (str): The UUID of the artifact.
+    #
+    # Returns:
+    #     Optional[TechnicalArtifact]: The artifact with its session and blob,
+    #     or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_by_id(self, artifact_id: str) -> Optional[TechnicalArtifact]:
+        return await db.technicalartifact.find_unique(
+            where={"id": artifact_id},
+            include={"session": True, "blob": True}
+        )
+
+    # -------------------------------------------------------------------------
+    # Retrieve all artifacts of a session, oldest first.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     List[TechnicalArtifact]: The session's artifacts with their blobs.
+    # -------------------------------------------------------------------------
+    async def get_by_session(self, session_id: str) -> List[TechnicalArtifact]:
+        return await db.technicalartifact.find_many(
+            where={"sessionId": session_id},
+            include={"blob": True},
+            order=[{"createdAt": "asc"}, {"id": "asc"}]
+        )
+
+    # -------------------------------------------------------------------------
+    # Delete an artifact by its ID. Its blob is kept: other artifacts may
+    # share it.
+    #
+    # Args:
+    #     artifact_id (str): The UUID of the artifact to delete.
+    #
+    # Returns:
+    #     Optional[TechnicalArtifact]: The deleted artifact, or None if not found.
+    # -------------------------------------------------------------------------
+    async def delete(self, artifact_id: str) -> Optional[TechnicalArtifact]:
+        return await db.technicalartifact.delete(where={"id": artifact_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve the session an artifact belongs to (without relations).
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     Optional[InterviewSession]: The session object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_session(self, session_id: str) -> Optional[InterviewSession]:
+        return await db.interviewsession.find_unique(where={"id": session_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve a user by ID (used for role checks).
+    #
+    # Args:
+    #     user_id (str): The UUID of the user.
+    #
+    # Returns:
+    #     Optional[User]: The user object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_user(self, user_id: str) -> Optional[User]:
+        return await db.user.find_unique(where={"id": user_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve a blob by its content hash.
+    #
+    # Args:
+    #     content_hash (str): Hash of the normalized content.
+    #
+    # Returns:
+    #     Optional[ArtifactBlob]: The blob, or None if not stored yet.
+    # -------------------------------------------------------------------------
+    async def get_blob(self, content_hash: str) -> Optional[ArtifactBlob]:
+        return await db.artifactblob.find_unique(where={"hash": content_hash})
+
+    # -------------------------------------------------------------------------
+    # Store a blob unless it already exists.
+    #
+    # An upsert with an empty update, so two workers storing the same new
+    # content at once both succeed and share one row.
+    #
+    # Args:
+    #     data (dict): hash, language and codeContent.
+    #
+    # Returns:
+    #     ArtifactBlob: The stored (or already existing) blob.
+    # -------------------------------------------------------------------------
+    async def create_blob(self, data: dict) -> ArtifactBlob:
+        return await db.artifactblob.upsert(
+            where={"hash": data["hash"]},
+            data={"create": data, "update": {}}
+        )
+
+    # -------------------------------------------------------------------------
+    # Store the analysis of a blob.
+    #
+    # Args:
+    #     content_hash (str): Hash of the blob.
+    #     analysis (str): The analysis text.
+    #
+    # Returns:
+    #     Optional[ArtifactBlob]: The updated blob, or None if not found.
+    # -------------------------------------------------------------------------
+    async def set_blob_analysis(self, content_hash: str, analysis: str) -> Optional[ArtifactBlob]:
+        return await db.artifactblob.update(
+            where={"hash": content_hash},
+            data={"aiAnalysis": analysis, "analyzedAt": datetime.now(timezone.utc)}
+        )
+
+    # -------------------------------------------------------------------------
+    # Store the static analysis result of a blob.
+    #
+    # Args:
+    #     content_hash (str): Hash of the blob.
+    #     result (dict): The result of StaticAnalysisPool.run.
+    #
+    # Returns:
+    #     Optional[ArtifactBlob]: The updated blob, or None if not found.
+    # -------------------------------------------------------------------------
+    async def set_blob_static_analysis(self, content_hash: str, result: dict) -> Optional[ArtifactBlob]:
+        return await db.artifactblob.update(
+            where={"hash": content_hash},
+            data={"staticAnalysis": Json(result)}
+        )
+
+    # -------------------------------------------------------------------------
+    # Hashes of the blobs still waiting for their analysis.
+    #
+    # Used at startup to re-enqueue analyses lost with a previous process;
+    # only the key column is read.
+    #
+    # Args:
+    #     after (Optional[str]): Last hash of the previous page.
+    #     take (int): Maximum number of hashes to return.
+    #
+    # Returns:
+    #     List[str]: Hashes of unanalyzed blobs, in ascending order.
+    # -------------------------------------------------------------------------
+    async def get_unanalyzed_blob_hashes(self, after: Optional[str] = None, take: int = 1000) -> List[str]:
+        rows = await db.query_raw(
+            'SELECT hash FROM "ArtifactBlob" WHERE "aiAnalysis" IS NULL AND ($1::text IS NULL OR hash > $1) '
+            'ORDER BY hash LIMIT $2',
+            after,
+            take
+        )
+        return [row["hash"] for row in rows]
+
+    # -------------------------------------------------------------------------
+    # Insert a code snapshot.
+    #
+    # Args:
+    #     data (dict): sessionId, seq, kind, language, data, size, createdAt.
+    #
+    # Returns:
+    #     CodeSnapshot: The created snapshot.
+    #
+    # Raises:
+    #     UniqueViolationError: If the session already has this `seq`.
+    # -------------------------------------------------------------------------
+    async def create_snapshot(self, data: dict) -> CodeSnapshot:
+        return await db.codesnapshot.create(data=data)
+
+    # -------------------------------------------------------------------------
+    # The most recent keyframe of a session, optionally as of a time.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     at (Optional[datetime]): Ignore snapshots taken after this.
+    #
+    # Returns:
+    #     Optional[CodeSnapshot]: The keyframe, or None if there is none.
+    # -------------------------------------------------------------------------
+    async def get_latest_keyframe(self, session_id: str, at: Optional[datetime] = None) -> Optional[CodeSnapshot]:
+        where = {"sessionId": session_id, "kind": "KEYFRAME"}
+        if at is not None:
+            where["createdAt"] = {"lte": at}
+        return await db.codesnapshot.find_first(where=where, order={"seq": "desc"})
+
+    # -------------------------------------------------------------------------
+    # A session's snapshots from a sequence number on, in order.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     from_seq (int): First sequence number (a keyframe).
+    #     at (Optional[datetime]): Ignore snapshots taken after this.
+    #
+    # Returns:
+    #     List[CodeSnapshot]: The snapshots by ascending `seq`.
+    # -------------------------------------------------------------------------
+    async def get_snapshots_from(self, session_id: str, from_seq: int, at: Optional[datetime] = None) -> List[CodeSnapshot]:
+        where = {"sessionId": session_id, "seq": {"gte": from_seq}}
+        if at is not None:
+            where["createdAt"] = {"lte": at}
+        return await db.codesnapshot.find_many(where=where, order={"seq": "asc"})
+
+    # -------------------------------------------------------------------------
+    # Sequence, kind, size and time of every snapshot of a session, without
+    # their data.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     List[dict]: One row per snapshot, by ascending `seq`.
+    # -------------------------------------------------------------------------
+    async def get_snapshot_timeline(self, session_id: str) -> List[dict]:
+        return await db.query_raw(
+            'SELECT seq, kind, size, "createdAt" FROM "CodeSnapshot" WHERE "sessionId" = $1 ORDER BY seq',
+            session_id
+        )
@@ -0,0 +1,123 @@
+from fastapi import APIRouter, Depends, Request
+from datetime import datetime
+from typing import List, Optional
+from app.features.TechnicalArtifacts.TechnicalArtifact_Schema import (
+    TechnicalArtifactCreate, TechnicalArtifactResponse, ArtifactCacheStats,
+    CodeSnapshotCreate, CodeSnapshotResult, CodeSnapshotContent, CodeSnapshotInfo
+)
+from app.features.TechnicalArtifacts.TechnicalArtifact_Service import TechnicalArtifactService
+from app.features.TechnicalArtifacts.TechnicalArtifact_Dependencies import get_technical_artifact_service
+from app.shared.responses import FastJSONResponse
+
+router = APIRouter(prefix="/technical-artifacts", tags=["Technical Artifacts"])
+
+# -------------------------------------------------------------------------
+# Submit code written during a session.
+#
+# - **sessionId**: One of the current user's sessions.
+# - **language**: e.g. python, javascript.
+# - **codeContent**: The code.
+#
+# Code identical to an earlier submission (ignoring line endings and
+# trailing whitespace) is stored once and reuses its analysis.
+# -------------------------------------------------------------------------
+@router.post("/", response_model=TechnicalArtifactResponse, summary="Submit technical artifact")
+async def create_artifact(
+    data: TechnicalArtifactCreate,
+    request: Request,
+    service: TechnicalArtifactService = Depends(get_technical_artifact_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.create_artifact(user_id, data))
+
+# -------------------------------------------------------------------------
+# Content and analysis cache hit counters of this worker.
+#
+# Admins only.
+# -------------------------------------------------------------------------
+@router.get("/cache/stats", response_model=ArtifactCacheStats, summary="Artifact cache stats")
+async def get_cache_stats(
+    request: Request,
+    service: TechnicalArtifactService = Depends(get_technical_artifact_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_cache_stats(user_id))
+
+# -------------------------------------------------------------------------
+# Record the editor buffer during a live coding round.
+#
+# Send the full buffer every few seconds; only the changed lines are
+# stored, and an unchanged buffer is ignored (`stored: false`).
+# -------------------------------------------------------------------------
+@router.post("/snapshots", response_model=CodeSnapshotResult, summary="Save code snapshot")
+async def save_snapshot(
+    data: CodeSnapshotCreate,
+    request: Request,
+    service: TechnicalArtifactService = Depends(get_technical_artifact_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.save_snapshot(user_id, data))
+
+# -------------------------------------------------------------------------
+# List the snapshots of a session (sequence, kind, size and time).
+# -------------------------------------------------------------------------
+@router.get("/snapshots/session/{session_id}/timeline", response_model=List[CodeSnapshotInfo], summary="List code snapshots")
+async def get_snapshot_timeline(
+    session_id: str,
+    request: Request,
+    service: TechnicalArtifactService = Depends(get_technical_artifact_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_snapshot_timeline(session_id, user_id))
+
+# -------------------------------------------------------------------------
+# Get a session's code as it was at a point in time.
+#
+# - **at**: ISO date-time; the latest code when omitted.
+# -------------------------------------------------------------------------
+@router.get("/snapshots/session/{session_id}", response_model=CodeSnapshotContent, summary="Get code at a point in time")
+async def get_snapshot(
+    session_id: str,
+    request: Request,
+    at: Optional[datetime] = None,
+    service: TechnicalArtifactService = Depends(get_technical_artifact_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_snapshot(session_id, user_id, at))
+
+# -------------------------------------------------------------------------
+# List the artifacts of a session.
+# -------------------------------------------------------------------------
+@router.get("/session/{session_id}", response_model=List[TechnicalArtifactResponse], summary="List session artifacts")
+async def list_session_artifacts(
+    session_id: str,
+    request: Request,
+    service: TechnicalArtifactService = Depends(get_technical_artifact_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.list_session_artifacts(session_id, user_id))
+
+# -------------------------------------------------------------------------
+# Get an artifact by ID.
+# -------------------------------------------------------------------------
+@router.get("/{artifact_id}", response_model=TechnicalArtifactResponse, summary="Get technical artifact")
+async def get_artifact(
+    artifact_id: str,
+    request: Request,
+    service: TechnicalArtifactService = Depends(get_technical_artifact_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_artifact(artifact_id, user_id))
+
+# -------------------------------------------------------------------------
+# Permanently delete an artifact.
+# -------------------------------------------------------------------------
+@router.delete("/{artifact_id}", summary="Delete technical artifact")
+async def delete_artifact(
+    artifact_id: str,
+    request: Request,
+    service: TechnicalArtifactService = Depends(get_technical_artifact_service)
+):
+    user_id = request.state.user.get("sub")
+    await service.delete_artifact(artifact_id, user_id)
+    return {"message": "Technical Artifact deleted successfully"}
@@ -0,0 +1,77 @@
+from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional, Union
+from datetime import datetime
+
+class TechnicalArtifactCreate(BaseModel):
+    sessionId: str
+    language: str
+    codeContent: str
+
+class LintFinding(BaseModel):
+    line: int
+    code: str
+    message: str
+
+class StaticAnalysisResult(BaseModel):
+    status: Literal["OK", "TIMEOUT", "ERROR"]
+    parseOk: Optional[bool] = None
+    # Analyzer-specific, e.g. lines, functions, classes, complexity.
+    metrics: Dict[str, Union[int, float]] = {}
+    findings: List[LintFinding] = []
+    error: Optional[str] = None
+    durationMs: Optional[float] = None
+
+class TechnicalArtifactResponse(BaseModel):
+    id: str
+    sessionId: str
+    language: str
+    codeContent: str
+    aiAnalysis: Optional[str] = None
+    # None for languages without a static analyzer.
+    staticAnalysis: Optional[StaticAnalysisResult] = None
+    # Hash of the normalized content; None for rows stored before blobs.
+    contentHash: Optional[str] = None
+    analysisStatus: Literal["PENDING", "DONE"]
+    createdAt: datetime
+
+class ArtifactCacheStats(BaseModel):
+    # Counters of this worker process since it started.
+    submissions: int
+    contentHits: int
+    contentMisses: int
+    contentHitRatio: Optional[float] = None
+    bytesDeduplicated: int
+    # Submissions whose analysis was already stored, vs. analyzer calls.
+    # Repeats of code still being analyzed count as neither.
+    analysisHits: int
+    analysisRuns: int
+    # AI analyses replaced by the static result (code that does not parse).
+    analysisSkipped: int
+    analysisHitRatio: Optional[float] = None
+    analysisQueueDepth: int
+
+class CodeSnapshotCreate(BaseModel):
+    sessionId: str
+    language: str
+    codeContent: str
+
+class CodeSnapshotInfo(BaseModel):
+    seq: int
+    kind: Literal["KEYFRAME", "DELTA"]
+    size: int
+    createdAt: datetime
+
+class CodeSnapshotResult(BaseModel):
+    sessionId: str
+    # Latest sequence number of the session after this submission.
+    seq: int
+    # False when the buffer was identical to the previous snapshot.
+    stored: bool
+    kind: Optional[Literal["KEYFRAME", "DELTA"]] = None
+
+class CodeSnapshotContent(BaseModel):
+    sessionId: str
+    seq: int
+    language: str
+    codeContent: str
+    createdAt: datetime
@@ -0,0 +1,232 @@
+from datetime import datetime
+from typing import List, Optional
+from app.features.TechnicalArtifacts.TechnicalArtifact_Reponsitory import TechnicalArtifactRepository
+from app.features.TechnicalArtifacts.TechnicalArtifact_Store import ArtifactStore
+from app.features.TechnicalArtifacts.TechnicalArtifact_StaticAnalysis import OK, StaticAnalysisPool
+from app.features.TechnicalArtifacts.TechnicalArtifact_Snapshots import CodeSnapshotLog
+from app.features.TechnicalArtifacts.TechnicalArtifact_Store import normalize_language
+from app.features.TechnicalArtifacts.TechnicalArtifact_Schema import (
+    TechnicalArtifactCreate, TechnicalArtifactResponse, ArtifactCacheStats,
+    CodeSnapshotCreate, CodeSnapshotResult, CodeSnapshotContent, CodeSnapshotInfo
+)
+from app.shared.exceptions import ForbiddenException, NotFoundException
+from app.shared.job_queue import JobQueue
+
+# Roles allowed to read the cache counters.
+ARTIFACT_STATS_ROLES = {"ADMIN"}
+
+class TechnicalArtifactService:
+    # -------------------------------------------------------------------------
+    # Service class responsible for business logic related to Technical Artifacts.
+    #
+    # Code is stored through the content-addressed ArtifactStore. Each new
+    # blob gets its static analysis during the request (in the process
+    # pool) and its AI analysis once in the background by `analysis_queue`.
+    # Live editor buffers go to the delta-encoded `snapshot_log` instead.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        repo: TechnicalArtifactRepository,
+        store: ArtifactStore,
+        analysis_queue: JobQueue,
+        static_pool: StaticAnalysisPool,
+        snapshot_log: CodeSnapshotLog
+    ):
+        self.repo = repo
+        self.store = store
+        self.analysis_queue = analysis_queue
+        self.static_pool = static_pool
+        self.snapshot_log = snapshot_log
+
+    # -------------------------------------------------------------------------
+    # Ensure the session exists and belongs to the given user.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
+    # -------------------------------------------------------------------------
+    async def _check_owner(self, session_id: str, user_id: str):
+        session = await self.repo.get_session(session_id)
+        if not session or session.userId != user_id:
+            raise NotFoundException("Interview Session not found")
+
+    async def _get_owned_artifact(self, artifact_id: str, user_id: str):
+        artifact = await self.repo.get_by_id(artifact_id)
+        if not artifact or artifact.session.userId != user_id:
+            raise NotFoundException("Technical Artifact not found")
+        return artifact
+
+    # -------------------------------------------------------------------------
+    # Build the response of an artifact, reading analysis from its blob (or
+    # from the row itself for artifacts stored before blobs). The code is
+    # the row's own copy when it has one, i.e. when it was submitted with
+    # different whitespace than the blob's.
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _to_response(artifact, static_analysis: Optional[dict] = None) -> TechnicalArtifactResponse:
+        source = artifact.blob or artifact
+        code = artifact.codeContent if artifact.codeContent is not None else source.codeContent
+        return TechnicalArtifactResponse(
+            id=artifact.id,
+            sessionId=artifact.sessionId,
+            language=artifact.language,
+            codeContent=code or "",
+            aiAnalysis=source.aiAnalysis,
+            staticAnalysis=static_analysis or getattr(artifact.blob, "staticAnalysis", None),
+            contentHash=artifact.blobHash,
+            analysisStatus="PENDING" if source.aiAnalysis is None else "DONE",
+            createdAt=artifact.createdAt
+        )
+
+    # -------------------------------------------------------------------------
+    # Submit a code artifact for a session.
+    #
+    # Identical code (after normalization) reuses the stored blob and its
+    # analyses; code that differs from the blob's text only in whitespace
+    # is kept verbatim on the artifact. New code gets its static analysis before the response (a
+    # few milliseconds, bounded by STATIC_ANALYSIS_TIMEOUT_SECONDS) and its
+    # AI analysis in the background, with `analysisStatus` PENDING until
+    # then.
+    #
+    # Args:
+    #     user_id (str): The ID of the current user.
+    #     data (TechnicalArtifactCreate): Session, language and code.
+    #
+    # Returns:
+    #     TechnicalArtifactResponse: The stored artifact.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
+    # -------------------------------------------------------------------------
+    async def create_artifact(self, user_id: str, data: TechnicalArtifactCreate) -> TechnicalArtifactResponse:
+        await self._check_owner(data.sessionId, user_id)
+
+        blob, _ = await self.store.put(data.language, data.codeContent)
+        static_analysis = blob.staticAnalysis
+        if static_analysis is None:
+            static_analysis = await self.static_pool.run(blob.language, blob.codeContent)
+            # Timeouts and errors may come from a busy pool rather than the
+            # code, so only OK results are stored; the rest are retried on
+            # the next submission.
+            if static_analysis is not None and static_analysis["status"] == OK:
+                blob = await self.repo.set_blob_static_analysis(blob.hash, static_analysis) or blob
+        artifact_data = {
+            "sessionId": data.sessionId,
+            "language": blob.language,
+            "blobHash": blob.hash
+        }
+        if blob.codeContent != data.codeContent:
+            artifact_data["codeContent"] = data.codeContent
+        artifact = await self.repo.create(artifact_data)
+        if blob.aiAnalysis is None:
+            self.analysis_queue.enqueue(blob.hash)
+        return self._to_response(artifact, static_analysis)
+
+    # -------------------------------------------------------------------------
+    # List the artifacts of one of the user's sessions, oldest first.
+    # -------------------------------------------------------------------------
+    async def list_session_artifacts(self, session_id: str, user_id: str) -> List[TechnicalArtifactResponse]:
+        await self._check_owner(session_id, user_id)
+        artifacts = await self.repo.get_by_session(session_id)
+        return [self._to_response(a) for a in artifacts]
+
+    # -------------------------------------------------------------------------
+    # Retrieve one of the user's artifacts.
+    #
+    # Raises:
+    #     NotFoundException: If not found or owned by another user.
+    # -------------------------------------------------------------------------
+    async def get_artifact(self, artifact_id: str, user_id: str) -> TechnicalArtifactResponse:
+        return self._to_response(await self._get_owned_artifact(artifact_id, user_id))
+
+    # -------------------------------------------------------------------------
+    # Delete one of the user's artifacts. The blob stays for other artifacts
+    # with the same content.
+    #
+    # Raises:
+    #     NotFoundException: If not found or owned by another user.
+    # -------------------------------------------------------------------------
+    async def delete_artifact(self, artifact_id: str, user_id: str):
+        await self._get_owned_artifact(artifact_id, user_id)
+        if not await self.repo.delete(artifact_id):
+            raise NotFoundException("Technical Artifact not found")
+
+    # -------------------------------------------------------------------------
+    # Record the current editor buffer of a live coding round.
+    #
+    # Stored as a line delta against the previous snapshot (with periodic
+    # full keyframes); a buffer identical to the previous one is not stored.
+    #
+    # Args:
+    #     user_id (str): The ID of the current user.
+    #     data (CodeSnapshotCreate): Session, language and full buffer.
+    #
+    # Returns:
+    #     CodeSnapshotResult: The session's latest sequence number.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
+    #     DuplicatedEntityException: If concurrent writes kept taking the
+    #     next sequence number.
+    # -------------------------------------------------------------------------
+    async def save_snapshot(self, user_id: str, data: CodeSnapshotCreate) -> CodeSnapshotResult:
+        await self._check_owner(data.sessionId, user_id)
+        snapshot, seq = await self.snapshot_log.append(data.sessionId, normalize_language(data.language), data.codeContent)
+        return CodeSnapshotResult(
+            sessionId=data.sessionId,
+            seq=seq,
+            stored=snapshot is not None,
+            kind=snapshot.kind if snapshot is not None else None
+        )
+
+    # -------------------------------------------------------------------------
+    # The editor buffer of a session as of a point in time.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     user_id (str): The ID of the current user.
+    #     at (Optional[datetime]): Point in time; the latest buffer if None.
+    #
+    # Returns:
+    #     CodeSnapshotContent: The full text in effect at `at`.
+    #
+    # Raises:
+    #     NotFoundException: If the session is not the user's or had no
+    #         snapshot by then.
+    # -------------------------------------------------------------------------
+    async def get_snapshot(self, session_id: str, user_id: str, at: Optional[datetime] = None) -> CodeSnapshotContent:
+        await self._check_owner(session_id, user_id)
+        result = await self.snapshot_log.reconstruct(session_id, at)
+        if result is None:
+            raise NotFoundException("Code Snapshot not found")
+        snapshot, code = result
+        return CodeSnapshotContent(
+            sessionId=session_id,
+            seq=snapshot.seq,
+            language=snapshot.language,
+            codeContent=code,
+            createdAt=snapshot.createdAt
+        )
+
+    # -------------------------------------------------------------------------
+    # Every snapshot of a session (without content), for replay scrubbing.
+    # -------------------------------------------------------------------------
+    async def get_snapshot_timeline(self, session_id: str, user_id: str) -> List[CodeSnapshotInfo]:
+        await self._check_owner(session_id, user_id)
+        rows = await self.repo.get_snapshot_timeline(session_id)
+        return [CodeSnapshotInfo.model_validate(row) for row in rows]
+
+    # -------------------------------------------------------------------------
+    # Content and analysis cache hit counters of this worker.
+    #
+    # Raises:
+    #     ForbiddenException: If the user is not an admin.
+    # -------------------------------------------------------------------------
+    async def get_cache_stats(self, user_id: str) -> ArtifactCacheStats:
+        user = await self.repo.get_user(user_id)
+        if not user or user.role not in ARTIFACT_STATS_ROLES:
+            raise ForbiddenException("Cache stats require the ADMIN role")
+        return ArtifactCacheStats(
+            **self.store.stats(),
+            analysisQueueDepth=self.analysis_queue.stats()["queueDepth"]
+        )
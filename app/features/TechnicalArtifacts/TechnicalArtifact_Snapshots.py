@@ -0,0 +1,199 @@
+import asyncio
+import difflib
+import json
+import os
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from prisma.errors import UniqueViolationError
+from app.features.TechnicalArtifacts.TechnicalArtifact_Reponsitory import TechnicalArtifactRepository
+from app.shared.exceptions import DuplicatedEntityException
+
+# A keyframe at least every this many snapshots bounds a read to one
+# keyframe plus this many deltas.
+SNAPSHOT_KEYFRAME_INTERVAL = int(os.getenv("SNAPSHOT_KEYFRAME_INTERVAL", "32"))
+# A delta larger than this share of the full text is stored as a keyframe.
+SNAPSHOT_KEYFRAME_RATIO = float(os.getenv("SNAPSHOT_KEYFRAME_RATIO", "0.5"))
+# Live sessions whose latest snapshot is kept in memory for diffing.
+SNAPSHOT_CACHE_SESSIONS = int(os.getenv("SNAPSHOT_CACHE_SESSIONS", "2048"))
+# Attempts at an append whose sequence number another worker keeps taking.
+SNAPSHOT_APPEND_ATTEMPTS = int(os.getenv("SNAPSHOT_APPEND_ATTEMPTS", "3"))
+
+KEYFRAME = "KEYFRAME"
+DELTA = "DELTA"
+
+_LOCK_STRIPES = 64
+
+# -------------------------------------------------------------------------
+# Line-level edit script turning `old` into `new`.
+#
+# Only changed regions are kept, as [start, end, replacement lines] against
+# `old` (lines keep their line endings, so joining is lossless).
+# -------------------------------------------------------------------------
+def diff_lines(old: List[str], new: List[str]) -> list:
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    return [[i1, i2, new[j1:j2]] for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+def apply_delta(old: List[str], ops: list) -> List[str]:
+    result = []
+    position = 0
+    for start, end, lines in ops:
+        result.extend(old[position:start])
+        result.extend(lines)
+        position = end
+    result.extend(old[position:])
+    return result
+
+class _Head:
+    __slots__ = ("seq", "lines", "language", "since_keyframe")
+
+    def __init__(self, seq: int, lines: List[str], language: str, since_keyframe: int):
+        self.seq = seq
+        self.lines = lines
+        self.language = language
+        self.since_keyframe = since_keyframe
+
+class CodeSnapshotLog:
+    # -------------------------------------------------------------------------
+    # Append-only log of editor snapshots per session, stored as keyframes
+    # (full text) and line deltas against the previous snapshot.
+    #
+    # The latest snapshot of each live session is kept in memory, so an
+    # append diffs against it without reading the database; after a restart
+    # (or when another worker appended) it is rebuilt from the last keyframe.
+    # An unchanged buffer is not stored again. Appends to one session are
+    # serialized; a sequence clash with another worker reloads the head and
+    # retries, up to `append_attempts` times in all.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        repo: TechnicalArtifactRepository,
+        keyframe_interval: int = SNAPSHOT_KEYFRAME_INTERVAL,
+        keyframe_ratio: float = SNAPSHOT_KEYFRAME_RATIO,
+        cache_sessions: int = SNAPSHOT_CACHE_SESSIONS,
+        append_attempts: int = SNAPSHOT_APPEND_ATTEMPTS
+    ):
+        self.repo = repo
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.keyframe_ratio = keyframe_ratio
+        self.cache_sessions = cache_sessions
+        self.append_attempts = max(1, append_attempts)
+        self._heads: "OrderedDict[str, _Head]" = OrderedDict()
+        self._locks = [asyncio.Lock() for _ in range(_LOCK_STRIPES)]
+
+    def _lock(self, session_id: str) -> asyncio.Lock:
+        return self._locks[zlib.crc32(session_id.encode()) % _LOCK_STRIPES]
+
+    # -------------------------------------------------------------------------
+    # Rebuild a session's text from its snapshots.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     at (Optional[datetime]): Point in time; the latest snapshot if None.
+    #
+    # Returns:
+    #     Optional[Tuple[object, List[str], int]]: The last snapshot applied,
+    #     the text as lines and the number of deltas since its keyframe; None
+    #     if there is no snapshot by then.
+    # -------------------------------------------------------------------------
+    async def _rebuild(self, session_id: str, at: Optional[datetime] = None) -> Optional[Tuple[object, List[str], int]]:
+        keyframe = await self.repo.get_latest_keyframe(session_id, at)
+        if keyframe is None:
+            return None
+        snapshots = await self.repo.get_snapshots_from(session_id, keyframe.seq, at)
+        lines: List[str] = []
+        for snapshot in snapshots:
+            if snapshot.kind == KEYFRAME:
+                lines = snapshot.data.splitlines(keepends=True)
+            else:
+                lines = apply_delta(lines, json.loads(snapshot.data))
+        return snapshots[-1], lines, len(snapshots) - 1
+
+    async def _get_head(self, session_id: str) -> Optional[_Head]:
+        head = self._heads.get(session_id)
+        if head is not None:
+            self._heads.move_to_end(session_id)
+            return head
+        rebuilt = await self._rebuild(session_id)
+        if rebuilt is None:
+            return None
+        last, lines, since_keyframe = rebuilt
+        return self._remember(session_id, _Head(last.seq, lines, last.language, since_keyframe))
+
+    def _remember(self, session_id: str, head: _Head) -> _Head:
+        self._heads[session_id] = head
+        self._heads.move_to_end(session_id)
+        while len(self._heads) > self.cache_sessions:
+            self._heads.popitem(last=False)
+        return head
+
+    async def _append(self, session_id: str, language: str, code: str) -> Tuple[Optional[object], int]:
+        head = await self._get_head(session_id)
+        lines = code.splitlines(keepends=True)
+        if head is not None and head.language == language and head.lines == lines:
+            return None, head.seq
+
+        seq = head.seq + 1 if head is not None else 1
+        kind, data = KEYFRAME, code
+        if head is not None and head.language == language and head.since_keyframe + 1 < self.keyframe_interval:
+            delta = json.dumps(diff_lines(head.lines, lines), separators=(",", ":"))
+            if len(delta) <= self.keyframe_ratio * max(len(code), 1):
+                kind, data = DELTA, delta
+
+        snapshot = await self.repo.create_snapshot({
+            "sessionId": session_id,
+            "seq": seq,
+            "kind": kind,
+            "language": language,
+            "data": data,
+            "size": len(code),
+            "createdAt": datetime.now(timezone.utc)
+        })
+        since_keyframe = 0 if kind == KEYFRAME else head.since_keyframe + 1
+        self._remember(session_id, _Head(seq, lines, language, since_keyframe))
+        return snapshot, seq
+
+    # -------------------------------------------------------------------------
+    # Append the current editor buffer of a session.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     language (str): Normalized language name.
+    #     code (str): The full buffer.
+    #
+    # Returns:
+    #     Tuple[Optional[CodeSnapshot], int]: The stored snapshot (None when
+    #     the buffer is unchanged) and the session's latest sequence number.
+    #
+    # Raises:
+    #     DuplicatedEntityException: If other workers took the next sequence
+    #     number on every attempt.
+    # -------------------------------------------------------------------------
+    async def append(self, session_id: str, language: str, code: str) -> Tuple[Optional[object], int]:
+        async with self._lock(session_id):
+            for _ in range(self.append_attempts):
+                try:
+                    return await self._append(session_id, language, code)
+                except UniqueViolationError:
+                    self._heads.pop(session_id, None)
+            raise DuplicatedEntityException("Snapshot conflicts with concurrent writes to this session; retry")
+
+    # -------------------------------------------------------------------------
+    # The buffer as it was at a point in time.
+    #
+    # Returns:
+    #     Optional[Tuple[CodeSnapshot, str]]: The snapshot in effect and its
+    #     full text; None if no snapshot existed yet.
+    # -------------------------------------------------------------------------
+    async def reconstruct(self, session_id: str, at: Optional[datetime] = None) -> Optional[Tuple[object, str]]:
+        rebuilt = await self._rebuild(session_id, at)
+        if rebuilt is None:
+            return None
+        last, lines, _ = rebuilt
+        return last, "".join(lines)
+
+
+# Process-wide log, shared by every request of this worker.
+code_snapshot_log = CodeSnapshotLog(TechnicalArtifactRepository())
@@ -0,0 +1,270 @@
+import ast
+import asyncio
+import builtins
+import importlib
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from app.shared.workers import worker_share
+
+logger = logging.getLogger(__name__)
+
+# Processes per web worker; by default this worker's share of the CPUs.
+STATIC_ANALYSIS_WORKERS = int(os.getenv("STATIC_ANALYSIS_WORKERS", str(min(2, worker_share(os.cpu_count() or 1)))))
+STATIC_ANALYSIS_TIMEOUT_SECONDS = float(os.getenv("STATIC_ANALYSIS_TIMEOUT_SECONDS", "2"))
+STATIC_ANALYSIS_MEMORY_MB = int(os.getenv("STATIC_ANALYSIS_MEMORY_MB", "512"))
+STATIC_ANALYSIS_MAX_QUEUE = int(os.getenv("STATIC_ANALYSIS_MAX_QUEUE", "64"))
+# Extra analyzers as "language=package.module:function,...". Loaded at import
+# time, so the pool's worker processes see them too.
+STATIC_ANALYZERS_EXTRA = os.getenv("STATIC_ANALYZERS", "")
+
+# Functions above this cyclomatic complexity get a lint finding.
+MAX_FUNCTION_COMPLEXITY = 10
+
+OK = "OK"
+TIMEOUT = "TIMEOUT"
+ERROR = "ERROR"
+
+# language -> fn(code) -> {"parseOk", "metrics", "findings"}. Functions must
+# be importable module-level callables so worker processes can run them.
+STATIC_ANALYZERS: Dict[str, Callable[[str], dict]] = {}
+
+def register_static_analyzer(language: str):
+    def decorator(fn: Callable[[str], dict]) -> Callable[[str], dict]:
+        STATIC_ANALYZERS[language] = fn
+        return fn
+    return decorator
+
+def _finding(node, code: str, message: str) -> dict:
+    return {"line": getattr(node, "lineno", 0), "code": code, "message": message}
+
+# Nodes that add a decision point to the cyclomatic complexity.
+_BRANCH_NODES = (ast.If, ast.IfExp, ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler, ast.Assert, ast.comprehension, ast.match_case)
+
+_SCOPE_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+
+# -------------------------------------------------------------------------
+# McCabe complexity: 1 + decision points. With `own_scope_only`, nested
+# functions are left out (they are measured on their own).
+# -------------------------------------------------------------------------
+def _complexity(node, own_scope_only: bool = False) -> int:
+    score = 1
+    stack = list(ast.iter_child_nodes(node))
+    while stack:
+        child = stack.pop()
+        if own_scope_only and isinstance(child, _SCOPE_NODES):
+            continue
+        if isinstance(child, _BRANCH_NODES):
+            score += 1 + (len(child.ifs) if isinstance(child, ast.comprehension) else 0)
+        elif isinstance(child, ast.BoolOp):
+            score += len(child.values) - 1
+        stack.extend(ast.iter_child_nodes(child))
+    return score
+
+# -------------------------------------------------------------------------
+# Python metrics and lint findings from the `ast` module.
+#
+# Metrics: lines, functions, classes, complexity (McCabe number of the
+# whole file) and maxFunctionComplexity. Findings: bare except, mutable
+# default arguments, comparisons to None with ==/!=, wildcard and unused
+# imports, shadowed builtins and overly complex functions.
+# -------------------------------------------------------------------------
+@register_static_analyzer("python")
+def analyze_python(code: str) -> dict:
+    lines = code.count("\n") + (1 if code and not code.endswith("\n") else 0)
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return {
+            "parseOk": False,
+            "metrics": {"lines": lines},
+            "findings": [{"line": e.lineno or 0, "code": "syntax-error", "message": e.msg}]
+        }
+
+    findings: List[dict] = []
+    functions = [n for n in ast.walk(tree) if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    classes = sum(1 for n in ast.walk(tree) if isinstance(n, ast.ClassDef))
+    complexities = {}
+    for fn in functions:
+        complexities[fn] = _complexity(fn, own_scope_only=True)
+        if complexities[fn] > MAX_FUNCTION_COMPLEXITY:
+            findings.append(_finding(fn, "too-complex", f"'{fn.name}' has complexity {complexities[fn]}"))
+        for default in fn.args.defaults + [d for d in fn.args.kw_defaults if d is not None]:
+            if isinstance(default, (ast.List, ast.Dict, ast.Set)):
+                findings.append(_finding(default, "mutable-default", f"Mutable default argument in '{fn.name}'"))
+        if fn.name in vars(builtins):
+            findings.append(_finding(fn, "shadowed-builtin", f"Function '{fn.name}' shadows a builtin"))
+
+    imported: Dict[str, ast.AST] = {}
+    used = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ExceptHandler) and node.type is None:
+            findings.append(_finding(node, "bare-except", "Bare 'except:' catches every exception"))
+        elif isinstance(node, ast.Compare):
+            for op, right in zip(node.ops, node.comparators):
+                if isinstance(op, (ast.Eq, ast.NotEq)) and isinstance(right, ast.Constant) and right.value is None:
+                    findings.append(_finding(node, "none-comparison", "Use 'is None' / 'is not None'"))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    findings.append(_finding(node, "wildcard-import", f"Wildcard import from '{node.module}'"))
+                else:
+                    imported[(alias.asname or alias.name).split(".")[0]] = node
+        elif isinstance(node, ast.Name):
+            used.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            root = node
+            while isinstance(root, ast.Attribute):
+                root = root.value
+            if isinstance(root, ast.Name):
+                used.add(root.id)
+    for name, node in imported.items():
+        if name not in used:
+            findings.append(_finding(node, "unused-import", f"'{name}' is imported but unused"))
+
+    findings.sort(key=lambda f: (f["line"], f["code"]))
+    return {
+        "parseOk": True,
+        "metrics": {
+            "lines": lines,
+            "functions": len(functions),
+            "classes": classes,
+            "complexity": _complexity(tree),
+            "maxFunctionComplexity": max(complexities.values(), default=0)
+        },
+        "findings": findings
+    }
+
+def _load_extra_analyzers():
+    for entry in filter(None, (part.strip() for part in STATIC_ANALYZERS_EXTRA.split(","))):
+        language, _, target = entry.partition("=")
+        module_name, _, fn_name = target.partition(":")
+        STATIC_ANALYZERS[language.strip().lower()] = getattr(importlib.import_module(module_name), fn_name)
+
+_load_extra_analyzers()
+
+# -------------------------------------------------------------------------
+# Worker process initializer: cap the address space so one pathological
+# input cannot take the host down (MemoryError in the job instead).
+# -------------------------------------------------------------------------
+def _limit_memory(memory_mb: int):
+    if resource is not None and memory_mb > 0:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def _run_analyzer(language: str, code: str) -> dict:
+    started = time.perf_counter()
+    try:
+        result = {"status": OK, **STATIC_ANALYZERS[language](code)}
+    except MemoryError:
+        result = {"status": ERROR, "error": "Memory limit exceeded"}
+    except Exception as e:
+        result = {"status": ERROR, "error": f"{type(e).__name__}: {e}"}
+    result["durationMs"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+class StaticAnalysisPool:
+    # -------------------------------------------------------------------------
+    # Runs static analyzers in a pool of worker processes.
+    #
+    # - Parsing and walking an AST is pure CPU work; in a process it never
+    #   blocks the event loop that serves live sessions.
+    # - Each worker's address space is capped at `memory_mb` (RLIMIT_AS,
+    #   where available).
+    # - Jobs wait here until a worker is free and only then go to the
+    #   executor, so each one starts running as soon as it is submitted.
+    # - A job not finished `timeout` seconds after it started has its pool
+    #   torn down, the only way to stop a stuck worker, and a fresh pool is
+    #   started; the other jobs that were running report ERROR, the waiting
+    #   ones are unaffected.
+    # - At most `workers + max_queue` jobs are in flight; beyond that `run`
+    #   returns None rather than queueing without bound.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        workers: int = STATIC_ANALYSIS_WORKERS,
+        timeout: float = STATIC_ANALYSIS_TIMEOUT_SECONDS,
+        memory_mb: int = STATIC_ANALYSIS_MEMORY_MB,
+        max_queue: int = STATIC_ANALYSIS_MAX_QUEUE
+    ):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inflight = 0
+        self._slots = asyncio.Semaphore(self.workers)
+
+    def supports(self, language: str) -> bool:
+        return language in STATIC_ANALYZERS
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_limit_memory,
+                initargs=(self.memory_mb,)
+            )
+        return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor):
+        if self._executor is not executor:
+            return
+        self._executor = None
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------------------------------------------------------
+    # Analyze code with the analyzer registered for its language.
+    #
+    # Args:
+    #     language (str): Normalized language name.
+    #     code (str): The code.
+    #
+    # Returns:
+    #     Optional[dict]: status (OK, TIMEOUT or ERROR), parseOk, metrics,
+    #     findings and durationMs; None if the language has no analyzer or
+    #     the pool is saturated.
+    # -------------------------------------------------------------------------
+    async def run(self, language: str, code: str) -> Optional[dict]:
+        if not self.supports(language):
+            return None
+        if self._inflight >= self.workers + self.max_queue:
+            logger.warning("Static analysis pool saturated; skipping %s artifact", language)
+            return None
+
+        self._inflight += 1
+        try:
+            async with self._slots:
+                executor = self._get_executor()
+                try:
+                    future = asyncio.get_running_loop().run_in_executor(executor, _run_analyzer, language, code)
+                    return await asyncio.wait_for(future, self.timeout)
+                except asyncio.TimeoutError:
+                    self._recycle(executor)
+                    return {"status": TIMEOUT, "error": f"Analysis exceeded {self.timeout:g}s"}
+                except BrokenProcessPool:
+                    self._recycle(executor)
+                    return {"status": ERROR, "error": "Analysis worker crashed"}
+        finally:
+            self._inflight -= 1
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# Process-wide pool; shut down by the lifespan in app/main.py.
+static_analysis_pool = StaticAnalysisPool()
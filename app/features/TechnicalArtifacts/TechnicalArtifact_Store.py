@@ -0,0 +1,111 @@
+import hashlib
+from typing import Optional, Tuple
+from prisma.models import ArtifactBlob
+from app.features.TechnicalArtifacts.TechnicalArtifact_Reponsitory import TechnicalArtifactRepository
+
+# -------------------------------------------------------------------------
+# Normalize code so trivially different submissions share a blob.
+#
+# Line endings become "\n", trailing whitespace and leading/trailing blank
+# lines are dropped. Only used for the content address: trailing
+# whitespace can matter (multi-line strings, Markdown), so the code itself
+# is always stored as submitted.
+# -------------------------------------------------------------------------
+def normalize_code(code: str) -> str:
+    lines = [line.rstrip() for line in code.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
+    while lines and not lines[0]:
+        lines.pop(0)
+    while lines and not lines[-1]:
+        lines.pop()
+    return "\n".join(lines) + "\n" if lines else ""
+
+def normalize_language(language: str) -> str:
+    return language.strip().lower()
+
+# -------------------------------------------------------------------------
+# Content address of normalized code: SHA-256 over language and code, so
+# the same text in two languages gets two blobs (and two analyses).
+# -------------------------------------------------------------------------
+def content_hash(language: str, normalized_code: str) -> str:
+    return hashlib.sha256(f"{language}\0{normalized_code}".encode()).hexdigest()
+
+class ArtifactStore:
+    # -------------------------------------------------------------------------
+    # Content-addressed storage of artifact code.
+    #
+    # Each distinct (language, normalized code) is stored once as an
+    # ArtifactBlob holding the first submission verbatim; artifacts
+    # reference it by hash, and the blob's analyses are shared by every
+    # artifact with the same normalized content.
+    #
+    # Hit/miss counters cover this worker process.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, repo: TechnicalArtifactRepository):
+        self.repo = repo
+        self._submissions = 0
+        self._content_hits = 0
+        self._bytes_deduplicated = 0
+        self._analysis_hits = 0
+        self._analysis_runs = 0
+        self._analysis_skipped = 0
+
+    # -------------------------------------------------------------------------
+    # Store code, reusing the blob of identical content.
+    #
+    # Args:
+    #     language (str): The code's language.
+    #     code (str): The submitted code.
+    #
+    # Returns:
+    #     Tuple[ArtifactBlob, bool]: The blob and whether it already existed.
+    #     An existing blob's `codeContent` may differ from `code` in
+    #     whitespace; the caller then keeps `code` on the artifact.
+    # -------------------------------------------------------------------------
+    async def put(self, language: str, code: str) -> Tuple[ArtifactBlob, bool]:
+        language = normalize_language(language)
+        digest = content_hash(language, normalize_code(code))
+
+        self._submissions += 1
+        blob = await self.repo.get_blob(digest)
+        if blob is not None:
+            self._content_hits += 1
+            if blob.codeContent == code:
+                self._bytes_deduplicated += len(code.encode())
+            if blob.aiAnalysis is not None:
+                self._analysis_hits += 1
+            return blob, True
+
+        blob = await self.repo.create_blob({"hash": digest, "language": language, "codeContent": code})
+        return blob, False
+
+    # -------------------------------------------------------------------------
+    # Count one call of the (expensive) analyzer.
+    # -------------------------------------------------------------------------
+    def record_analysis_run(self):
+        self._analysis_runs += 1
+
+    def record_analysis_skipped(self):
+        self._analysis_skipped += 1
+
+    def stats(self) -> dict:
+        misses = self._submissions - self._content_hits
+        return {
+            "submissions": self._submissions,
+            "contentHits": self._content_hits,
+            "contentMisses": misses,
+            "contentHitRatio": self._ratio(self._content_hits, self._submissions),
+            "bytesDeduplicated": self._bytes_deduplicated,
+            "analysisHits": self._analysis_hits,
+            "analysisRuns": self._analysis_runs,
+            "analysisSkipped": self._analysis_skipped,
+            "analysisHitRatio": self._ratio(self._analysis_hits, self._analysis_hits + self._analysis_runs)
+        }
+
+    @staticmethod
+    def _ratio(part: int, whole: int) -> Optional[float]:
+        return part / whole if whole else None
+
+
+# Process-wide store, shared by the service and the analysis jobs.
+artifact_store = ArtifactStore(TechnicalArtifactRepository())
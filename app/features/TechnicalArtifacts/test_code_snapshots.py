@@ -0,0 +1,108 @@
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import pytest
+from prisma.errors import UniqueViolationError
+from app.features.TechnicalArtifacts.TechnicalArtifact_Snapshots import DELTA, KEYFRAME, CodeSnapshotLog, apply_delta, diff_lines
+from app.shared.exceptions import DuplicatedEntityException
+
+class FakeSnapshotRepo:
+    # In-memory CodeSnapshot table with the repository's query semantics.
+    def __init__(self):
+        self.rows = []
+        self.taken = 0
+
+    async def create_snapshot(self, data):
+        if self.taken:
+            # Another worker appends first.
+            self.taken -= 1
+            self.rows.append(SimpleNamespace(**{**data, "kind": KEYFRAME, "data": "other\n"}))
+            raise UniqueViolationError({"user_facing_error": {"message": "seq taken"}})
+        row = SimpleNamespace(**data)
+        self.rows.append(row)
+        return row
+
+    def _visible(self, session_id, at):
+        return [r for r in self.rows if r.sessionId == session_id and (at is None or r.createdAt <= at)]
+
+    async def get_latest_keyframe(self, session_id, at=None):
+        keyframes = [r for r in self._visible(session_id, at) if r.kind == KEYFRAME]
+        return max(keyframes, key=lambda r: r.seq) if keyframes else None
+
+    async def get_snapshots_from(self, session_id, from_seq, at=None):
+        return sorted((r for r in self._visible(session_id, at) if r.seq >= from_seq), key=lambda r: r.seq)
+
+def _random_lines(rng, n):
+    return [f"line {rng.randrange(20)}\n" for _ in range(n)]
+
+def _edit(rng, lines):
+    lines = list(lines)
+    for _ in range(rng.randint(0, 4)):
+        op = rng.random()
+        position = rng.randint(0, len(lines))
+        if op < 0.4:
+            lines[position:position] = _random_lines(rng, rng.randint(1, 3))
+        elif op < 0.7 and lines:
+            del lines[position:position + rng.randint(1, 3)]
+        elif lines:
+            lines[min(position, len(lines) - 1)] = f"changed {rng.random()}\n"
+    return lines
+
+def test_delta_round_trip():
+    rng = random.Random(5)
+    for _ in range(500):
+        old = _random_lines(rng, rng.randint(0, 30))
+        new = _edit(rng, old) if rng.random() < 0.8 else _random_lines(rng, rng.randint(0, 30))
+        assert apply_delta(old, diff_lines(old, new)) == new
+
+def test_unchanged_text_has_an_empty_delta():
+    lines = ["a\n", "b\n"]
+    assert diff_lines(lines, lines) == []
+    assert apply_delta(lines, []) == lines
+
+def test_reconstruct_matches_every_version_at_its_time():
+    rng = random.Random(11)
+    repo = FakeSnapshotRepo()
+    log = CodeSnapshotLog(repo, keyframe_interval=4, cache_sessions=1)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    versions = []
+    lines = _random_lines(rng, 20)
+    for i in range(40):
+        lines = _edit(rng, lines)
+        code = "".join(lines) + ("" if i % 7 else "no trailing newline")
+        snapshot, _ = asyncio.run(log.append("s1", "python", code))
+        if snapshot is not None:
+            snapshot.createdAt = start + timedelta(seconds=i)
+            versions.append((snapshot.createdAt, code))
+        if i % 5 == 0:
+            # Evict the cached head so appends also diff against rebuilt text.
+            asyncio.run(log.append("other", "python", str(i)))
+
+    kinds = {r.kind for r in repo.rows if r.sessionId == "s1"}
+    assert kinds == {KEYFRAME, DELTA}
+    assert asyncio.run(log.reconstruct("s1", start - timedelta(seconds=1))) is None
+    for created_at, code in versions:
+        for at in (created_at, created_at + timedelta(milliseconds=500)):
+            _, text = asyncio.run(log.reconstruct("s1", at))
+            assert text == code
+    _, latest = asyncio.run(log.reconstruct("s1"))
+    assert latest == versions[-1][1]
+
+def test_sequence_clash_is_retried_with_a_reloaded_head():
+    repo = FakeSnapshotRepo()
+    log = CodeSnapshotLog(repo, append_attempts=3)
+    asyncio.run(log.append("s1", "python", "a\n"))
+
+    repo.taken = 2
+    snapshot, seq = asyncio.run(log.append("s1", "python", "a\nb\n"))
+    assert seq == 4
+    assert [r.seq for r in repo.rows] == [1, 2, 3, 4]
+
+def test_repeated_sequence_clashes_are_a_conflict():
+    repo = FakeSnapshotRepo()
+    log = CodeSnapshotLog(repo, append_attempts=2)
+    repo.taken = 2
+    with pytest.raises(DuplicatedEntityException):
+        asyncio.run(log.append("s1", "python", "a\n"))
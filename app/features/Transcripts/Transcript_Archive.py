@@ -0,0 +1,167 @@
+import heapq
+import os
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Iterable, List, Optional
+from uuid import UUID
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Codec for new archives: zstd when the optional `zstandard` package is
+# installed, zlib otherwise. Each archive records its own codec, so changing
+# this never affects reading existing archives.
+TRANSCRIPT_ARCHIVE_CODEC = os.getenv("TRANSCRIPT_ARCHIVE_CODEC", "zstd" if zstandard is not None else "zlib")
+TRANSCRIPT_ARCHIVE_LEVEL = int(os.getenv("TRANSCRIPT_ARCHIVE_LEVEL", "9"))
+
+_MAGIC = b"TRA1"
+_HEADER = struct.Struct("<4sI")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ROLES = ("USER", "BOT")
+
+# -------------------------------------------------------------------------
+# Serialize transcript rows into one columnar block.
+#
+# Layout after the header (magic, row count), all little-endian:
+#     ids        n x 16 bytes (UUID)
+#     createdAt  n x int64 microseconds since the epoch, delta-encoded
+#     role       n x uint8 (0 = USER, 1 = BOT)
+#     latencyMs  n x int32 (-1 = null)
+#     lengths    n x uint32 UTF-8 byte length of each content
+#     contents   concatenated UTF-8
+#
+# Grouping each column keeps similar bytes together, which compresses far
+# better than row-by-row; contents are length-prefixed via the lengths
+# column, so no escaping is needed.
+# -------------------------------------------------------------------------
+def pack_rows(rows: List[dict]) -> bytes:
+    n = len(rows)
+    micros = [(row["createdAt"] - _EPOCH) // timedelta(microseconds=1) for row in rows]
+    deltas = [micros[0]] + [b - a for a, b in zip(micros, micros[1:])] if n else []
+    contents = [row["content"].encode() for row in rows]
+    latencies = [-1 if row.get("latencyMs") is None else row["latencyMs"] for row in rows]
+    return b"".join([
+        _HEADER.pack(_MAGIC, n),
+        b"".join(UUID(row["id"]).bytes for row in rows),
+        struct.pack(f"<{n}q", *deltas),
+        bytes(_ROLES.index(row["role"]) for row in rows),
+        struct.pack(f"<{n}i", *latencies),
+        struct.pack(f"<{n}I", *(len(c) for c in contents)),
+        *contents
+    ])
+
+# -------------------------------------------------------------------------
+# Inverse of `pack_rows`.
+#
+# Raises:
+#     ValueError: If the block is not a transcript archive.
+# -------------------------------------------------------------------------
+def unpack_rows(block: bytes, session_id: str) -> List[dict]:
+    magic, n = _HEADER.unpack_from(block)
+    if magic != _MAGIC:
+        raise ValueError("Not a transcript archive block")
+    offset = _HEADER.size
+    ids = [str(UUID(bytes=block[offset + 16 * i:offset + 16 * (i + 1)])) for i in range(n)]
+    offset += 16 * n
+    deltas = struct.unpack_from(f"<{n}q", block, offset)
+    offset += 8 * n
+    roles = block[offset:offset + n]
+    offset += n
+    latencies = struct.unpack_from(f"<{n}i", block, offset)
+    offset += 4 * n
+    lengths = struct.unpack_from(f"<{n}I", block, offset)
+    offset += 4 * n
+
+    rows = []
+    micros = 0
+    for i in range(n):
+        micros += deltas[i]
+        rows.append({
+            "id": ids[i],
+            "sessionId": session_id,
+            "role": _ROLES[roles[i]],
+            "content": block[offset:offset + lengths[i]].decode(),
+            "latencyMs": None if latencies[i] < 0 else latencies[i],
+            "createdAt": _EPOCH + timedelta(microseconds=micros)
+        })
+        offset += lengths[i]
+    return rows
+
+def compress(block: bytes, codec: str = TRANSCRIPT_ARCHIVE_CODEC) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("TRANSCRIPT_ARCHIVE_CODEC is zstd but the zstandard package is not installed")
+        return zstandard.ZstdCompressor(level=TRANSCRIPT_ARCHIVE_LEVEL).compress(block)
+    if codec == "zlib":
+        return zlib.compress(block, TRANSCRIPT_ARCHIVE_LEVEL)
+    raise ValueError(f"Unknown transcript archive codec: {codec}")
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Reading zstd transcript archives requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown transcript archive codec: {codec}")
+
+def _key(row: dict):
+    return row["createdAt"], row["id"]
+
+# -------------------------------------------------------------------------
+# Decode the rows of a TranscriptArchive record, in (createdAt, id) order.
+# -------------------------------------------------------------------------
+def archive_rows(archive) -> List[dict]:
+    rows = unpack_rows(decompress(archive.data.decode(), archive.codec), archive.sessionId)
+    rows.sort(key=_key)
+    return rows
+
+def _in_range(row: dict, since: Optional[datetime], until: Optional[datetime]) -> bool:
+    return (since is None or row["createdAt"] >= since) and (until is None or row["createdAt"] <= until)
+
+# -------------------------------------------------------------------------
+# Rows of many archives in global (createdAt, id) order.
+#
+# Archives must arrive ordered by `firstAt`. A decoded row is only emitted
+# once the next archive starts after it, so at most the archives that
+# overlap in time are held in memory.
+#
+# Args:
+#     pages (AsyncIterator[Iterable]): Pages of TranscriptArchive records.
+#     since (Optional[datetime]): Drop rows created before this.
+#     until (Optional[datetime]): Drop rows created after this.
+# -------------------------------------------------------------------------
+async def iter_archived_rows(pages: AsyncIterator[Iterable], since: Optional[datetime] = None, until: Optional[datetime] = None) -> AsyncIterator[dict]:
+    heap = []
+    async for page in pages:
+        for archive in page:
+            while heap and heap[0][0] < (archive.firstAt, ""):
+                yield heapq.heappop(heap)[1]
+            for row in archive_rows(archive):
+                if _in_range(row, since, until):
+                    heapq.heappush(heap, (_key(row), row))
+    while heap:
+        yield heapq.heappop(heap)[1]
+
+# -------------------------------------------------------------------------
+# Merge two row streams that are each in (createdAt, id) order.
+# -------------------------------------------------------------------------
+async def merge_rows(left: AsyncIterator[dict], right: AsyncIterator[dict]) -> AsyncIterator[dict]:
+    a = await anext(left, None)
+    b = await anext(right, None)
+    while a is not None and b is not None:
+        if _key(a) <= _key(b):
+            yield a
+            a = await anext(left, None)
+        else:
+            yield b
+            b = await anext(right, None)
+    while a is not None:
+        yield a
+        a = await anext(left, None)
+    while b is not None:
+        yield b
+        b = await anext(right, None)
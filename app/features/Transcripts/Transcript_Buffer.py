@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, List, Optional
+from prisma.errors import DataError
+from app.features.Transcripts.Transcript_Reponsitory import TranscriptRepository
+from app.shared.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_BUFFER_MAX_BATCH = int(os.getenv("TRANSCRIPT_BUFFER_MAX_BATCH", "500"))
+TRANSCRIPT_BUFFER_FLUSH_INTERVAL_MS = float(os.getenv("TRANSCRIPT_BUFFER_FLUSH_INTERVAL_MS", "250"))
+TRANSCRIPT_BUFFER_MAX_PENDING = int(os.getenv("TRANSCRIPT_BUFFER_MAX_PENDING", "20000"))
+
+class TranscriptWriteBuffer:
+    # -------------------------------------------------------------------------
+    # Write-behind buffer for transcript rows.
+    #
+    # Rows from every active session are collected in memory and written with a
+    # single `create_many` once `max_batch` rows are pending or `flush_interval`
+    # has elapsed, whichever comes first. When `max_pending` rows are waiting
+    # (e.g. the database is slow), `add` flushes inline so producers feel
+    # backpressure instead of growing the queue without bound.
+    #
+    # A batch rejected for its data (e.g. a row whose session was deleted)
+    # is split in halves until the offending rows are isolated; those are
+    # dropped and logged, the rest is written. Any other error (database
+    # unreachable) keeps the batch queued for the next flush.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[dict]], Awaitable[int]],
+        max_batch: int = TRANSCRIPT_BUFFER_MAX_BATCH,
+        flush_interval_ms: float = TRANSCRIPT_BUFFER_FLUSH_INTERVAL_MS,
+        max_pending: int = TRANSCRIPT_BUFFER_MAX_PENDING
+    ):
+        self.flush_fn = flush_fn
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max(max_pending, max_batch)
+
+        self._pending: List[dict] = []
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._flush_count = 0
+        self._failed_flush_count = 0
+        self._rows_flushed = 0
+        self._rows_dropped = 0
+        self._rows_rejected = 0
+        self._last_flush_ms: Optional[float] = None
+        self._total_flush_ms = 0.0
+        self._max_flush_ms: Optional[float] = None
+
+    # -------------------------------------------------------------------------
+    # Start the background flush loop. Called from the application lifespan.
+    # -------------------------------------------------------------------------
+    async def start(self):
+        if self._task is None:
+            self._closed = False
+            self._task = asyncio.create_task(self._run())
+
+    # -------------------------------------------------------------------------
+    # Stop the flush loop and write out everything still pending.
+    #
+    # Rows that cannot be written during shutdown are counted as dropped.
+    # -------------------------------------------------------------------------
+    async def stop(self):
+        self._closed = True
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            self._rows_dropped += len(self._pending)
+            logger.error("Dropping %d transcript rows on shutdown", len(self._pending))
+            self._pending.clear()
+
+    # -------------------------------------------------------------------------
+    # Queue a transcript row for writing.
+    #
+    # Args:
+    #     row (dict): A fully-formed Transcript row, including its `id`.
+    #
+    # Raises:
+    #     ServiceUnavailableException: If the buffer is full and cannot be
+    #         flushed because the database is unreachable.
+    # -------------------------------------------------------------------------
+    async def add(self, row: dict):
+        if len(self._pending) >= self.max_pending:
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Inline transcript flush failed")
+            if len(self._pending) >= self.max_pending:
+                raise ServiceUnavailableException("Transcript storage is unavailable", retry_after=5)
+        self._pending.append(row)
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    # -------------------------------------------------------------------------
+    # Rows of a session that are accepted but not yet written.
+    #
+    # Lets read paths return a session's latest lines before the next flush.
+    # -------------------------------------------------------------------------
+    def pending_for(self, session_id: str) -> List[dict]:
+        return [row for row in self._pending if row["sessionId"] == session_id]
+
+    # -------------------------------------------------------------------------
+    # Drop the pending rows of a deleted session; they could never be
+    # written.
+    # -------------------------------------------------------------------------
+    def discard_session(self, session_id: str):
+        self._pending[:] = [row for row in self._pending if row["sessionId"] != session_id]
+
+    # -------------------------------------------------------------------------
+    # Write a batch, splitting it on data errors to isolate the bad rows.
+    #
+    # Returns:
+    #     int: The number of rows rejected (and dropped).
+    #
+    # Raises:
+    #     Exception: Any non-data error; nothing of the batch was dropped.
+    # -------------------------------------------------------------------------
+    async def _write(self, batch: List[dict]) -> int:
+        try:
+            await self.flush_fn(batch)
+            return 0
+        except DataError as e:
+            if len(batch) == 1:
+                logger.error("Dropping transcript row %s of session %s: %s", batch[0]["id"], batch[0]["sessionId"], e)
+                return 1
+        middle = len(batch) // 2
+        return await self._write(batch[:middle]) + await self._write(batch[middle:])
+
+    # -------------------------------------------------------------------------
+    # Write all pending rows in batches of at most `max_batch`.
+    #
+    # Rows rejected for their data are dropped. On any other failure the
+    # batch is put back at the head of the queue so it is retried on the
+    # next flush, and the error is re-raised.
+    # -------------------------------------------------------------------------
+    async def flush(self):
+        async with self._lock:
+            while self._pending:
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+
+                started = time.perf_counter()
+                try:
+                    rejected = await self._write(batch)
+                except Exception:
+                    self._pending[:0] = batch
+                    self._failed_flush_count += 1
+                    raise
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                self._flush_count += 1
+                self._rows_flushed += len(batch) - rejected
+                self._rows_rejected += rejected
+                self._last_flush_ms = elapsed_ms
+                self._total_flush_ms += elapsed_ms
+                if self._max_flush_ms is None or elapsed_ms > self._max_flush_ms:
+                    self._max_flush_ms = elapsed_ms
+
+    async def _run(self):
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Transcript flush failed, %d rows kept for retry", len(self._pending))
+
+    # -------------------------------------------------------------------------
+    # Snapshot of queue depth and flush latency counters.
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "queueDepth": len(self._pending),
+            "maxBatch": self.max_batch,
+            "flushIntervalMs": self.flush_interval * 1000,
+            "flushCount": self._flush_count,
+            "failedFlushCount": self._failed_flush_count,
+            "rowsFlushed": self._rows_flushed,
+            "rowsDropped": self._rows_dropped,
+            "rowsRejected": self._rows_rejected,
+            "lastFlushMs": self._last_flush_ms,
+            "avgFlushMs": self._total_flush_ms / self._flush_count if self._flush_count else None,
+            "maxFlushMs": self._max_flush_ms
+        }
+
+
+# Process-wide buffer shared by every request; started and drained by the lifespan in app/main.py.
+transcript_buffer = TranscriptWriteBuffer(TranscriptRepository().create_many)
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from app.features.Transcripts.Transcript_Reponsitory import TranscriptRepository
+from app.features.Transcripts.Transcript_Archive import TRANSCRIPT_ARCHIVE_CODEC, archive_rows, compress, pack_rows
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_ARCHIVE_DELAY_SECONDS = float(os.getenv("TRANSCRIPT_ARCHIVE_DELAY_SECONDS", "3600"))
+TRANSCRIPT_ARCHIVE_INTERVAL_SECONDS = float(os.getenv("TRANSCRIPT_ARCHIVE_INTERVAL_SECONDS", "300"))
+TRANSCRIPT_ARCHIVE_BATCH = int(os.getenv("TRANSCRIPT_ARCHIVE_BATCH", "100"))
+
+class TranscriptCompactor:
+    # -------------------------------------------------------------------------
+    # Moves the transcripts of finished sessions into cold storage.
+    #
+    # Every `interval` seconds, sessions that are COMPLETED or FAILED, have
+    # had a report for at least `delay` seconds and still have Transcript
+    # rows are packed into one compressed TranscriptArchive each, and their
+    # rows are deleted. A line written after compaction stays hot until the
+    # next pass folds it into the existing archive, so compaction can be
+    # re-run at any time. Set TRANSCRIPT_ARCHIVE_INTERVAL_SECONDS=0 to
+    # disable the loop.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        repo: TranscriptRepository,
+        delay: float = TRANSCRIPT_ARCHIVE_DELAY_SECONDS,
+        interval: float = TRANSCRIPT_ARCHIVE_INTERVAL_SECONDS,
+        batch_size: int = TRANSCRIPT_ARCHIVE_BATCH
+    ):
+        self.repo = repo
+        self.delay = delay
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Transcript compaction failed")
+
+    # -------------------------------------------------------------------------
+    # Compact one batch of eligible sessions.
+    #
+    # Returns:
+    #     int: The number of sessions compacted.
+    # -------------------------------------------------------------------------
+    async def run_once(self) -> int:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.delay)
+        sessions = await self.repo.get_compaction_candidates(cutoff, self.batch_size)
+        compacted = 0
+        for session in sessions:
+            try:
+                await self.compact_session(session.id)
+                compacted += 1
+            except Exception:
+                logger.exception("Could not compact transcript of session %s", session.id)
+        if compacted:
+            logger.info("Compacted the transcripts of %d sessions", compacted)
+        return compacted
+
+    # -------------------------------------------------------------------------
+    # Fold a session's hot Transcript rows into its archive.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     int: The number of hot rows moved into the archive.
+    # -------------------------------------------------------------------------
+    async def compact_session(self, session_id: str) -> int:
+        return await self.repo.compact_session(session_id, self._build_archive)
+
+    @staticmethod
+    async def _build_archive(archive, hot: list) -> dict:
+        rows = archive_rows(archive) if archive else []
+        archived_ids = {row["id"] for row in rows}
+        rows.extend(
+            {"id": t.id, "role": t.role, "content": t.content, "latencyMs": t.latencyMs, "createdAt": t.createdAt}
+            for t in hot if t.id not in archived_ids
+        )
+        rows.sort(key=lambda row: (row["createdAt"], row["id"]))
+
+        block = pack_rows(rows)
+        return {
+            "codec": TRANSCRIPT_ARCHIVE_CODEC,
+            "lineCount": len(rows),
+            "rawBytes": len(block),
+            "data": await asyncio.to_thread(compress, block),
+            "firstAt": rows[0]["createdAt"],
+            "lastAt": rows[-1]["createdAt"]
+        }
+
+
+# Process-wide compactor; started and stopped by the lifespan in app/main.py.
+transcript_compactor = TranscriptCompactor(TranscriptRepository())
@@ -0,0 +1,12 @@
+from fastapi import Depends
+from app.features.Transcripts.Transcript_Reponsitory import TranscriptRepository
+from app.features.Transcripts.Transcript_Service import TranscriptService
+from app.features.Transcripts.Transcript_Buffer import transcript_buffer
+from app.features.Transcripts.Transcript_Latency import transcript_latency
+from app.features.InterviewSessions.InterviewSession_Lifecycle import session_lifecycle
+
+def get_transcript_repository() -> TranscriptRepository:
+    return TranscriptRepository()
+
+def get_transcript_service(repo: TranscriptRepository = Depends(get_transcript_repository)) -> TranscriptService:
+    return TranscriptService(repo, transcript_buffer, transcript_latency, session_lifecycle)
@@ -0,0 +1,7 @@
+import os
+from app.shared.pubsub import PubSubHub
+
+LIVE_TRANSCRIPT_MAX_QUEUE = int(os.getenv("LIVE_TRANSCRIPT_MAX_QUEUE", "256"))
+
+# Live transcript fan-out, one topic per InterviewSession id.
+transcript_hub = PubSubHub(max_queue=LIVE_TRANSCRIPT_MAX_QUEUE)
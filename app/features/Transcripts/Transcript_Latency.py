@@ -0,0 +1,75 @@
+import os
+from typing import Dict, List, Optional, Tuple
+from app.shared.histogram import LogHistogram, RollingHistogram
+
+TRANSCRIPT_LATENCY_SLOT_SECONDS = int(os.getenv("TRANSCRIPT_LATENCY_SLOT_SECONDS", "60"))
+TRANSCRIPT_LATENCY_SLOTS = int(os.getenv("TRANSCRIPT_LATENCY_SLOTS", "60"))
+TRANSCRIPT_LATENCY_ACCURACY = float(os.getenv("TRANSCRIPT_LATENCY_ACCURACY", "0.01"))
+
+class TranscriptLatencyTracker:
+    # -------------------------------------------------------------------------
+    # Rolling latency histograms per (categoryId, role).
+    #
+    # Fed by every transcript write that carries `latencyMs`, so percentiles
+    # are served from memory instead of scanning the Transcript table. The
+    # numbers cover this worker process only; histograms from several
+    # workers can be combined with `LogHistogram.merge`.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        slot_seconds: int = TRANSCRIPT_LATENCY_SLOT_SECONDS,
+        slots: int = TRANSCRIPT_LATENCY_SLOTS,
+        relative_accuracy: float = TRANSCRIPT_LATENCY_ACCURACY
+    ):
+        self.slot_seconds = slot_seconds
+        self.slots = slots
+        self.relative_accuracy = relative_accuracy
+        self._series: Dict[Tuple[str, str], RollingHistogram] = {}
+
+    @property
+    def max_window(self) -> int:
+        return self.slot_seconds * self.slots
+
+    def record(self, category_id: str, role: str, latency_ms: float):
+        key = (category_id, role)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = RollingHistogram(self.slot_seconds, self.slots, self.relative_accuracy)
+        series.record(latency_ms)
+
+    # -------------------------------------------------------------------------
+    # Latency percentiles over the last `window_seconds`.
+    #
+    # Args:
+    #     window_seconds (float): Window length, capped at `max_window`.
+    #     category_id (Optional[str]): Only this category.
+    #     role (Optional[str]): Only this role.
+    #
+    # Returns:
+    #     List[dict]: One summary per matching (categoryId, role) with data
+    #     in the window, plus `categoryId: None` / `role: None` totals when
+    #     more than one series matched.
+    # -------------------------------------------------------------------------
+    def summarize(self, window_seconds: float, category_id: Optional[str] = None, role: Optional[str] = None) -> List[dict]:
+        entries = []
+        total = LogHistogram(self.relative_accuracy)
+        for (series_category, series_role), series in list(self._series.items()):
+            if category_id is not None and series_category != category_id:
+                continue
+            if role is not None and series_role != role:
+                continue
+            histogram = series.window(window_seconds)
+            if not histogram.count:
+                continue
+            total.merge(histogram)
+            entries.append({"categoryId": series_category, "role": series_role, **histogram.summary()})
+
+        entries.sort(key=lambda e: (e["categoryId"], e["role"]))
+        if len(entries) > 1:
+            entries.append({"categoryId": category_id, "role": role, **total.summary()})
+        return entries
+
+
+# Process-wide tracker updated by TranscriptService.add_transcript.
+transcript_latency = TranscriptLatencyTracker()
@@ -0,0 +1,166 @@
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional
+from prisma import Base64
+from prisma.models import InterviewSession, Transcript, TranscriptArchive, User
+from app.shared.database import db
+from app.shared.utils.pagination import KEYSET_ORDER_ASC
+
+class TranscriptRepository:
+    # -------------------------------------------------------------------------
+    # Repository for handling Transcript-related database operations.
+    # -------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------
+    # Insert a batch of transcript rows in a single round-trip.
+    #
+    # Rows whose id already exists are skipped, so re-sending a batch that
+    # was partly written is harmless.
+    #
+    # Args:
+    #     rows (List[dict]): Fully-formed rows (id, sessionId, role, content, ...).
+    #
+    # Returns:
+    #     int: The number of rows inserted.
+    # -------------------------------------------------------------------------
+    async def create_many(self, rows: List[dict]) -> int:
+        return await db.transcript.create_many(data=rows, skip_duplicates=True)
+
+    # -------------------------------------------------------------------------
+    # Retrieve all transcript lines of a session in chronological order.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     List[Transcript]: The transcript lines of the session.
+    # -------------------------------------------------------------------------
+    async def get_by_session(self, session_id: str) -> List[Transcript]:
+        return await db.transcript.find_many(
+            where={"sessionId": session_id},
+            order=KEYSET_ORDER_ASC
+        )
+
+    # -------------------------------------------------------------------------
+    # Retrieve the session a transcript belongs to (without relations).
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     Optional[InterviewSession]: The session object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_session(self, session_id: str) -> Optional[InterviewSession]:
+        return await db.interviewsession.find_unique(where={"id": session_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve one page of transcript lines, oldest first.
+    #
+    # Args:
+    #     where (dict): Prisma filter, including any keyset condition.
+    #     take (int): Page size.
+    #
+    # Returns:
+    #     List[Transcript]: Up to `take` lines in (createdAt, id) order.
+    # -------------------------------------------------------------------------
+    async def get_page(self, where: dict, take: int) -> List[Transcript]:
+        return await db.transcript.find_many(where=where, order=KEYSET_ORDER_ASC, take=take)
+
+    # -------------------------------------------------------------------------
+    # Retrieve a user by ID (used for role checks).
+    #
+    # Args:
+    #     user_id (str): The UUID of the user.
+    #
+    # Returns:
+    #     Optional[User]: The user object, or None if not found.
+    # -------------------------------------------------------------------------
+    async def get_user(self, user_id: str) -> Optional[User]:
+        return await db.user.find_unique(where={"id": user_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve the archived transcript of a session.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #
+    # Returns:
+    #     Optional[TranscriptArchive]: The archive, or None if not compacted.
+    # -------------------------------------------------------------------------
+    async def get_archive(self, session_id: str) -> Optional[TranscriptArchive]:
+        return await db.transcriptarchive.find_unique(where={"sessionId": session_id})
+
+    # -------------------------------------------------------------------------
+    # Retrieve one page of archives, ordered by their first line.
+    #
+    # Args:
+    #     where (dict): Prisma filter, including any keyset condition.
+    #     take (int): Page size.
+    #
+    # Returns:
+    #     List[TranscriptArchive]: Up to `take` archives in (firstAt, sessionId) order.
+    # -------------------------------------------------------------------------
+    async def get_archive_page(self, where: dict, take: int) -> List[TranscriptArchive]:
+        return await db.transcriptarchive.find_many(
+            where=where,
+            order=[{"firstAt": "asc"}, {"sessionId": "asc"}],
+            take=take
+        )
+
+    # -------------------------------------------------------------------------
+    # Finished sessions that still have hot transcript rows and whose report
+    # was written before `cutoff`.
+    #
+    # Args:
+    #     cutoff (datetime): Only sessions reported before this.
+    #     take (int): Maximum number of sessions to return.
+    #
+    # Returns:
+    #     List[InterviewSession]: Sessions to compact (without relations).
+    # -------------------------------------------------------------------------
+    async def get_compaction_candidates(self, cutoff: datetime, take: int) -> List[InterviewSession]:
+        return await db.interviewsession.find_many(
+            where={
+                "status": {"in": ["COMPLETED", "FAILED"]},
+                "report": {"is": {"createdAt": {"lte": cutoff}}},
+                "transcripts": {"some": {}}
+            },
+            order={"id": "asc"},
+            take=take
+        )
+
+    # -------------------------------------------------------------------------
+    # Fold a session's hot rows into its archive in one transaction, so
+    # readers see every line in exactly one place.
+    #
+    # Compactions of the same session (e.g. from several workers) are
+    # serialized by a transaction-scoped advisory lock, and the archive and
+    # hot rows are read under it, so a concurrent compaction can never
+    # overwrite lines it did not see.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     build (Callable): Called with the current archive (or None) and the
+    #         hot rows; returns the new archive as codec, lineCount, rawBytes,
+    #         data (bytes), firstAt and lastAt.
+    #
+    # Returns:
+    #     int: The number of Transcript rows moved into the archive.
+    # -------------------------------------------------------------------------
+    async def compact_session(
+        self,
+        session_id: str,
+        build: Callable[[Optional[TranscriptArchive], List[Transcript]], Awaitable[dict]]
+    ) -> int:
+        async with db.tx(timeout=timedelta(seconds=30)) as tx:
+            await tx.execute_raw("SELECT pg_advisory_xact_lock(hashtext($1))", session_id)
+            hot = await tx.transcript.find_many(where={"sessionId": session_id}, order=KEYSET_ORDER_ASC)
+            if not hot:
+                return 0
+            current = await tx.transcriptarchive.find_unique(where={"sessionId": session_id})
+            archive = await build(current, hot)
+            data = {**archive, "data": Base64.encode(archive["data"])}
+            await tx.transcriptarchive.upsert(
+                where={"sessionId": session_id},
+                data={"create": {"sessionId": session_id, **data}, "update": data}
+            )
+            return await tx.transcript.delete_many(where={"id": {"in": [t.id for t in hot]}})
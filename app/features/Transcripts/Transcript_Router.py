@@ -0,0 +1,136 @@
+from fastapi import APIRouter, Depends, Request
+from datetime import datetime
+from typing import List, Literal, Optional
+from app.features.Transcripts.Transcript_Schema import TranscriptCreate, TranscriptResponse, TranscriptBufferStats, LatencyReport
+from app.features.Transcripts.Transcript_Service import TranscriptService
+from app.features.Transcripts.Transcript_Dependencies import get_transcript_service
+from app.shared.responses import FastJSONResponse
+from app.shared.utils.streaming import accepts_gzip, ndjson_response
+
+router = APIRouter(prefix="/transcripts", tags=["Transcripts"])
+
+# -------------------------------------------------------------------------
+# Record a transcript line for one of the current user's sessions.
+#
+# - **sessionId**: The session the line belongs to.
+# - **role**: USER or BOT.
+# - **content**: The spoken text.
+# - **latencyMs**: Bot response latency, if any.
+#
+# The line is written in batches in the background; it is returned as soon
+# as it has been accepted.
+# -------------------------------------------------------------------------
+@router.post("/", response_model=TranscriptResponse, status_code=202, summary="Add transcript line")
+async def add_transcript(
+    data: TranscriptCreate,
+    request: Request,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.add_transcript(user_id, data), status_code=202)
+
+# -------------------------------------------------------------------------
+# Get the queue depth and flush latency of the transcript write buffer.
+#
+# Admins only.
+# -------------------------------------------------------------------------
+@router.get("/buffer/stats", response_model=TranscriptBufferStats, summary="Transcript buffer stats")
+async def get_buffer_stats(
+    request: Request,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_buffer_stats(user_id))
+
+# -------------------------------------------------------------------------
+# Response latency percentiles over a rolling window.
+#
+# - **window**: Window in seconds (default 5 minutes, at most 1 hour).
+# - **categoryId**: Only this category.
+# - **role**: Defaults to BOT, i.e. bot response latency.
+#
+# Admins only. Served from in-memory histograms of the worker that answers
+# (its pid is in **workerPid**); with WEB_CONCURRENCY > 1 each worker only
+# sees the lines it received. The Transcript table is not queried.
+# -------------------------------------------------------------------------
+@router.get("/latency", response_model=LatencyReport, summary="Transcript latency percentiles")
+async def get_latency_report(
+    request: Request,
+    window: int = 300,
+    categoryId: Optional[str] = None,
+    role: Optional[Literal["USER", "BOT"]] = "BOT",
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.get_latency_report(user_id, window, categoryId, role))
+
+# -------------------------------------------------------------------------
+# Get the full transcript of a session.
+#
+# Only returns if the session belongs to the current user.
+# -------------------------------------------------------------------------
+@router.get("/session/{session_id}", response_model=List[TranscriptResponse], summary="Get session transcript")
+async def list_session_transcripts(
+    session_id: str,
+    request: Request,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    user_id = request.state.user.get("sub")
+    return FastJSONResponse(await service.list_session_transcripts(session_id, user_id))
+
+# -------------------------------------------------------------------------
+# Download the transcript of a session as NDJSON (one line per row).
+#
+# - **gzip**: Compress the stream; defaults to the client's Accept-Encoding.
+#
+# Available to the session's owner and admins. Rows are streamed from the
+# database page by page, oldest first.
+# -------------------------------------------------------------------------
+@router.get("/export/session/{session_id}", summary="Export session transcript")
+async def export_session(
+    session_id: str,
+    request: Request,
+    gzip: Optional[bool] = None,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    user_id = request.state.user.get("sub")
+    body = await service.export_session(session_id, user_id)
+    compress = accepts_gzip(request) if gzip is None else gzip
+    return ndjson_response(body, f"transcripts-session-{session_id}.ndjson", compress)
+
+# -------------------------------------------------------------------------
+# Download every transcript line of a user's sessions as NDJSON.
+#
+# Available to the user themself and admins.
+# -------------------------------------------------------------------------
+@router.get("/export/user/{user_id}", summary="Export user transcripts")
+async def export_user(
+    user_id: str,
+    request: Request,
+    gzip: Optional[bool] = None,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    current_user_id = request.state.user.get("sub")
+    body = await service.export_user(user_id, current_user_id)
+    compress = accepts_gzip(request) if gzip is None else gzip
+    return ndjson_response(body, f"transcripts-user-{user_id}.ndjson", compress)
+
+# -------------------------------------------------------------------------
+# Download every transcript line created in a date range as NDJSON.
+#
+# - **since** / **until**: Inclusive bounds on creation time; open if omitted.
+#
+# Admins only.
+# -------------------------------------------------------------------------
+@router.get("/export", summary="Export transcripts by date range")
+async def export_range(
+    request: Request,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    gzip: Optional[bool] = None,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    user_id = request.state.user.get("sub")
+    body = await service.export_range(user_id, since, until)
+    compress = accepts_gzip(request) if gzip is None else gzip
+    return ndjson_response(body, "transcripts.ndjson", compress)
@@ -0,0 +1,52 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+from datetime import datetime
+
+class TranscriptBase(BaseModel):
+    role: Literal["USER", "BOT"]
+    content: str
+    latencyMs: Optional[int] = None
+
+class TranscriptCreate(TranscriptBase):
+    sessionId: str
+
+class TranscriptResponse(TranscriptBase):
+    id: str
+    sessionId: str
+    createdAt: datetime
+
+    class Config:
+        from_attributes = True
+
+class TranscriptBufferStats(BaseModel):
+    queueDepth: int
+    maxBatch: int
+    flushIntervalMs: float
+    flushCount: int
+    failedFlushCount: int
+    rowsFlushed: int
+    rowsDropped: int
+    # Rows the database refused (e.g. their session was deleted).
+    rowsRejected: int
+    lastFlushMs: Optional[float] = None
+    avgFlushMs: Optional[float] = None
+    maxFlushMs: Optional[float] = None
+
+class LatencySummary(BaseModel):
+    # None in the totals row when several series matched.
+    categoryId: Optional[str] = None
+    role: Optional[Literal["USER", "BOT"]] = None
+    count: int
+    mean: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+class LatencyReport(BaseModel):
+    windowSeconds: int
+    # Histograms are per process: with several workers this is the share of
+    # traffic the answering worker served.
+    workerPid: int
+    series: List[LatencySummary]
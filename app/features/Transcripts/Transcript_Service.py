@@ -0,0 +1,325 @@
+import os
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import uuid4
+from app.features.Transcripts.Transcript_Reponsitory import TranscriptRepository
+from app.features.Transcripts.Transcript_Buffer import TranscriptWriteBuffer
+from app.features.Transcripts.Transcript_Hub import transcript_hub
+from app.features.Transcripts.Transcript_Latency import TranscriptLatencyTracker
+from app.features.InterviewSessions.InterviewSession_Lifecycle import SessionLifecycleScheduler
+from app.features.Transcripts.Transcript_Archive import archive_rows, iter_archived_rows, merge_rows
+from app.features.Transcripts.Transcript_Schema import TranscriptCreate, TranscriptResponse, LatencyReport
+from app.shared.exceptions import ForbiddenException, NotFoundException, ValidationException
+from app.shared.utils.pagination import keyset_after
+
+# Session id -> (owner id, category id). Neither ever changes, so live
+# sessions writing a line every few hundred milliseconds only pay for the
+# lookup once.
+_SESSION_OWNER_CACHE_SIZE = 4096
+_session_owners: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+
+TRANSCRIPT_EXPORT_PAGE_SIZE = int(os.getenv("TRANSCRIPT_EXPORT_PAGE_SIZE", "1000"))
+# Archives hold a whole session each, so they are fetched in smaller pages.
+TRANSCRIPT_EXPORT_ARCHIVE_PAGE_SIZE = int(os.getenv("TRANSCRIPT_EXPORT_ARCHIVE_PAGE_SIZE", "50"))
+
+# Roles allowed to export transcripts other than their own.
+TRANSCRIPT_EXPORT_ROLES = {"ADMIN"}
+# Roles allowed to read the write buffer's counters and latency report.
+TRANSCRIPT_STATS_ROLES = {"ADMIN"}
+
+# -------------------------------------------------------------------------
+# Forget a deleted session: its cached owner and its unwritten lines.
+# -------------------------------------------------------------------------
+def forget_session(session_id: str, buffer: TranscriptWriteBuffer):
+    _session_owners.pop(session_id, None)
+    buffer.discard_session(session_id)
+
+class TranscriptService:
+    # -------------------------------------------------------------------------
+    # Service class responsible for business logic related to Transcripts.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        repo: TranscriptRepository,
+        buffer: TranscriptWriteBuffer,
+        latency: TranscriptLatencyTracker,
+        lifecycle: SessionLifecycleScheduler
+    ):
+        self.repo = repo
+        self.buffer = buffer
+        self.latency = latency
+        self.lifecycle = lifecycle
+
+    # -------------------------------------------------------------------------
+    # Ensure the session exists and belongs to the given user.
+    #
+    # Returns:
+    #     str: The session's category id.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
+    # -------------------------------------------------------------------------
+    async def _check_owner(self, session_id: str, user_id: str) -> str:
+        cached = _session_owners.get(session_id)
+        if cached is None:
+            session = await self.repo.get_session(session_id)
+            if not session:
+                raise NotFoundException("Interview Session not found")
+            cached = _session_owners[session_id] = (session.userId, session.categoryId)
+            if len(_session_owners) > _SESSION_OWNER_CACHE_SIZE:
+                _session_owners.popitem(last=False)
+        else:
+            _session_owners.move_to_end(session_id)
+        owner_id, category_id = cached
+
+        if owner_id != user_id:
+            raise NotFoundException("Interview Session not found")
+        return category_id
+
+    # -------------------------------------------------------------------------
+    # Record a new transcript line.
+    #
+    # The row is handed to the write-behind buffer and persisted on its next
+    # flush; `id` and `createdAt` are assigned here so the response is final.
+    # Live viewers of the session receive the line immediately, its
+    # latency feeds the per-category latency histograms and it keeps the
+    # session's idle timeout from firing.
+    #
+    # Args:
+    #     user_id (str): The ID of the current user.
+    #     data (TranscriptCreate): The transcript line.
+    #
+    # Returns:
+    #     TranscriptResponse: The accepted transcript line.
+    #
+    # Raises:
+    #     NotFoundException: If session not found or belongs to another user.
+    # -------------------------------------------------------------------------
+    async def add_transcript(self, user_id: str, data: TranscriptCreate) -> TranscriptResponse:
+        category_id = await self._check_owner(data.sessionId, user_id)
+
+        row = {
+            "id": str(uuid4()),
+            "sessionId": data.sessionId,
+            "role": data.role,
+            "content": data.content,
+            "latencyMs": data.latencyMs,
+            "createdAt": datetime.now(timezone.utc)
+        }
+        await self.buffer.add(row)
+        self.lifecycle.touch(data.sessionId)
+        if data.latencyMs is not None:
+            self.latency.record(category_id, data.role, data.latencyMs)
+
+        transcript = TranscriptResponse.model_validate(row)
+        transcript_hub.publish(
+            data.sessionId,
+            '{"type":"transcript","data":' + transcript.model_dump_json() + '}'
+        )
+        return transcript
+
+    # -------------------------------------------------------------------------
+    # List the transcript of a session, including lines not yet flushed.
+    #
+    # Lines of a compacted session are read from its archive, plus any hot
+    # rows written since.
+    #
+    # Args:
+    #     session_id (str): The UUID of the session.
+    #     user_id (str): The ID of the current user.
+    #
+    # Returns:
+    #     List[TranscriptResponse]: The session's transcript in order.
+    # -------------------------------------------------------------------------
+    async def list_session_transcripts(self, session_id: str, user_id: str) -> List[TranscriptResponse]:
+        await self._check_owner(session_id, user_id)
+
+        pending = self.buffer.pending_for(session_id)
+        transcripts = await self.repo.get_by_session(session_id)
+        archive = await self.repo.get_archive(session_id)
+
+        # A flush or a compaction may land between the reads; skip rows seen
+        # twice.
+        result = [TranscriptResponse.model_validate(r) for r in archive_rows(archive)] if archive else []
+        seen = {t.id for t in result}
+        result.extend(TranscriptResponse.model_validate(t) for t in transcripts if t.id not in seen)
+        seen.update(t.id for t in transcripts)
+        result.extend(TranscriptResponse.model_validate(r) for r in pending if r["id"] not in seen)
+        return result
+
+    # -------------------------------------------------------------------------
+    # Queue depth and flush latency of the write-behind buffer.
+    #
+    # Raises:
+    #     ForbiddenException: If the user is not an admin.
+    # -------------------------------------------------------------------------
+    async def get_buffer_stats(self, user_id: str) -> dict:
+        user = await self.repo.get_user(user_id)
+        if not user or user.role not in TRANSCRIPT_STATS_ROLES:
+            raise ForbiddenException("Buffer stats require the ADMIN role")
+        return self.buffer.stats()
+
+    # -------------------------------------------------------------------------
+    # Latency percentiles over a rolling window.
+    #
+    # Args:
+    #     user_id (str): The UUID of the requesting user.
+    #     window_seconds (int): Window length; at most the tracker's span.
+    #     category_id (Optional[str]): Only this category.
+    #     role (Optional[str]): Only this role (BOT for bot response latency).
+    #
+    # Returns:
+    #     LatencyReport: p50/p95/p99 per (category, role), over the lines
+    #     recorded by this worker process only.
+    #
+    # Raises:
+    #     ForbiddenException: If the user is not an admin.
+    #     ValidationException: If the window is not positive or too long.
+    # -------------------------------------------------------------------------
+    async def get_latency_report(self, user_id: str, window_seconds: int, category_id: Optional[str] = None, role: Optional[str] = None) -> LatencyReport:
+        user = await self.repo.get_user(user_id)
+        if not user or user.role not in TRANSCRIPT_STATS_ROLES:
+            raise ForbiddenException("Latency report requires the ADMIN role")
+        if window_seconds <= 0 or window_seconds > self.latency.max_window:
+            raise ValidationException(f"window must be between 1 and {self.latency.max_window} seconds")
+        return LatencyReport(
+            windowSeconds=window_seconds,
+            workerPid=os.getpid(),
+            series=self.latency.summarize(window_seconds, category_id, role)
+        )
+
+    # -------------------------------------------------------------------------
+    # Allow an export if it only covers the user's own data, or the user
+    # has an export role.
+    #
+    # Raises:
+    #     ForbiddenException: Otherwise.
+    # -------------------------------------------------------------------------
+    async def _check_export_access(self, user_id: str, owner_id: Optional[str] = None):
+        if owner_id is not None and owner_id == user_id:
+            return
+        user = await self.repo.get_user(user_id)
+        if not user or user.role not in TRANSCRIPT_EXPORT_ROLES:
+            raise ForbiddenException("Transcript export requires the ADMIN role")
+
+    # -------------------------------------------------------------------------
+    # Hot transcript rows matching a filter, one DB page at a time.
+    #
+    # Pages are fetched by keyset on (createdAt, id) rather than offset, so
+    # each query is an index range scan and only one page is held in memory.
+    # -------------------------------------------------------------------------
+    async def _hot_rows(self, where: dict) -> AsyncIterator[dict]:
+        page_where = where
+        while True:
+            rows = await self.repo.get_page(page_where, TRANSCRIPT_EXPORT_PAGE_SIZE)
+            for row in rows:
+                yield TranscriptResponse.model_validate(row).model_dump()
+            if len(rows) < TRANSCRIPT_EXPORT_PAGE_SIZE:
+                return
+            last = rows[-1]
+            page_where = {"AND": [where, keyset_after(last.createdAt, last.id)]}
+
+    async def _archive_pages(self, where: dict) -> AsyncIterator[list]:
+        page_where = where
+        while True:
+            archives = await self.repo.get_archive_page(page_where, TRANSCRIPT_EXPORT_ARCHIVE_PAGE_SIZE)
+            if archives:
+                yield archives
+            if len(archives) < TRANSCRIPT_EXPORT_ARCHIVE_PAGE_SIZE:
+                return
+            last = archives[-1]
+            page_where = {"AND": [where, keyset_after(last.firstAt, last.sessionId, "firstAt", "sessionId")]}
+
+    # -------------------------------------------------------------------------
+    # Stream matching transcript lines as NDJSON, oldest first.
+    #
+    # Hot rows and the lines of compacted sessions are merged on
+    # (createdAt, id), so archived sessions are exported exactly as before
+    # compaction.
+    #
+    # Args:
+    #     where (dict): Prisma filter on Transcript.
+    #     archive_where (dict): The same selection as a TranscriptArchive filter.
+    #     since (Optional[datetime]): Drop archived lines created before this.
+    #     until (Optional[datetime]): Drop archived lines created after this.
+    # -------------------------------------------------------------------------
+    async def _stream(self, where: dict, archive_where: dict, since: Optional[datetime] = None, until: Optional[datetime] = None) -> AsyncIterator[bytes]:
+        archived = iter_archived_rows(self._archive_pages(archive_where), since, until)
+        lines = []
+        async for row in merge_rows(self._hot_rows(where), archived):
+            lines.append(TranscriptResponse.model_validate(row).model_dump_json().encode() + b"\n")
+            if len(lines) >= TRANSCRIPT_EXPORT_PAGE_SIZE:
+                yield b"".join(lines)
+                lines = []
+        if lines:
+            yield b"".join(lines)
+
+    async def _export(self, where: dict, archive_where: dict, since: Optional[datetime] = None, until: Optional[datetime] = None) -> AsyncIterator[bytes]:
+        # Write out buffered lines first so the export is complete.
+        await self.buffer.flush()
+        return self._stream(where, archive_where, since, until)
+
+    # -------------------------------------------------------------------------
+    # Export the transcript of one session.
+    #
+    # Allowed for the session's owner and admins. Access is checked before
+    # the first byte is sent.
+    #
+    # Returns:
+    #     AsyncIterator[bytes]: NDJSON lines, oldest first.
+    #
+    # Raises:
+    #     NotFoundException: If the session does not exist.
+    #     ForbiddenException: If the user may not export it.
+    # -------------------------------------------------------------------------
+    async def export_session(self, session_id: str, user_id: str) -> AsyncIterator[bytes]:
+        session = await self.repo.get_session(session_id)
+        if not session:
+            raise NotFoundException("Interview Session not found")
+        await self._check_export_access(user_id, session.userId)
+        return await self._export({"sessionId": session_id}, {"sessionId": session_id})
+
+    # -------------------------------------------------------------------------
+    # Export every transcript line of a user's sessions.
+    #
+    # Allowed for the user themself and admins.
+    #
+    # Raises:
+    #     ForbiddenException: If the user may not export it.
+    # -------------------------------------------------------------------------
+    async def export_user(self, target_user_id: str, user_id: str) -> AsyncIterator[bytes]:
+        await self._check_export_access(user_id, target_user_id)
+        owned = {"session": {"is": {"userId": target_user_id}}}
+        return await self._export(owned, owned)
+
+    # -------------------------------------------------------------------------
+    # Export every transcript line created within a date range. Admins only.
+    #
+    # Args:
+    #     user_id (str): The ID of the current user.
+    #     since (Optional[datetime]): Range start (inclusive).
+    #     until (Optional[datetime]): Range end (inclusive).
+    #
+    # Raises:
+    #     ValidationException: If `since` is after `until`.
+    #     ForbiddenException: If the user is not an admin.
+    # -------------------------------------------------------------------------
+    async def export_range(self, user_id: str, since: Optional[datetime] = None, until: Optional[datetime] = None) -> AsyncIterator[bytes]:
+        if since and until and since > until:
+            raise ValidationException("since must not be after until")
+        await self._check_export_access(user_id)
+
+        # Archived lines are filtered in Python against aware datetimes.
+        since = since.replace(tzinfo=timezone.utc) if since and since.tzinfo is None else since
+        until = until.replace(tzinfo=timezone.utc) if until and until.tzinfo is None else until
+
+        created_at, archive_where = {}, {}
+        if since:
+            created_at["gte"] = since
+            archive_where["lastAt"] = {"gte": since}
+        if until:
+            created_at["lte"] = until
+            archive_where["firstAt"] = {"lte": until}
+        return await self._export({"createdAt": created_at} if created_at else {}, archive_where, since, until)
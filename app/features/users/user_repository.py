@@ -1,5 +1,7 @@
+from typing import List, Optional
 from prisma.models import User
 from app.shared.database import db
+from app.shared.utils.pagination import KEYSET_ORDER, keyset_where
 from app.features.Users.User_Schemas import UserCreate, UserUpdate
 
 class UserRepository:
@@ -44,17 +46,23 @@ class UserRepository:
         return await db.user.find_unique(where={"id": user_id})
 
     # -------------------------------------------------------------------------
-    # Retrieve a list of users with pagination.
+    # Retrieve a list of users, newest first.
+    #
+    # With a cursor, rows after it are returned and `skip` is ignored
+    # (keyset pagination); otherwise `skip` is used as an offset.
     #
     # Args:
     #     skip (int): The number of records to skip.
     #     take (int): The number of records to return.
+    #     cursor (Optional[str]): Cursor of the last row of the previous page.
     #
     # Returns:
     #     List[User]: A list of User objects.
     # -------------------------------------------------------------------------
-    async def get_all(self, skip: int = 0, take: int = 20):
-        return await db.user.find_many(skip=skip, take=take, order={"createdAt": "desc"})
+    async def get_all(self, skip: int = 0, take: int = 20, cursor: Optional[str] = None) -> List[User]:
+        if cursor:
+            return await db.user.find_many(where=keyset_where(cursor), take=take, order=KEYSET_ORDER)
+        return await db.user.find_many(skip=skip, take=take, order=KEYSET_ORDER)
 
     # -------------------------------------------------------------------------
     # Update a user's information.
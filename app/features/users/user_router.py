@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, Request
-from typing import List
+from typing import List, Optional
 from app.features.Users.User_Schemas import UserCreate, UserResponse, UserUpdate
 from app.features.Users.User_Service import UserService
 from app.features.Users.User_Dependencies import get_user_service
+from app.shared.responses import FastJSONResponse
+from app.shared.utils.pagination import NEXT_CURSOR_HEADER
+from app.shared.utils.projection import parse_fieldset, project
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -18,47 +21,66 @@ async def create_user(
     data: UserCreate, 
     service: UserService = Depends(get_user_service)
 ):
-    return await service.create_user(data)
+    return FastJSONResponse(await service.create_user(data))
 
 # -------------------------------------------------------------------------
 # Get the profile of the currently authenticated user.
 #
 # This endpoint uses the JWT token from the header to identify the user.
+#
+# - **fields**: Only return these fields, e.g. `id,fullName,avatarUrl`.
 # -------------------------------------------------------------------------
 @router.get("/me", response_model=UserResponse, summary="Get current logged in user")
 async def get_me(
     request: Request,
+    fields: Optional[str] = None,
     service: UserService = Depends(get_user_service)
 ):
+    fieldset = parse_fieldset(fields, UserResponse)
     # Retrieve user_id from token decoded by AuthMiddleware
     user_id = request.state.user.get("sub")
-    return await service.get_user_by_id(user_id)
+    user = await service.get_user_by_id(user_id)
+    return FastJSONResponse(project(user, fieldset) if fieldset else user)
 
 # -------------------------------------------------------------------------
 # Retrieve user details by their unique ID.
 #
 # - **user_id**: The UUID of the user.
+# - **fields**: Only return these fields, e.g. `id,fullName,avatarUrl`.
 # -------------------------------------------------------------------------
 @router.get("/{user_id}", response_model=UserResponse, summary="Get user by ID")
 async def get_user(
     user_id: str,
+    fields: Optional[str] = None,
     service: UserService = Depends(get_user_service)
 ):
-    return await service.get_user_by_id(user_id)
+    fieldset = parse_fieldset(fields, UserResponse)
+    user = await service.get_user_by_id(user_id)
+    return FastJSONResponse(project(user, fieldset) if fieldset else user)
 
 # -------------------------------------------------------------------------
 # Retrieve a list of users with pagination support.
 #
 # - **skip**: Number of records to skip (default: 0).
 # - **take**: Number of records to return (default: 20).
+# - **cursor**: Value of the `X-Next-Cursor` header of the previous page.
+#   When given, `skip` is ignored and paging stays stable as users are added.
+# - **fields**: Only return these fields, e.g. `id,fullName,avatarUrl`.
+#
+# The `X-Next-Cursor` response header is omitted on the last page.
 # -------------------------------------------------------------------------
 @router.get("/", response_model=List[UserResponse], summary="List all users")
 async def list_users(
     skip: int = 0,
     take: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     service: UserService = Depends(get_user_service)
 ):
-    return await service.get_all_users(skip, take)
+    fieldset = parse_fieldset(fields, UserResponse)
+    users, next_cursor = await service.get_all_users(skip, take, cursor)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return FastJSONResponse(project(users, fieldset) if fieldset else users, headers=headers)
 
 # -------------------------------------------------------------------------
 # Update an existing user's information.
@@ -71,7 +93,7 @@ async def update_user(
     data: UserUpdate,
     service: UserService = Depends(get_user_service)
 ):
-    return await service.update_user(user_id, data)
+    return FastJSONResponse(await service.update_user(user_id, data))
 
 # -------------------------------------------------------------------------
 # Permanently delete a user from the system.
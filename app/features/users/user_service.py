@@ -1,7 +1,9 @@
+from typing import List, Optional, Tuple
 from app.features.Users.User_Repository import UserRepository
 from app.features.Users.User_Schemas import UserCreate, UserResponse, UserUpdate
 from app.shared.exceptions import DuplicatedEntityException, ValidationException, NotFoundException
-from app.shared.utils.security import hash_password
+from app.shared.utils.security import hash_password_async
+from app.shared.utils.pagination import paginate
 
 class UserService:
     # -------------------------------------------------------------------------
@@ -29,7 +31,7 @@ class UserService:
             raise DuplicatedEntityException("Email already exists")
             
         user_data = data.model_dump()
-        user_data["password"] = hash_password(data.password)
+        user_data["password"] = await hash_password_async(data.password)
         
         new_user = await self.repo.create(user_data)
         return UserResponse.model_validate(new_user)
@@ -56,15 +58,18 @@ class UserService:
     # Retrieve a paginated list of all users.
     #
     # Args:
-    #     skip (int): Number of records to skip.
+    #     skip (int): Number of records to skip (ignored when a cursor is given).
     #     take (int): Number of records to return.
+    #     cursor (Optional[str]): Cursor returned with the previous page.
     #
     # Returns:
-    #     List[UserResponse]: A list of user details.
+    #     Tuple[List[UserResponse], Optional[str]]: The users and the cursor of
+    #     the next page (None on the last page).
     # -------------------------------------------------------------------------
-    async def get_all_users(self, skip: int = 0, take: int = 20):
-        users = await self.repo.get_all(skip=skip, take=take)
-        return [UserResponse.model_validate(u) for u in users]
+    async def get_all_users(self, skip: int = 0, take: int = 20, cursor: Optional[str] = None) -> Tuple[List[UserResponse], Optional[str]]:
+        users = await self.repo.get_all(skip=skip, take=take + 1, cursor=cursor)
+        page, next_cursor = paginate(users, take)
+        return [UserResponse.model_validate(u) for u in page], next_cursor
     
     # -------------------------------------------------------------------------
     # Update user details by ID. Hashes password if it is being updated.
@@ -86,7 +91,7 @@ class UserService:
             
         update_data = data.model_dump(exclude_unset=True)
         if "password" in update_data:
-            update_data["password"] = hash_password(update_data["password"])
+            update_data["password"] = await hash_password_async(update_data["password"])
             
         updated_user = await self.repo.update(user_id, update_data)
         return UserResponse.model_validate(updated_user)
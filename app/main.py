@@ -7,17 +7,63 @@ import uvicorn
 load_dotenv()
 
 from app.shared.database import db
+from app.shared.shutdown import shutdown_drain
+from app.shared.leader import background_leader
+from app.shared.cache import cache_invalidation
+from app.shared.utils.security import shutdown_password_pool
 from app.shared.middlewares.auth_middleware import AuthMiddleware
 from app.features.Auths.Auth_Router import router as auth_router
+from app.features.Healths.Health_Router import router as health_router
 from app.features.Users.User_Router import router as users_router
 from app.features.InterviewCategorys.InterviewCategory_Router import router as interview_categories_router
 from app.features.InterviewSessions.InterviewSession_Router import router as interview_sessions_router
+from app.features.InterviewSessions.InterviewSession_Rooms import room_pool
+from app.features.InterviewSessions.InterviewSession_Lifecycle import session_lifecycle
+from app.features.Transcripts.Transcript_Router import router as transcripts_router
+from app.features.Transcripts.Transcript_Buffer import transcript_buffer
+from app.features.Transcripts.Transcript_Compaction import transcript_compactor
+from app.features.QuestionBanks.QuestionBank_Router import router as question_banks_router
+from app.features.QuestionBanks.QuestionBank_DrawIndex import question_draw_index
+from app.features.QuestionBanks.QuestionBank_Dedup import question_dedup_index
+from app.features.EvaluationReports.EvaluationReport_Router import router as evaluation_reports_router
+from app.features.QuestionResponses.QuestionResponse_Router import router as question_responses_router
+from app.features.EvaluationReports.EvaluationReport_Jobs import report_queue, recover_pending_reports
+from app.features.TechnicalArtifacts.TechnicalArtifact_Router import router as technical_artifacts_router
+from app.features.TechnicalArtifacts.TechnicalArtifact_Jobs import analysis_queue, recover_pending_analyses
+from app.features.TechnicalArtifacts.TechnicalArtifact_StaticAnalysis import static_analysis_pool
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    shutdown_drain.install()
     await db.connect()
+    await question_draw_index.start()
+    await question_dedup_index.start()
+    await transcript_buffer.start()
+    await cache_invalidation.start()
+    await report_queue.start()
+    await analysis_queue.start()
+    # Once per deployment, in whichever worker holds the lease.
+    await background_leader.start([
+        (recover_pending_reports, None),
+        (recover_pending_analyses, None),
+        (transcript_compactor.start, transcript_compactor.stop)
+    ])
+    await room_pool.start()
+    await session_lifecycle.start()
     yield
+    await session_lifecycle.stop()
+    await room_pool.stop()
+    await background_leader.stop()
+    await analysis_queue.stop()
+    await report_queue.stop()
+    await cache_invalidation.stop()
+    await question_draw_index.stop()
+    await question_dedup_index.stop()
+    # Drain buffered transcripts before the connection goes away.
+    await transcript_buffer.stop()
     await db.disconnect()
+    shutdown_password_pool()
+    static_analysis_pool.shutdown()
 
 app = FastAPI(
     title="AI Interview Platform API",
@@ -28,10 +74,17 @@ app = FastAPI(
 
 app.add_middleware(AuthMiddleware)
 
+app.include_router(health_router)
 app.include_router(auth_router)
 app.include_router(users_router)
 app.include_router(interview_categories_router)
 app.include_router(interview_sessions_router)
+app.include_router(transcripts_router)
+app.include_router(question_banks_router)
+app.include_router(question_responses_router)
+app.include_router(evaluation_reports_router)
+app.include_router(technical_artifacts_router)
+
 @app.get("/", include_in_schema=False)
 def index():
     return RedirectResponse("/docs")
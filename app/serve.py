@@ -0,0 +1,66 @@
+# -------------------------------------------------------------------------
+# Production entry point: `python -m app.serve`.
+#
+# Runs WEB_CONCURRENCY uvicorn worker processes on one socket, with uvloop
+# and httptools when they are installed. Each worker sizes its database
+# pool from DB_CONNECTION_LIMIT (or DB_MAX_CONNECTIONS / WEB_CONCURRENCY),
+# see app/shared/database.py. On SIGTERM a worker reports not ready for
+# SHUTDOWN_DRAIN_SECONDS (app/shared/shutdown.py), then stops accepting and
+# gives in-flight requests and live sockets SHUTDOWN_GRACE_SECONDS to end
+# before the lifespan shutdown runs.
+#
+# Per-process pools (rooms, hashing and analysis processes) default to this
+# worker's share of the deployment (app/shared/workers.py). Startup recovery
+# and transcript compaction run in one worker only, the holder of the
+# leader lease (app/shared/leader.py); RUN_BACKGROUND_JOBS=false keeps a
+# deployment out of that election.
+#
+# `python -m app.main` remains the single-process development server.
+# -------------------------------------------------------------------------
+import importlib.util
+import logging
+import os
+import uvicorn
+from dotenv import load_dotenv
+
+load_dotenv()
+
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+SHUTDOWN_GRACE_SECONDS = int(os.getenv("SHUTDOWN_GRACE_SECONDS", "30"))
+# Addresses of trusted proxies whose X-Forwarded-* headers are honoured.
+FORWARDED_ALLOW_IPS = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "info")
+
+logger = logging.getLogger(__name__)
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+def main():
+    workers = max(1, WEB_CONCURRENCY)
+    # Workers are spawned processes; they size their pools from this.
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+
+    loop = "uvloop" if _available("uvloop") else "asyncio"
+    http = "httptools" if _available("httptools") else "h11"
+    logging.basicConfig(level=LOG_LEVEL.upper())
+    logger.info("Starting %d worker(s) on %s:%d (loop=%s, http=%s)", workers, HOST, PORT, loop, http)
+
+    uvicorn.run(
+        "app.main:app",
+        host=HOST,
+        port=PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        proxy_headers=True,
+        forwarded_allow_ips=FORWARDED_ALLOW_IPS,
+        timeout_graceful_shutdown=SHUTDOWN_GRACE_SECONDS,
+        log_level=LOG_LEVEL
+    )
+
+
+if __name__ == "__main__":
+    main()
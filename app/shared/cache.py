@@ -0,0 +1,207 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_INVALIDATION_REDIS_URL = os.getenv("CACHE_INVALIDATION_REDIS_URL")
+CACHE_INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "app-cache-invalidation")
+# Reconnect delay of the invalidation listener, doubled up to the maximum.
+CACHE_INVALIDATION_RETRY_SECONDS = float(os.getenv("CACHE_INVALIDATION_RETRY_SECONDS", "1"))
+CACHE_INVALIDATION_MAX_RETRY_SECONDS = float(os.getenv("CACHE_INVALIDATION_MAX_RETRY_SECONDS", "30"))
+
+_MISSING = object()
+
+class TTLCache:
+    # -------------------------------------------------------------------------
+    # In-process LRU cache whose entries expire `ttl` seconds after being set.
+    #
+    # Caches register themselves by name so invalidations can be broadcast to
+    # the same cache in other worker processes (see `CacheInvalidationChannel`).
+    #
+    # Read-through callers take `version(key)` before loading and pass it to
+    # `set`; a value whose key was invalidated (or the cache cleared) while
+    # it loaded is then not stored, so a write racing a read cannot leave
+    # the pre-write value cached for the whole TTL.
+    # -------------------------------------------------------------------------
+
+    registry: Dict[str, "TTLCache"] = {}
+
+    def __init__(self, name: str, ttl: float, max_size: int = 1024):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        # Bumped by `clear`; per-key counts are bumped by `invalidate`.
+        self._epoch = 0
+        self._generations: Dict[Hashable, int] = {}
+        TTLCache.registry[name] = self
+
+    # -------------------------------------------------------------------------
+    # Return the cached value for a key, or `default` if absent or expired.
+    # -------------------------------------------------------------------------
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING or entry[1] <= time.monotonic():
+            if entry is not _MISSING:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def version(self, key: Hashable) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(key, 0)
+
+    # -------------------------------------------------------------------------
+    # Store a value. With `version` (from `version(key)` before the value was
+    # loaded) nothing is stored if the key was invalidated since.
+    # -------------------------------------------------------------------------
+    def set(self, key: Hashable, value: Any, version: Optional[Tuple[int, int]] = None):
+        if version is not None and version != self.version(key):
+            return
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        self._entries.pop(key, None)
+        if len(self._generations) >= self.max_size:
+            # Bound the bookkeeping; a new epoch outdates every load in flight.
+            self._generations.clear()
+            self._epoch += 1
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self):
+        self._entries.clear()
+        self._generations.clear()
+        self._epoch += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRatio": self.hits / lookups if lookups else None
+        }
+
+class CacheInvalidationChannel:
+    # -------------------------------------------------------------------------
+    # Broadcasts "clear cache X" (or "drop key K of cache X") messages to the
+    # other worker processes, when CACHE_INVALIDATION_REDIS_URL is set.
+    #
+    # Without CACHE_INVALIDATION_REDIS_URL only the local cache is cleared and
+    # other workers converge when their entries expire. With it (and the
+    # optional `redis` package installed) the message is published on a Redis
+    # channel that every worker subscribes to. A worker that loses the
+    # subscription reconnects with backoff and then clears all its caches,
+    # as it may have missed invalidations meanwhile.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, redis_url: Optional[str] = CACHE_INVALIDATION_REDIS_URL, channel: str = CACHE_INVALIDATION_CHANNEL):
+        self.redis_url = redis_url
+        self.channel = channel
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if not self.redis_url or self._redis is not None:
+            return
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            logger.warning("CACHE_INVALIDATION_REDIS_URL is set but the redis package is not installed")
+            return
+
+        self._redis = redis.from_url(self.redis_url)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    # -------------------------------------------------------------------------
+    # Clear a cache, or one key of it, in this process and, with
+    # CACHE_INVALIDATION_REDIS_URL set, in every other worker.
+    #
+    # Args:
+    #     cache_name (str): The registered name of the cache.
+    #     key (Optional[str]): Drop only this key; None clears the cache.
+    # -------------------------------------------------------------------------
+    async def invalidate(self, cache_name: str, key: Optional[str] = None):
+        self._apply(cache_name, key)
+        if self._redis is not None:
+            message = cache_name if key is None else json.dumps({"cache": cache_name, "key": key})
+            try:
+                await self._redis.publish(self.channel, message)
+            except Exception:
+                logger.exception("Failed to broadcast invalidation of cache %s", cache_name)
+
+    @staticmethod
+    def _apply(cache_name: str, key: Optional[str]):
+        cache = TTLCache.registry.get(cache_name)
+        if cache is None:
+            return
+        if key is None:
+            cache.clear()
+        else:
+            cache.invalidate(key)
+
+    def _handle(self, data):
+        data = data.decode() if isinstance(data, bytes) else data
+        # A bare cache name clears it; a JSON object names one key.
+        if data.startswith("{"):
+            payload = json.loads(data)
+            self._apply(payload["cache"], payload["key"])
+        else:
+            self._apply(data, None)
+
+    async def _listen(self):
+        backoff = CACHE_INVALIDATION_RETRY_SECONDS
+        resync = False
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                if resync:
+                    logger.info("Cache invalidation channel reconnected; clearing local caches")
+                    for cache in list(TTLCache.registry.values()):
+                        cache.clear()
+                backoff = CACHE_INVALIDATION_RETRY_SECONDS
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self._handle(message["data"])
+                    except Exception:
+                        logger.exception("Ignoring malformed cache invalidation message")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation listener disconnected; retrying in %ss", backoff)
+            finally:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+            resync = True
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, CACHE_INVALIDATION_MAX_RETRY_SECONDS)
+
+cache_invalidation = CacheInvalidationChannel()
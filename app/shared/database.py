@@ -1,6 +1,50 @@
+import asyncio
+import os
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from prisma import Prisma
+from app.shared.workers import WEB_CONCURRENCY
 
-db = Prisma()
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+# Connections each worker process may open. Prisma's default is 2 * CPUs + 1
+# per process, which N workers multiply past the server's max_connections.
+DB_CONNECTION_LIMIT = os.getenv("DB_CONNECTION_LIMIT")
+# Alternatively a total budget, split evenly over the WEB_CONCURRENCY workers.
+DB_MAX_CONNECTIONS = os.getenv("DB_MAX_CONNECTIONS")
+# Seconds a query waits for a free connection before failing.
+DB_POOL_TIMEOUT_SECONDS = os.getenv("DB_POOL_TIMEOUT_SECONDS")
+DB_PING_TIMEOUT_SECONDS = float(os.getenv("DB_PING_TIMEOUT_SECONDS", "2"))
+
+# -------------------------------------------------------------------------
+# Connection pool size of this worker process, or None for Prisma's default.
+# -------------------------------------------------------------------------
+def connection_limit() -> Optional[int]:
+    if DB_CONNECTION_LIMIT:
+        return max(1, int(DB_CONNECTION_LIMIT))
+    if DB_MAX_CONNECTIONS:
+        return max(1, int(DB_MAX_CONNECTIONS) // WEB_CONCURRENCY)
+    return None
+
+# -------------------------------------------------------------------------
+# Add Prisma's pool parameters to a database URL. Parameters already in the
+# URL win, so an explicit DATABASE_URL setting is never overridden.
+# -------------------------------------------------------------------------
+def datasource_url(url: str, limit: Optional[int], pool_timeout: Optional[str]) -> str:
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    if limit is not None:
+        query.setdefault("connection_limit", str(limit))
+    if pool_timeout:
+        query.setdefault("pool_timeout", pool_timeout)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def _create_client() -> Prisma:
+    limit = connection_limit()
+    if not DATABASE_URL or (limit is None and not DB_POOL_TIMEOUT_SECONDS):
+        return Prisma()
+    return Prisma(datasource={"url": datasource_url(DATABASE_URL, limit, DB_POOL_TIMEOUT_SECONDS)})
+
+db = _create_client()
 
 async def connect_db():
     if not db.is_connected():
@@ -12,3 +56,19 @@ async def disconnect_db():
 
 async def get_db():
     return db
+
+# -------------------------------------------------------------------------
+# Check that the database answers a trivial query.
+#
+# Returns:
+#     bool: False if disconnected, failing or slower than
+#     DB_PING_TIMEOUT_SECONDS.
+# -------------------------------------------------------------------------
+async def ping_db() -> bool:
+    if not db.is_connected():
+        return False
+    try:
+        await asyncio.wait_for(db.query_raw("SELECT 1"), DB_PING_TIMEOUT_SECONDS)
+        return True
+    except Exception:
+        return False
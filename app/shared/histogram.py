@@ -0,0 +1,122 @@
+import math
+import time
+from typing import Dict, List, Optional
+
+class LogHistogram:
+    # -------------------------------------------------------------------------
+    # Log-bucketed histogram with bounded relative error.
+    #
+    # A positive value v falls in bucket ceil(log_gamma(v)), with
+    # gamma = (1 + a) / (1 - a); every quantile is then within a relative
+    # error `a` of the true value. Buckets are a sparse dict, so memory grows
+    # with the log of the value range (a few hundred buckets for 1 ms to 10
+    # minutes at 1%), and two histograms with the same accuracy merge by
+    # adding counts.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float):
+        if value <= 0:
+            self.zero_count += 1
+            value = 0.0
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LogHistogram"):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge histograms with different accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    # -------------------------------------------------------------------------
+    # Value at quantile q (0-1), or None when empty.
+    # -------------------------------------------------------------------------
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Midpoint (in relative terms) of the bucket (gamma^(i-1), gamma^i].
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99)
+        }
+
+
+class RollingHistogram:
+    # -------------------------------------------------------------------------
+    # LogHistogram over a sliding time window.
+    #
+    # Values go into one histogram per `slot_seconds` slot in a ring of
+    # `slots`; a window is answered by merging the slots it covers, so old
+    # data ages out without ever being rescanned.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, slot_seconds: int = 60, slots: int = 60, relative_accuracy: float = 0.01):
+        self.slot_seconds = slot_seconds
+        self.slots = slots
+        self.relative_accuracy = relative_accuracy
+        self._ring: List[Optional[LogHistogram]] = [None] * slots
+        self._epochs: List[int] = [-1] * slots
+
+    @property
+    def max_window(self) -> int:
+        return self.slot_seconds * self.slots
+
+    def record(self, value: float, now: Optional[float] = None):
+        epoch = int((time.time() if now is None else now) // self.slot_seconds)
+        position = epoch % self.slots
+        if self._epochs[position] != epoch:
+            self._ring[position] = LogHistogram(self.relative_accuracy)
+            self._epochs[position] = epoch
+        self._ring[position].record(value)
+
+    # -------------------------------------------------------------------------
+    # Merge the slots of the last `window_seconds` (rounded up to whole
+    # slots, capped at `max_window`) into a new histogram.
+    # -------------------------------------------------------------------------
+    def window(self, window_seconds: float, now: Optional[float] = None) -> LogHistogram:
+        current = int((time.time() if now is None else now) // self.slot_seconds)
+        span = min(self.slots, max(1, math.ceil(window_seconds / self.slot_seconds)))
+        merged = LogHistogram(self.relative_accuracy)
+        for epoch in range(current - span + 1, current + 1):
+            position = epoch % self.slots
+            if self._epochs[position] == epoch:
+                merged.merge(self._ring[position])
+        return merged
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+SUCCEEDED = "SUCCEEDED"
+FAILED = "FAILED"
+
+class Job:
+    # -------------------------------------------------------------------------
+    # State of one queued job; `id` doubles as the idempotency key.
+    # -------------------------------------------------------------------------
+
+    __slots__ = ("id", "status", "attempts", "error", "enqueuedAt", "startedAt", "finishedAt")
+
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.status = PENDING
+        self.attempts = 0
+        self.error: Optional[str] = None
+        self.enqueuedAt = datetime.now(timezone.utc)
+        self.startedAt: Optional[datetime] = None
+        self.finishedAt: Optional[datetime] = None
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class JobQueue:
+    # -------------------------------------------------------------------------
+    # In-process background job queue with a fixed pool of worker tasks.
+    #
+    # - Enqueueing is idempotent: a job id that is pending, running or has
+    #   succeeded is not queued again; only a FAILED job can be re-enqueued.
+    # - A failing handler is retried up to `max_attempts` times with
+    #   exponential backoff (`backoff_base * 2**(attempt-1)` seconds, capped at
+    #   `backoff_max`). The retry waits on a timer, not in a worker.
+    # - The status of the last `max_tracked` finished jobs is kept for polling.
+    #
+    # Jobs only live in this process; callers are expected to re-enqueue
+    # unfinished work from the database at startup.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[str], Awaitable[None]],
+        concurrency: int = 2,
+        max_attempts: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        max_tracked: int = 10000
+    ):
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_tracked = max_tracked
+
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    # -------------------------------------------------------------------------
+    # Start the worker pool. Called from the application lifespan.
+    # -------------------------------------------------------------------------
+    async def start(self):
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        for job in self._jobs.values():
+            if job.status == PENDING:
+                self._queue.put_nowait(job.id)
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+
+    # -------------------------------------------------------------------------
+    # Stop the workers. Running jobs are cancelled and left PENDING so the
+    # startup recovery of the next process picks them up.
+    # -------------------------------------------------------------------------
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # -------------------------------------------------------------------------
+    # Queue a job unless one with the same id is already queued, running or
+    # done.
+    #
+    # Args:
+    #     job_id (str): Idempotency key passed to the handler.
+    #
+    # Returns:
+    #     Job: The new or existing job.
+    # -------------------------------------------------------------------------
+    def enqueue(self, job_id: str) -> Job:
+        job = self._jobs.get(job_id)
+        if job is not None and job.status != FAILED:
+            return job
+
+        job = Job(job_id)
+        self._jobs[job_id] = job
+        self._jobs.move_to_end(job_id)
+        self._prune()
+        if self._queue is not None:
+            self._queue.put_nowait(job_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def _prune(self):
+        excess = len(self._jobs) - self.max_tracked
+        if excess <= 0:
+            return
+        for job_id in [j.id for j in self._jobs.values() if j.status in (SUCCEEDED, FAILED)][:excess]:
+            del self._jobs[job_id]
+
+    def _requeue(self, job_id: str):
+        if self._workers and job_id in self._jobs:
+            self._queue.put_nowait(job_id)
+
+    async def _work(self):
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.status != PENDING:
+                continue
+
+            job.status = RUNNING
+            job.attempts += 1
+            job.startedAt = datetime.now(timezone.utc)
+            try:
+                await self.handler(job_id)
+            except asyncio.CancelledError:
+                job.status = PENDING
+                raise
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+                if job.attempts < self.max_attempts:
+                    job.status = PENDING
+                    delay = min(self.backoff_base * 2 ** (job.attempts - 1), self.backoff_max)
+                    logger.warning("%s job %s failed (attempt %d), retrying in %.1fs", self.name, job_id, job.attempts, delay)
+                    asyncio.get_running_loop().call_later(delay, self._requeue, job_id)
+                else:
+                    job.status = FAILED
+                    job.finishedAt = datetime.now(timezone.utc)
+                    logger.exception("%s job %s failed after %d attempts", self.name, job_id, job.attempts)
+            else:
+                job.status = SUCCEEDED
+                job.error = None
+                job.finishedAt = datetime.now(timezone.utc)
+
+    # -------------------------------------------------------------------------
+    # Snapshot of queue depth and job counts by status.
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        counts = {PENDING: 0, RUNNING: 0, SUCCEEDED: 0, FAILED: 0}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {
+            "queueDepth": self._queue.qsize() if self._queue is not None else 0,
+            "concurrency": self.concurrency,
+            **{status.lower(): count for status, count in counts.items()}
+        }
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Awaitable, Callable, List, Optional, Tuple
+from app.shared.database import db
+
+logger = logging.getLogger(__name__)
+
+# Set to false on workers (or whole deployments) that must never run the
+# once-per-deployment background jobs.
+RUN_BACKGROUND_JOBS = os.getenv("RUN_BACKGROUND_JOBS", "true").lower() not in ("0", "false", "no")
+# A leader that stops renewing (crashed, cut off) is replaced after this long.
+LEADER_LEASE_SECONDS = float(os.getenv("LEADER_LEASE_SECONDS", "30"))
+
+# Take the lease if it is free, expired or already ours; 0 rows otherwise.
+CLAIM_LEASE_SQL = """
+INSERT INTO "LeaderLease" (name, holder, "expiresAt")
+VALUES ($1, $2, now() + $3::float8 * interval '1 second')
+ON CONFLICT (name) DO UPDATE
+SET holder = EXCLUDED.holder, "expiresAt" = EXCLUDED."expiresAt"
+WHERE "LeaderLease".holder = EXCLUDED.holder OR "LeaderLease"."expiresAt" < now()
+"""
+
+RELEASE_LEASE_SQL = 'DELETE FROM "LeaderLease" WHERE name = $1 AND holder = $2'
+
+Job = Tuple[Callable[[], Awaitable], Optional[Callable[[], Awaitable]]]
+
+class LeaderElection:
+    # -------------------------------------------------------------------------
+    # Runs a set of jobs in exactly one worker process of the deployment.
+    #
+    # Workers compete for a lease row in LeaderLease; the holder renews it
+    # every third of `lease_seconds` and runs the jobs, the others retry at
+    # the same pace and take over once a lease expires. A lease rather than
+    # a session-level advisory lock, because Prisma's pooled connections
+    # give no connection to hold such a lock on. A leader that cannot renew
+    # steps down before its lease can run out, so two leaders never overlap.
+    #
+    # Each job is a (start, stop) pair of coroutine functions; `stop` may be
+    # None for one-shot jobs such as startup recovery. Jobs are started in a
+    # task of their own, so a slow `start` never delays a renewal.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, name: str, lease_seconds: float = LEADER_LEASE_SECONDS, enabled: bool = RUN_BACKGROUND_JOBS):
+        self.name = name
+        self.lease_seconds = lease_seconds
+        self.enabled = enabled
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._jobs: List[Job] = []
+        # Jobs whose `start` returned, to stop on demotion.
+        self._started: List[Job] = []
+        self._starter: Optional[asyncio.Task] = None
+        self._valid_until = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def renew_interval(self) -> float:
+        return self.lease_seconds / 3
+
+    # -------------------------------------------------------------------------
+    # Campaign for the lease. If this worker wins right away its jobs are
+    # being started in the background when this returns.
+    #
+    # Args:
+    #     jobs (List[Job]): (start, stop) pairs, started in order.
+    # -------------------------------------------------------------------------
+    async def start(self, jobs: List[Job]):
+        if self._task is not None:
+            return
+        self._jobs = list(jobs)
+        if not self.enabled:
+            logger.info("Background jobs disabled in this worker (RUN_BACKGROUND_JOBS)")
+            return
+        await self._campaign()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self.is_leader:
+            await self._demote()
+            try:
+                await db.execute_raw(RELEASE_LEASE_SQL, self.name, self.holder)
+            except Exception:
+                logger.exception("Could not release leader lease %s", self.name)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            await self._campaign()
+
+    async def _campaign(self):
+        attempted = time.monotonic()
+        try:
+            held = await db.execute_raw(CLAIM_LEASE_SQL, self.name, self.holder, self.lease_seconds) > 0
+            if held:
+                self._valid_until = attempted + self.lease_seconds
+        except Exception:
+            logger.exception("Could not renew leader lease %s", self.name)
+            # Keep leading only if the lease outlives the next attempt.
+            held = self.is_leader and time.monotonic() + self.renew_interval < self._valid_until
+
+        if held and not self.is_leader:
+            await self._promote()
+        elif not held and self.is_leader:
+            await self._demote()
+
+    async def _promote(self):
+        self.is_leader = True
+        logger.info("Worker %s leads %s", self.holder, self.name)
+        self._starter = asyncio.create_task(self._start_jobs())
+
+    async def _start_jobs(self):
+        for job in self._jobs:
+            start = job[0]
+            try:
+                await start()
+            except Exception:
+                logger.exception("Background job %s failed to start", getattr(start, "__qualname__", start))
+                continue
+            self._started.append(job)
+
+    async def _demote(self):
+        self.is_leader = False
+        logger.info("Worker %s no longer leads %s", self.holder, self.name)
+        if self._starter is not None:
+            self._starter.cancel()
+            await asyncio.gather(self._starter, return_exceptions=True)
+            self._starter = None
+        started, self._started = self._started, []
+        for _, stop in reversed(started):
+            if stop is None:
+                continue
+            try:
+                await stop()
+            except Exception:
+                logger.exception("Background job %s failed to stop", getattr(stop, "__qualname__", stop))
+
+
+# Leader of the once-per-deployment jobs (startup recovery, transcript
+# compaction); started and stopped by the lifespan in app/main.py.
+background_leader = LeaderElection("background-jobs")
@@ -1,21 +1,50 @@
-from fastapi import Request
-from app.shared.utils.jwt_utils import verify_access_token
+import re
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.shared.utils.jwt_utils import verify_access_token_cached
 from app.shared.exceptions import UnauthorizedException
-from starlette.middleware.base import BaseHTTPMiddleware
-
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        if path.startswith("/docs") or path.startswith("/openapi.json") or path.startswith("/auth"):
-            return await call_next(request)
-        auth_header = request.headers.get("Authorization")
-        if not auth_header or not auth_header.startswith("Bearer "):
-            raise UnauthorizedException("Missing or invalid Authorization header")
-
-        token = auth_header.split(" ")[1]
-        
-        user_data = verify_access_token(token)
-        request.state.user = user_data
-        
-        response = await call_next(request)
-        return response
+
+PUBLIC_PATH_PREFIXES = ("/docs", "/openapi.json", "/auth", "/health")
+
+# One anchored alternation instead of a startswith() chain per request.
+PUBLIC_PATH_PATTERN = re.compile("|".join(re.escape(prefix) for prefix in PUBLIC_PATH_PREFIXES))
+
+class AuthMiddleware:
+    # -------------------------------------------------------------------------
+    # Pure ASGI authentication layer.
+    #
+    # Verifies the `Authorization: Bearer <token>` header of every non-public
+    # HTTP request and exposes the token payload as `request.state.user`.
+    # Verified payloads are cached, so repeated requests with the same token
+    # skip `jwt.decode`. WebSocket routes authenticate themselves.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or PUBLIC_PATH_PATTERN.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            token = self._get_bearer_token(scope)
+            if token is None:
+                raise UnauthorizedException("Missing or invalid Authorization header")
+            user_data = verify_access_token_cached(token)
+        except UnauthorizedException as e:
+            response = JSONResponse({"detail": e.detail}, status_code=e.status_code, headers=e.headers)
+            await response(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["user"] = user_data
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _get_bearer_token(scope: Scope):
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                if value.startswith(b"Bearer "):
+                    return value[7:].decode("latin-1")
+                return None
+        return None
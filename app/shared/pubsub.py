@@ -0,0 +1,102 @@
+import asyncio
+import json
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Set
+
+class Subscription:
+    # -------------------------------------------------------------------------
+    # A single subscriber's bounded mailbox.
+    #
+    # When the subscriber falls `max_queue` messages behind, the oldest
+    # messages are dropped and the next read yields one `gap` notice carrying
+    # the number of messages lost, so the client can resync instead of the
+    # publisher blocking or memory growing.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, topic: str, max_queue: int):
+        self.topic = topic
+        self.max_queue = max_queue
+        self.dropped = 0
+        self._queue: Deque[str] = deque()
+        self._gap = 0
+        self._ready = asyncio.Event()
+
+    def push(self, message: str):
+        if len(self._queue) >= self.max_queue:
+            self._queue.popleft()
+            self.dropped += 1
+            self._gap += 1
+        self._queue.append(message)
+        self._ready.set()
+
+    # -------------------------------------------------------------------------
+    # Wait for the next message (already JSON-encoded).
+    # -------------------------------------------------------------------------
+    async def get(self) -> str:
+        while not self._queue:
+            self._ready.clear()
+            await self._ready.wait()
+        if self._gap:
+            gap, self._gap = self._gap, 0
+            return json.dumps({"type": "gap", "dropped": gap})
+        return self._queue.popleft()
+
+class PubSubHub:
+    # -------------------------------------------------------------------------
+    # In-process topic fan-out.
+    #
+    # `publish` is synchronous and never waits on subscribers: a message is
+    # encoded once by the caller and appended to every subscriber's mailbox.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, max_queue: int = 256):
+        self.max_queue = max_queue
+        self._topics: Dict[str, Set[Subscription]] = {}
+        self._published = 0
+
+    # -------------------------------------------------------------------------
+    # Deliver a message to every subscriber of a topic.
+    #
+    # Args:
+    #     topic (str): The topic (e.g. a session id).
+    #     message (str): The JSON-encoded message.
+    #
+    # Returns:
+    #     int: The number of subscribers the message was delivered to.
+    # -------------------------------------------------------------------------
+    def publish(self, topic: str, message: str) -> int:
+        subscribers = self._topics.get(topic)
+        if not subscribers:
+            return 0
+        for subscription in subscribers:
+            subscription.push(message)
+        self._published += 1
+        return len(subscribers)
+
+    # -------------------------------------------------------------------------
+    # Subscribe to a topic for the duration of the `async with` block.
+    # -------------------------------------------------------------------------
+    @asynccontextmanager
+    async def subscribe(self, topic: str):
+        subscription = Subscription(topic, self.max_queue)
+        self._topics.setdefault(topic, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._topics.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._topics[topic]
+
+    def subscriber_count(self, topic: str) -> int:
+        return len(self._topics.get(topic, ()))
+
+    def stats(self) -> dict:
+        return {
+            "topics": len(self._topics),
+            "subscribers": sum(len(s) for s in self._topics.values()),
+            "published": self._published,
+            "dropped": sum(sub.dropped for subs in self._topics.values() for sub in subs)
+        }
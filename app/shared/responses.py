@@ -0,0 +1,20 @@
+from typing import Any
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+class FastJSONResponse(JSONResponse):
+    # -------------------------------------------------------------------------
+    # JSON response that serializes already-validated data straight to bytes.
+    #
+    # Services return response models that were validated once with
+    # `model_validate`. Returning them wrapped in this response skips
+    # FastAPI's second `response_model` validation and `jsonable_encoder`
+    # pass; pydantic-core encodes models, lists, dicts and datetimes natively.
+    #
+    # Only pass response schemas (never raw Prisma objects): everything given
+    # is serialized as-is. `response_model` on the route still documents the
+    # shape in OpenAPI.
+    # -------------------------------------------------------------------------
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,52 @@
+import logging
+import os
+import signal
+import threading
+
+logger = logging.getLogger(__name__)
+
+# After SIGTERM the worker keeps serving, but reports not ready, for this
+# long, so load balancers stop routing to it before it stops accepting.
+SHUTDOWN_DRAIN_SECONDS = float(os.getenv("SHUTDOWN_DRAIN_SECONDS", "5"))
+
+class ShutdownDrain:
+    # -------------------------------------------------------------------------
+    # Delays the server's own SIGTERM handling by a drain period.
+    #
+    # `install` (called from the lifespan, once the server has set up its
+    # signal handlers) wraps the current SIGTERM handler: the first signal
+    # only sets `draining`, which fails the readiness probe, and hands the
+    # signal on after `delay` seconds; the server then stops accepting and
+    # waits for in-flight requests. A second SIGTERM is handed on at once.
+    # Works the same under any server or worker count, as it only wraps
+    # whatever handler is installed.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, delay: float = SHUTDOWN_DRAIN_SECONDS):
+        self.delay = delay
+        self.draining = False
+        self._previous = None
+
+    def install(self):
+        # Signal handlers can only be set from the main thread.
+        if self.delay <= 0 or threading.current_thread() is not threading.main_thread():
+            return
+        previous = signal.getsignal(signal.SIGTERM)
+        if not callable(previous) or previous == self._on_sigterm:
+            return
+        self._previous = previous
+        signal.signal(signal.SIGTERM, self._on_sigterm)
+
+    def _on_sigterm(self, sig, frame):
+        if self.draining:
+            self._previous(sig, frame)
+            return
+        self.draining = True
+        logger.info("SIGTERM received; draining for %ss before shutdown", self.delay)
+        timer = threading.Timer(self.delay, self._previous, (sig, None))
+        timer.daemon = True
+        timer.start()
+
+
+# Process-wide drain state; installed by the lifespan in app/main.py.
+shutdown_drain = ShutdownDrain()
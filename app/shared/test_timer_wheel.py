@@ -0,0 +1,81 @@
+import random
+from app.shared.timer_wheel import TimerWheel
+
+def test_fires_at_the_deadline_rounded_up_to_a_tick():
+    wheel = TimerWheel(now=100, tick=1.0)
+    wheel.schedule("a", 103.2)
+    assert wheel.deadline("a") == 104
+    assert wheel.advance(103.9) == []
+    assert wheel.advance(104) == ["a"]
+    assert "a" not in wheel and len(wheel) == 0
+
+def test_cascades_through_every_level():
+    # 4 slots x 3 levels: spans of 1, 4 and 16 ticks, 64 ticks in range.
+    wheel = TimerWheel(now=0, slots=4, levels=3)
+    expiries = {"l0": 3, "l1": 9, "l2": 37, "l2-edge": 63}
+    for key, expiry in expiries.items():
+        wheel.schedule(key, expiry)
+    fired = {}
+    for now in range(1, 70):
+        for key in wheel.advance(now):
+            fired[key] = now
+    assert fired == expiries
+
+def test_large_advance_fires_everything_due():
+    wheel = TimerWheel(now=0, slots=4, levels=3)
+    for expiry in range(1, 60):
+        wheel.schedule(expiry, expiry)
+    assert sorted(wheel.advance(30)) == list(range(1, 31))
+    assert sorted(wheel.advance(59)) == list(range(31, 60))
+
+def test_deadline_beyond_the_range_is_parked_until_due():
+    wheel = TimerWheel(now=0, slots=4, levels=3)
+    wheel.schedule("far", 1000)
+    for now in range(1, 1000):
+        assert wheel.advance(now) == [], now
+    assert wheel.advance(1000) == ["far"]
+
+def test_deadline_in_the_past_fires_on_next_advance():
+    wheel = TimerWheel(now=50)
+    wheel.schedule("late", 10)
+    assert wheel.advance(50) == ["late"]
+
+def test_cancel_and_reschedule():
+    wheel = TimerWheel(now=0, slots=4, levels=3)
+    wheel.schedule("a", 20)
+    wheel.schedule("b", 20)
+    assert wheel.cancel("a") is True
+    assert wheel.cancel("a") is False
+    assert wheel.deadline("a") is None
+
+    wheel.schedule("b", 5)
+    wheel.schedule("c", 8)
+    wheel.schedule("c", 40)
+    assert len(wheel) == 2
+    assert wheel.advance(10) == ["b"]
+    assert wheel.advance(39) == []
+    assert wheel.advance(40) == ["c"]
+    assert wheel.advance(100) == []
+
+def test_matches_a_brute_force_model():
+    rng = random.Random(7)
+    wheel = TimerWheel(now=0, slots=4, levels=3)
+    expected = {}
+    current = 0
+    for _ in range(5000):
+        op = rng.random()
+        key = rng.randrange(40)
+        if op < 0.5:
+            deadline = current + rng.choice([rng.uniform(-5, 10), rng.uniform(0, 80), rng.uniform(0, 300)])
+            wheel.schedule(key, deadline)
+            expected[key] = -(-deadline // 1)
+        elif op < 0.65:
+            assert wheel.cancel(key) == (expected.pop(key, None) is not None)
+        else:
+            now = current + rng.choice([0, 1, 1, 2, rng.uniform(0, 100)])
+            current = max(current, int(now // 1))
+            due = {k for k, expiry in expected.items() if expiry <= current}
+            assert set(wheel.advance(now)) == due
+            for k in due:
+                del expected[k]
+        assert len(wheel) == len(expected)
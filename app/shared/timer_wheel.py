@@ -0,0 +1,121 @@
+import math
+from typing import Dict, Hashable, List, Optional, Set
+
+class _Timer:
+    __slots__ = ("key", "expiry", "bucket")
+
+    def __init__(self, key: Hashable, expiry: int):
+        self.key = key
+        self.expiry = expiry
+        self.bucket: Optional[Set["_Timer"]] = None
+
+class TimerWheel:
+    # -------------------------------------------------------------------------
+    # Hierarchical timing wheel (Varghese & Lauck) of keyed timers.
+    #
+    # Time is counted in ticks of `tick` seconds. Level L has `slots` buckets
+    # of slots**L ticks each, so with the defaults (1 s, 64 slots, 4 levels)
+    # the wheel spans about 194 days; later deadlines wait in the top level
+    # and are re-placed as it turns. When a level's bucket comes due its
+    # timers move down a level (or fire), so every timer is touched at most
+    # `levels` times. Scheduling, rescheduling and cancelling are O(1); at
+    # most one timer exists per key.
+    #
+    # Not thread-safe; `advance` is driven by the owner with the current time.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, now: float, tick: float = 1.0, slots: int = 64, levels: int = 4):
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self._current = math.floor(now / tick)
+        self._spans = [slots ** level for level in range(levels)]
+        self._wheels: List[List[Set[_Timer]]] = [[set() for _ in range(slots)] for _ in range(levels)]
+        # Timers already due when scheduled; fired by the next `advance`.
+        self._due: Set[_Timer] = set()
+        self._timers: Dict[Hashable, _Timer] = {}
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def _place(self, timer: _Timer):
+        if timer.expiry <= self._current:
+            bucket = self._due
+        else:
+            for level, span in enumerate(self._spans):
+                if timer.expiry // span - self._current // span < self.slots:
+                    break
+            else:
+                # Beyond the wheel's range: park in the farthest top bucket.
+                level, span = self.levels - 1, self._spans[-1]
+                bucket = self._wheels[level][(self._current // span + self.slots - 1) % self.slots]
+                bucket.add(timer)
+                timer.bucket = bucket
+                return
+            bucket = self._wheels[level][(timer.expiry // span) % self.slots]
+        bucket.add(timer)
+        timer.bucket = bucket
+
+    # -------------------------------------------------------------------------
+    # Set the timer of `key` to fire at `deadline` (Unix time), replacing any
+    # timer it already had. Deadlines round up to the next tick.
+    # -------------------------------------------------------------------------
+    def schedule(self, key: Hashable, deadline: float):
+        self.cancel(key)
+        timer = _Timer(key, math.ceil(deadline / self.tick))
+        self._timers[key] = timer
+        self._place(timer)
+
+    # -------------------------------------------------------------------------
+    # Remove the timer of `key`. Returns False if it had none.
+    # -------------------------------------------------------------------------
+    def cancel(self, key: Hashable) -> bool:
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        timer.bucket.discard(timer)
+        timer.bucket = None
+        return True
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        timer = self._timers.get(key)
+        return timer.expiry * self.tick if timer is not None else None
+
+    # -------------------------------------------------------------------------
+    # Move the wheel forward to `now` and remove the timers that expired.
+    #
+    # Returns:
+    #     List[Hashable]: Keys of the fired timers, in no particular order.
+    # -------------------------------------------------------------------------
+    def advance(self, now: float) -> List[Hashable]:
+        fired = list(self._due)
+        self._due.clear()
+        target = math.floor(now / self.tick)
+        if not self._timers:
+            self._current = max(self._current, target)
+
+        while self._current < target:
+            self._current += 1
+            # Cascade: higher-level buckets starting at this tick move down.
+            for level in range(1, self.levels):
+                span = self._spans[level]
+                if self._current % span:
+                    break
+                bucket = self._wheels[level][(self._current // span) % self.slots]
+                timers = list(bucket)
+                bucket.clear()
+                for timer in timers:
+                    self._place(timer)
+            bucket = self._wheels[0][self._current % self.slots]
+            fired.extend(bucket)
+            bucket.clear()
+            fired.extend(self._due)
+            self._due.clear()
+
+        for timer in fired:
+            del self._timers[timer.key]
+            timer.bucket = None
+        return [timer.key for timer in fired]
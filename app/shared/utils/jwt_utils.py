@@ -2,6 +2,7 @@ import jwt
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from app.shared.exceptions import UnauthorizedException
+from app.shared.utils.token_cache import VerifiedTokenCache
 import os
 
 ACCESS_TOKEN_SECRET = os.getenv("ACCESS_TOKEN_SECRET") 
@@ -9,6 +10,10 @@ REFRESH_TOKEN_SECRET = os.getenv("REFRESH_TOKEN_SECRET")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 1 day
 REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 1 week
+ACCESS_TOKEN_CACHE_SIZE = int(os.getenv("ACCESS_TOKEN_CACHE_SIZE", "10000"))
+ACCESS_TOKEN_CACHE_TTL_SECONDS = float(os.getenv("ACCESS_TOKEN_CACHE_TTL_SECONDS", "300"))
+
+access_token_cache = VerifiedTokenCache(ACCESS_TOKEN_CACHE_SIZE, ACCESS_TOKEN_CACHE_TTL_SECONDS)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -43,6 +48,15 @@ def verify_access_token(token: str):
     except Exception:
         raise UnauthorizedException("Could not validate credentials")
 
+# Same as verify_access_token, but skips jwt.decode for tokens verified recently.
+# Only successful verifications are cached.
+def verify_access_token_cached(token: str):
+    payload = access_token_cache.get(token)
+    if payload is None:
+        payload = verify_access_token(token)
+        access_token_cache.put(token, payload)
+    return payload
+
 def verify_refresh_token(token: str):
     try:
         payload = jwt.decode(token, REFRESH_TOKEN_SECRET, algorithms=[ALGORITHM])
@@ -0,0 +1,78 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+from app.shared.exceptions import ValidationException
+
+# Newest first; `id` breaks ties between rows created in the same millisecond.
+KEYSET_ORDER = [{"createdAt": "desc"}, {"id": "desc"}]
+
+# Oldest first, for exports that walk a table from the start.
+KEYSET_ORDER_ASC = [{"createdAt": "asc"}, {"id": "asc"}]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# -------------------------------------------------------------------------
+# Encode the position of a row as an opaque, URL-safe cursor.
+# -------------------------------------------------------------------------
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+# -------------------------------------------------------------------------
+# Decode a cursor produced by `encode_cursor`.
+#
+# Raises:
+#     ValidationException: If the cursor is malformed.
+# -------------------------------------------------------------------------
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (ValueError, TypeError):
+        raise ValidationException("Invalid cursor")
+
+# -------------------------------------------------------------------------
+# Prisma `where` clause selecting the rows after a cursor in KEYSET_ORDER.
+# -------------------------------------------------------------------------
+def keyset_where(cursor: str) -> dict:
+    created_at, row_id = decode_cursor(cursor)
+    return {
+        "OR": [
+            {"createdAt": {"lt": created_at}},
+            {"createdAt": created_at, "id": {"lt": row_id}}
+        ]
+    }
+
+# -------------------------------------------------------------------------
+# Prisma `where` clause selecting the rows after a position in
+# KEYSET_ORDER_ASC (or an ascending order on other time/id columns).
+# -------------------------------------------------------------------------
+def keyset_after(created_at: datetime, row_id: str, time_field: str = "createdAt", id_field: str = "id") -> dict:
+    return {
+        "OR": [
+            {time_field: {"gt": created_at}},
+            {time_field: created_at, id_field: {"gt": row_id}}
+        ]
+    }
+
+# -------------------------------------------------------------------------
+# Split a `take + 1` result into the page and the cursor of the next page.
+#
+# Args:
+#     rows (list): Rows fetched with `take + 1`, in KEYSET_ORDER.
+#     take (int): The requested page size.
+#
+# Returns:
+#     Tuple[list, Optional[str]]: The page rows and the next cursor, or None
+#     when this is the last page.
+# -------------------------------------------------------------------------
+def paginate(rows: List, take: int) -> Tuple[List, Optional[str]]:
+    if take <= 0:
+        return [], None
+    if len(rows) <= take:
+        return rows, None
+    page = rows[:take]
+    last = page[-1]
+    return page, encode_cursor(last.createdAt, last.id)
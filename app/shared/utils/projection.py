@@ -0,0 +1,98 @@
+import typing
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from pydantic import BaseModel
+from app.shared.exceptions import ValidationException
+
+# Nested `include` mapping in the format accepted by `BaseModel.model_dump`,
+# e.g. {"id": True, "category": {"name": True}}.
+FieldSet = Dict[str, Any]
+
+def _relation_model(model: Type[BaseModel], name: str) -> Optional[Type[BaseModel]]:
+    annotation = model.model_fields[name].annotation
+    if typing.get_origin(annotation) is Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+def _split(raw: Optional[str]) -> List[str]:
+    return [part.strip() for part in (raw or "").split(",") if part.strip()]
+
+# -------------------------------------------------------------------------
+# Parse a `fields=` query parameter against a response model.
+#
+# Accepts top-level field names and one level of relation fields in dotted
+# form, e.g. `fields=id,status,category.name`.
+#
+# Args:
+#     raw (Optional[str]): The comma-separated field list.
+#     model (Type[BaseModel]): The response model the fields refer to.
+#
+# Returns:
+#     Optional[FieldSet]: The field set, or None when no fields were asked for.
+#
+# Raises:
+#     ValidationException: If a field does not exist on the model.
+# -------------------------------------------------------------------------
+def parse_fieldset(raw: Optional[str], model: Type[BaseModel]) -> Optional[FieldSet]:
+    names = _split(raw)
+    if not names:
+        return None
+
+    fieldset: FieldSet = {}
+    for name in names:
+        head, _, sub = name.partition(".")
+        if head not in model.model_fields:
+            raise ValidationException(f"Unknown field: {name}")
+        if not sub:
+            fieldset[head] = True
+            continue
+
+        relation = _relation_model(model, head)
+        if relation is None or sub not in relation.model_fields:
+            raise ValidationException(f"Unknown field: {name}")
+        nested = fieldset.setdefault(head, {})
+        if nested is not True:
+            nested[sub] = True
+    return fieldset
+
+# -------------------------------------------------------------------------
+# Resolve which relations to load for a request (Prisma `include`).
+#
+# An explicit `include=` wins (`include=` with no value loads none). Else,
+# with a field set, exactly the relations it mentions are loaded. Else the
+# endpoint's default relations are loaded.
+#
+# Args:
+#     raw (Optional[str]): The comma-separated `include` parameter.
+#     fieldset (Optional[FieldSet]): The parsed `fields` parameter.
+#     relations (Iterable[str]): Relations the endpoint can load.
+#     default (Iterable[str]): Relations loaded when nothing is specified.
+#
+# Returns:
+#     dict: A Prisma `include` argument.
+#
+# Raises:
+#     ValidationException: If an unknown relation is requested.
+# -------------------------------------------------------------------------
+def resolve_include(raw: Optional[str], fieldset: Optional[FieldSet], relations: Iterable[str], default: Iterable[str]) -> dict:
+    relations = set(relations)
+    if raw is not None:
+        names = set(_split(raw))
+        unknown = names - relations
+        if unknown:
+            raise ValidationException(f"Unknown relation: {', '.join(sorted(unknown))}")
+    elif fieldset is not None:
+        names = relations.intersection(fieldset)
+    else:
+        names = set(default)
+    return {name: True for name in sorted(names)}
+
+# -------------------------------------------------------------------------
+# Reduce response models to the requested fields (dicts for FastJSONResponse).
+# -------------------------------------------------------------------------
+def project(data: Union[BaseModel, List[BaseModel]], fieldset: FieldSet) -> Union[dict, List[dict]]:
+    if isinstance(data, list):
+        return [item.model_dump(include=fieldset) for item in data]
+    return data.model_dump(include=fieldset)
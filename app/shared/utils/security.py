@@ -1,9 +1,64 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
 from passlib.context import CryptContext
+from app.shared.exceptions import ServiceUnavailableException
+from app.shared.workers import worker_share
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so threads scale across cores; "process" is there for
+# deployments that want hashing fully isolated from the interpreter.
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+# Per web worker; by default bounded by this worker's share of the CPUs.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, worker_share(os.cpu_count() or 1)))))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+
+_executor: Optional[Executor] = None
+_inflight = 0
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if PASSWORD_HASH_EXECUTOR == "process":
+            _executor = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    return _executor
+
+# -------------------------------------------------------------------------
+# Run a hashing function on the password worker pool.
+#
+# At most PASSWORD_HASH_WORKERS calls run at once and PASSWORD_HASH_MAX_QUEUE
+# more may wait; beyond that the request is rejected with 503 instead of
+# piling up behind a saturated pool.
+# -------------------------------------------------------------------------
+async def _run_in_pool(fn, *args):
+    global _inflight
+    if _inflight >= PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE:
+        raise ServiceUnavailableException("Server is busy, please retry shortly", retry_after=1)
+
+    _inflight += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), fn, *args)
+    finally:
+        _inflight -= 1
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_pool(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+def shutdown_password_pool():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
@@ -0,0 +1,48 @@
+import zlib
+from typing import AsyncIterator
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+
+# Level 6 is zlib's default: most of level 9's ratio at a fraction of the CPU.
+GZIP_LEVEL = 6
+
+# -------------------------------------------------------------------------
+# Whether the client advertised gzip in Accept-Encoding.
+# -------------------------------------------------------------------------
+def accepts_gzip(request: Request) -> bool:
+    encodings = request.headers.get("accept-encoding", "")
+    return any(part.split(";")[0].strip().lower() == "gzip" for part in encodings.split(","))
+
+# -------------------------------------------------------------------------
+# Gzip a byte stream on the fly.
+#
+# One compressor (wbits=31 writes the gzip header and trailer) is fed chunk
+# by chunk, so memory stays at the compressor's window whatever the total
+# size. Empty outputs are skipped so only real data is sent.
+#
+# Args:
+#     chunks (AsyncIterator[bytes]): The uncompressed stream.
+#     level (int): zlib compression level.
+#
+# Yields:
+#     bytes: Pieces of one gzip member.
+# -------------------------------------------------------------------------
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = GZIP_LEVEL) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+# -------------------------------------------------------------------------
+# Wrap an NDJSON byte stream in a download response, gzipped on the fly
+# when `compress` is set.
+# -------------------------------------------------------------------------
+def ndjson_response(chunks: AsyncIterator[bytes], filename: str, compress: bool) -> StreamingResponse:
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if compress:
+        chunks = gzip_stream(chunks)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(chunks, media_type="application/x-ndjson", headers=headers)
@@ -0,0 +1,64 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+class VerifiedTokenCache:
+    # -------------------------------------------------------------------------
+    # Bounded LRU cache of already-verified JWT payloads.
+    #
+    # Entries are keyed by a digest of the token (raw tokens are never kept)
+    # and expire at the token's own `exp` claim, capped by `max_ttl` seconds.
+    # -------------------------------------------------------------------------
+
+    def __init__(self, max_size: int = 10000, max_ttl: float = 300):
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    # -------------------------------------------------------------------------
+    # Return the cached payload for a token, or None if absent or expired.
+    # -------------------------------------------------------------------------
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        payload, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    # -------------------------------------------------------------------------
+    # Store a verified payload until its `exp` (or `max_ttl`, if sooner).
+    # -------------------------------------------------------------------------
+    def put(self, token: str, payload: dict):
+        expires_at = time.time() + self.max_ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        key = self._key(token)
+        self._entries[key] = (payload, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
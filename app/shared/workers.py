@@ -0,0 +1,15 @@
+import math
+import os
+
+# Worker processes serving this deployment (set by app/serve.py). Pools held
+# per process are sized from it, so N workers do not hold N times as much.
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+# -------------------------------------------------------------------------
+# This worker's share of a deployment-wide amount, rounded up so every
+# worker gets at least one. Zero (disabled) stays zero.
+# -------------------------------------------------------------------------
+def worker_share(total: int) -> int:
+    if total <= 0:
+        return total
+    return max(1, math.ceil(total / WEB_CONCURRENCY))
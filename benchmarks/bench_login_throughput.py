@@ -0,0 +1,116 @@
+# -------------------------------------------------------------------------
+# Login throughput benchmark.
+#
+# Fires a burst of concurrent logins while a "polling" coroutine ticks every
+# 10 ms, and compares:
+#   - inline:    bcrypt verify called directly on the event loop (old path)
+#   - offloaded: verify on the password pool, as AuthService.login does
+#
+# Both run the steps of AuthService.login (lookup, verify, tokens,
+# TokenSchema) against an in-memory user. AuthService itself is not
+# imported, as its repository needs a generated Prisma client and database.
+#
+# Reports logins/second and how late the polling ticks were, which is what
+# unrelated requests on the same worker experience during a login burst.
+# Logins turned away by the pool's admission control (503) are counted.
+#
+# Usage:
+#     python -m benchmarks.bench_login_throughput [--logins 60]
+# -------------------------------------------------------------------------
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("ACCESS_TOKEN_SECRET", "benchmark-access-secret-0123456789")
+os.environ.setdefault("REFRESH_TOKEN_SECRET", "benchmark-refresh-secret-0123456789")
+
+from app.features.Auths.Auth_Schema import LoginSchema, TokenSchema
+from app.shared.exceptions import ServiceUnavailableException, UnauthorizedException
+from app.shared.utils.jwt_utils import create_access_token, create_refresh_token
+from app.shared.utils.security import hash_password, verify_password, verify_password_async, shutdown_password_pool
+
+PASSWORD = "correct horse battery staple"
+
+class InMemoryAuthRepository:
+    def __init__(self):
+        self.user = SimpleNamespace(
+            id="user-1",
+            fullName="Bench User",
+            email="bench@example.com",
+            role="CANDIDATE",
+            avatarUrl=None,
+            password=hash_password(PASSWORD)
+        )
+
+    async def get_by_email(self, email: str):
+        return self.user
+
+async def _poll_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append((time.perf_counter() - started - 0.01) * 1000)
+
+async def _run(login, logins: int) -> dict:
+    stop = asyncio.Event()
+    lags: list = []
+    poller = asyncio.create_task(_poll_lag(stop, lags))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    rejected = sum(isinstance(r, ServiceUnavailableException) for r in results)
+    failed = [r for r in results if isinstance(r, Exception) and not isinstance(r, ServiceUnavailableException)]
+    if failed:
+        raise failed[0]
+
+    stop.set()
+    await poller
+    lags.sort()
+    return {
+        "logins_per_s": (logins - rejected) / elapsed,
+        "rejected": rejected,
+        "poll_lag_p50_ms": statistics.median(lags) if lags else 0.0,
+        "poll_lag_max_ms": lags[-1] if lags else 0.0
+    }
+
+def _tokens(user) -> TokenSchema:
+    return TokenSchema.model_validate({
+        "accessToken": create_access_token(data={"sub": user.id}),
+        "refreshToken": create_refresh_token(data={"sub": user.id}),
+        "user": user
+    })
+
+async def main(logins: int):
+    repo = InMemoryAuthRepository()
+    data = LoginSchema(email="bench@example.com", password=PASSWORD)
+
+    async def inline_login():
+        user = await repo.get_by_email(data.email)
+        if not verify_password(data.password, user.password):
+            raise UnauthorizedException("Incorrect email or password")
+        return _tokens(user)
+
+    async def offloaded_login():
+        user = await repo.get_by_email(data.email)
+        if not await verify_password_async(data.password, user.password):
+            raise UnauthorizedException("Incorrect email or password")
+        return _tokens(user)
+
+    for name, login in (("inline", inline_login), ("offloaded", offloaded_login)):
+        result = await _run(login, logins)
+        print(
+            f"{name:>10}: {result['logins_per_s']:8.1f} logins/s  "
+            f"poll lag p50 {result['poll_lag_p50_ms']:8.1f} ms  max {result['poll_lag_max_ms']:8.1f} ms  "
+            f"rejected {result['rejected']}"
+        )
+    shutdown_password_pool()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=60)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins))
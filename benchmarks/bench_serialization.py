@@ -0,0 +1,81 @@
+# -------------------------------------------------------------------------
+# Response serialization benchmark.
+#
+# Serializes a list endpoint payload of 100 InterviewSessionResponse rows,
+# each embedding its category (with a multi-kilobyte systemPrompt) and user,
+# and compares:
+#   - default:   what FastAPI does for `response_model` routes: validate the
+#                service result again, `jsonable_encoder`, then `json.dumps`
+#   - fast:      FastJSONResponse, which encodes the already-validated models
+#                to bytes with pydantic-core
+#
+# Usage:
+#     python -m benchmarks.bench_serialization [--rows 100] [--repeat 200]
+# -------------------------------------------------------------------------
+import argparse
+import timeit
+from datetime import datetime, timezone
+from typing import List
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from app.features.InterviewSessions.InterviewSession_Schema import InterviewSessionResponse
+from app.shared.responses import FastJSONResponse
+
+def build_sessions(rows: int) -> List[InterviewSessionResponse]:
+    now = datetime.now(timezone.utc)
+    category = {
+        "id": "category-1",
+        "name": "Backend Engineering",
+        "slug": "backend-engineering",
+        "systemPrompt": "You are a senior backend interviewer. " * 100,
+        "language": "vi-VN",
+        "createdAt": now
+    }
+    user = {
+        "id": "user-1",
+        "fullName": "Bench Candidate",
+        "email": "candidate@example.com",
+        "avatarUrl": None,
+        "role": "CANDIDATE",
+        "createdAt": now,
+        "updatedAt": now
+    }
+    return [
+        InterviewSessionResponse.model_validate({
+            "id": f"session-{i}",
+            "userId": user["id"],
+            "categoryId": category["id"],
+            "dailyRoomUrl": f"https://example.daily.co/interview-{i:08x}",
+            "status": "COMPLETED",
+            "startTime": now,
+            "endTime": now,
+            "createdAt": now,
+            "user": user,
+            "category": category
+        })
+        for i in range(rows)
+    ]
+
+def main(rows: int, repeat: int):
+    sessions = build_sessions(rows)
+    response_adapter = TypeAdapter(List[InterviewSessionResponse])
+
+    def default_path():
+        validated = response_adapter.validate_python(sessions, from_attributes=True)
+        return JSONResponse(jsonable_encoder(validated)).body
+
+    def fast_path():
+        return FastJSONResponse(sessions).body
+
+    assert len(default_path()) > 0 and len(fast_path()) > 0
+    for name, fn in (("default", default_path), ("fast", fast_path)):
+        seconds = min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat
+        print(f"{name:>8}: {seconds * 1000:8.3f} ms per response ({rows} rows)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
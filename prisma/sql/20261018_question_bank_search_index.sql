@@ -0,0 +1,13 @@
+-- Full-text search index of QuestionBank (QuestionBankRepository.search).
+--
+-- The expression must stay identical to SEARCH_VECTOR_SQL in
+-- app/features/QuestionBanks/QuestionBank_Reponsitory.py, or Postgres will
+-- not use the index. Built CONCURRENTLY so it does not block writes; run it
+-- on its own, outside a transaction, after `prisma db push`:
+--
+--   prisma db execute --schema prisma/schema.prisma --file prisma/sql/20261018_question_bank_search_index.sql
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "QuestionBank_search_idx"
+ON "QuestionBank" USING GIN (
+    (setweight(to_tsvector('simple', "questionText"), 'A') ||
+     setweight(to_tsvector('simple', "expectedAnswer"), 'B'))
+);